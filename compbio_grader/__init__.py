@@ -1,2 +1,13 @@
-from .checks2 import check_skew, check_minimumskew, check_approximatepatterncount, check_neighbors, check_frequentwordsapproximate, check_frequentwords_approx_with_rc, check_ecoli_ori
-from .checks import check_patterncount, check_frequencytable, check_maxmap, check_frequentwords, check_reversecomplement, check_patternmatching, check_genome_scan, check_ecoli_clumps_count
+from .checks2 import check_skew, check_minimumskew, check_genome_skew, check_cytosine_frequency, check_frequency_difference, check_approximatepatterncount, check_neighbors, check_frequentwordsapproximate, check_genome_frequentwordsapproximate, check_frequentwords_approx_with_rc, check_ecoli_ori, check_ori_windows, skew_plot_data
+from .checks import check_patterncount, check_frequencytable, check_genome_frequencytable, check_maxmap, check_frequentwords, check_genome_frequentwords, check_reversecomplement, check_patternmatching, check_genome_patternmatching, check_genome_scan, check_genome_multiscan, check_ecoli_clumps_count
+from .async_checks import (
+    check_patterncount_async, check_frequencytable_async, check_genome_frequencytable_async, check_maxmap_async,
+    check_frequentwords_async, check_genome_frequentwords_async,
+    check_reversecomplement_async, check_patternmatching_async, check_genome_patternmatching_async,
+    check_genome_scan_async, check_genome_multiscan_async, check_ecoli_clumps_count_async,
+    check_skew_async, check_minimumskew_async, check_genome_skew_async, check_cytosine_frequency_async,
+    check_frequency_difference_async, check_approximatepatterncount_async,
+    check_neighbors_async, check_frequentwordsapproximate_async, check_genome_frequentwordsapproximate_async,
+    check_frequentwords_approx_with_rc_async,
+    check_ecoli_ori_async, check_ori_windows_async,
+)
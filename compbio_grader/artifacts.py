@@ -0,0 +1,158 @@
+# compbio_grader/artifacts.py
+"""
+Precomputed reference artifact bundle.
+
+`compbio_grader prepare <genome files>` runs every expensive reference once
+(skew minima, clump counts, pattern positions, ori-window motifs) and writes
+a small versioned, checksummed JSON bundle.  At grading time the checks look
+their expected answers up in the bundle (a dict lookup after one cached
+load) and fall back to the hand-pasted constants when no bundle is present.
+
+The bundle is found via $COMPBIO_GRADER_ARTIFACTS, or as
+'compbio_grader_artifacts.json' in the working directory.  Each genome's
+entry records the length and SHA-256 of the sequence it was built from;
+given the current sequence, `lookup` ignores entries for a genome that has
+changed since the bundle was prepared.
+"""
+import hashlib
+import json
+import os
+import time
+import warnings
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+BUNDLE_FORMAT = "compbio_grader-artifacts"
+BUNDLE_VERSION = 1
+DEFAULT_BUNDLE = "compbio_grader_artifacts.json"
+
+DEFAULT_PATTERNS: Tuple[str, ...] = ("CTTGATCAT",)
+DEFAULT_CLUMP: Tuple[int, int, int] = (9, 500, 3)      # (k, L, t)
+DEFAULT_ORI: Tuple[int, int, int] = (500, 9, 1)        # (L, k, d)
+
+
+def genome_key(path: str) -> str:
+    """Default bundle key for an unregistered genome file: its base name without extension."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+def params_key(*params: Any) -> str:
+    return ",".join(str(p) for p in params)
+
+def _checksum(genomes: Dict[str, Any]) -> str:
+    canonical = json.dumps(genomes, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# ----------  BUILDING (offline) ----------
+def build_genome_entry(path: str, *,
+                       patterns: Iterable[str] = DEFAULT_PATTERNS,
+                       clump: Tuple[int, int, int] = DEFAULT_CLUMP,
+                       ori: Tuple[int, int, int] = DEFAULT_ORI) -> Dict[str, Any]:
+    """Compute every reference product for one genome file."""
+    from .checks import _ref_clump_kmers, _ref_pattern_matching
+    from .checks2 import _ref_frequent_with_rc
+    from .genomes import read_genome
+    from .skew import min_skew_positions, skew_array
+
+    genome = read_genome(path)
+    minima = min_skew_positions(skew_array(genome))
+    k, L, t = clump
+    ori_L, ori_k, ori_d = ori
+    start = minima[0] if minima else 0
+    window = genome[start:start + ori_L]
+    return {
+        "file": os.path.basename(path),
+        "length": len(genome),
+        "sha256": hashlib.sha256(genome.encode("ascii", "replace")).hexdigest(),
+        "min_skew": minima,
+        "clumps": {params_key(k, L, t): len(_ref_clump_kmers(genome, k, L, t))},
+        "pattern_positions": {p.upper(): _ref_pattern_matching(genome, p.upper()) for p in patterns},
+        "ori_motifs": {params_key(start, ori_L, ori_k, ori_d): _ref_frequent_with_rc(window, ori_k, ori_d)},
+    }
+
+
+def prepare(paths: Sequence[str], out: str = DEFAULT_BUNDLE, **options: Any) -> Dict[str, Any]:
+    """Build the bundle for `paths` and write it atomically to `out`."""
+    from .genomes import resolve_genome
+
+    genomes = {}
+    for path in paths:
+        t0 = time.perf_counter()
+        name = resolve_genome(path).name
+        genomes[name] = build_genome_entry(path, **options)
+        print(f"  {name}: done in {time.perf_counter() - t0:.1f}s")
+    bundle = {
+        "format": BUNDLE_FORMAT,
+        "version": BUNDLE_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "genomes": genomes,
+        "checksum": _checksum(genomes),
+    }
+    tmp = f"{out}.tmp{os.getpid()}"
+    with open(tmp, "w") as f:
+        json.dump(bundle, f, separators=(",", ":"))
+    os.replace(tmp, out)
+    load_bundle.cache_clear()
+    return bundle
+
+
+# ----------  LOADING (runtime) ----------
+def bundle_path() -> str:
+    return os.getenv("COMPBIO_GRADER_ARTIFACTS") or DEFAULT_BUNDLE
+
+@lru_cache(maxsize=4)
+def load_bundle(path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Load and verify a bundle once per process; None if it is missing or invalid."""
+    path = path or bundle_path()
+    try:
+        with open(path) as f:
+            bundle = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        warnings.warn(f"Ignoring unreadable artifact bundle '{path}': {e}")
+        return None
+    if bundle.get("format") != BUNDLE_FORMAT or bundle.get("version") != BUNDLE_VERSION:
+        warnings.warn(f"Ignoring artifact bundle '{path}': unsupported version {bundle.get('version')!r}.")
+        return None
+    if bundle.get("checksum") != _checksum(bundle.get("genomes", {})):
+        warnings.warn(f"Ignoring artifact bundle '{path}': checksum mismatch.")
+        return None
+    return bundle
+
+
+@lru_cache(maxsize=8)
+def _sequence_sha256(sequence: str) -> str:
+    return hashlib.sha256(sequence.encode("ascii", "replace")).hexdigest()
+
+def genome_matches(record: Dict[str, Any], sequence: str) -> bool:
+    """True if a bundle genome entry was built from `sequence` (length first, then SHA-256 once per process)."""
+    if "length" in record and record["length"] != len(sequence):
+        return False
+    return "sha256" not in record or record["sha256"] == _sequence_sha256(sequence)
+
+_stale_warned = set()
+
+def lookup(genome: str, product: str, key: Optional[str] = None, default: Any = None, *,
+           sequence: Optional[str] = None) -> Any:
+    """
+    Fetch a precomputed product, e.g. lookup("E_coli", "clumps", "9,500,3").
+    Returns `default` when no bundle is loaded, it lacks the entry, or (given the
+    genome's current `sequence`) the bundle was built from a different sequence.
+    """
+    bundle = load_bundle(bundle_path())
+    if bundle is None:
+        return default
+    record = bundle["genomes"].get(genome, {})
+    if sequence is not None and record and not genome_matches(record, sequence):
+        if genome not in _stale_warned:
+            _stale_warned.add(genome)
+            warnings.warn(f"Ignoring artifact bundle entries for '{genome}': the genome file has changed "
+                          f"since the bundle was prepared.")
+        return default
+    entry = record.get(product)
+    if entry is None:
+        return default
+    if key is None:
+        return entry
+    return entry.get(key, default)
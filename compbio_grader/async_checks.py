@@ -0,0 +1,129 @@
+# compbio_grader/async_checks.py
+"""
+Awaitable versions of the checks for notebooks.
+
+    passed, letter = await check_ecoli_ori_async(ans)
+    results = await asyncio.gather(check_skew_async(a), check_genome_scan_async(fn))
+
+Each check runs on a worker thread, so the notebook's event loop (widgets,
+other cells) stays responsive while reference and student code execute.
+Everything the check prints is forwarded line by line back on the event
+loop — to `progress(line)` when given, else to the caller's stdout — as the
+check produces it.  Checks with a list of hidden tests also report each test
+as it passes ("  ✓ hidden test 3/6 passed"); these lines exist only on the
+async path and are not part of the output a memoized check replays later.
+
+Printing from worker threads is routed per thread (see `capture.py`), so
+concurrent checks never interleave their output or steal each other's.
+(Checks are CPU-bound Python, so concurrency here buys responsiveness, not
+parallel speedup; use `SandboxPool` for that.)
+"""
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple, Union
+
+from . import checks, checks2
+from .capture import case_progress, thread_sink
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _default_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                           thread_name_prefix="compbio_grader")
+        return _executor
+
+
+class _LineForwarder:
+    """Collects a worker thread's writes and hands complete lines to the event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, emit: Callable[[str], None]):
+        self._loop = loop
+        self._emit = emit
+        self._partial = ""
+
+    def __call__(self, text: str) -> None:
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self._loop.call_soon_threadsafe(self._emit, line)
+
+    def close(self) -> None:
+        if self._partial:
+            self._loop.call_soon_threadsafe(self._emit, self._partial)
+            self._partial = ""
+
+
+def _run_with_sink(sink: _LineForwarder, check: Callable, args, kwargs):
+    def passed(done: int, total: int) -> None:
+        sink(f"  ✓ hidden test {done}/{total} passed\n")   # straight to the forwarder, past any memo tee
+
+    try:
+        with thread_sink(sink), case_progress(passed):
+            return check(*args, **kwargs)
+    finally:
+        sink.close()
+
+
+async def run_check_async(check: Union[str, Callable[..., Tuple[bool, Any]]], *args,
+                          progress: Optional[Callable[[str], None]] = None,
+                          executor: Optional[Executor] = None, **kwargs) -> Tuple[bool, Any]:
+    """
+    Await `check(*args, **kwargs)` on a worker thread, streaming its printed
+    lines to `progress` (or to stdout) on the calling event loop.
+    """
+    if isinstance(check, str):
+        import compbio_grader
+        check = getattr(compbio_grader, check)
+    loop = asyncio.get_running_loop()
+    emit = progress or print
+    sink = _LineForwarder(loop, emit)
+    result = await loop.run_in_executor(executor or _default_executor(),
+                                        _run_with_sink, sink, check, args, kwargs)
+    # Lines are queued with call_soon_threadsafe before the result; let them drain first.
+    await asyncio.sleep(0)
+    return result
+
+
+def _make_async(check: Callable[..., Tuple[bool, Any]]):
+    @functools.wraps(check)
+    async def wrapper(*args, progress: Optional[Callable[[str], None]] = None,
+                      executor: Optional[Executor] = None, **kwargs):
+        return await run_check_async(check, *args, progress=progress, executor=executor, **kwargs)
+    wrapper.__name__ = wrapper.__qualname__ = f"{check.__name__}_async"
+    wrapper.__doc__ = f"Awaitable {check.__name__}; see `run_check_async` for `progress` and `executor`."
+    return wrapper
+
+
+check_patterncount_async = _make_async(checks.check_patterncount)
+check_frequencytable_async = _make_async(checks.check_frequencytable)
+check_genome_frequencytable_async = _make_async(checks.check_genome_frequencytable)
+check_maxmap_async = _make_async(checks.check_maxmap)
+check_frequentwords_async = _make_async(checks.check_frequentwords)
+check_genome_frequentwords_async = _make_async(checks.check_genome_frequentwords)
+check_reversecomplement_async = _make_async(checks.check_reversecomplement)
+check_patternmatching_async = _make_async(checks.check_patternmatching)
+check_genome_patternmatching_async = _make_async(checks.check_genome_patternmatching)
+check_genome_scan_async = _make_async(checks.check_genome_scan)
+check_genome_multiscan_async = _make_async(checks.check_genome_multiscan)
+check_ecoli_clumps_count_async = _make_async(checks.check_ecoli_clumps_count)
+
+check_skew_async = _make_async(checks2.check_skew)
+check_minimumskew_async = _make_async(checks2.check_minimumskew)
+check_genome_skew_async = _make_async(checks2.check_genome_skew)
+check_cytosine_frequency_async = _make_async(checks2.check_cytosine_frequency)
+check_frequency_difference_async = _make_async(checks2.check_frequency_difference)
+check_approximatepatterncount_async = _make_async(checks2.check_approximatepatterncount)
+check_neighbors_async = _make_async(checks2.check_neighbors)
+check_frequentwordsapproximate_async = _make_async(checks2.check_frequentwordsapproximate)
+check_genome_frequentwordsapproximate_async = _make_async(checks2.check_genome_frequentwordsapproximate)
+check_frequentwords_approx_with_rc_async = _make_async(checks2.check_frequentwords_approx_with_rc)
+check_ecoli_ori_async = _make_async(checks2.check_ecoli_ori)
+check_ori_windows_async = _make_async(checks2.check_ori_windows)
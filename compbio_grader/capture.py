@@ -0,0 +1,119 @@
+# compbio_grader/capture.py
+"""
+Per-thread stdout routing.
+
+`contextlib.redirect_stdout` swaps `sys.stdout` for the whole process, which
+breaks as soon as two checks run at once (async variants, batch threads).
+Instead, while any thread has a sink, `sys.stdout` is wrapped in
+`ThreadStdout`, which hands a thread's writes to that thread's current sink,
+if it has one, and to the original stream otherwise.  The wrapper is installed
+by the first `thread_sink` block to open and removed again when the last one
+closes, so outside of checks `sys.stdout` is left as it was.  Sinks nest:
+`thread_sink` yields the previous sink so a tee can pass text on.
+
+Hidden-test loops iterate through `hidden_cases`, which reports each case that
+passed to the thread's case hook.  Only the async checks install one (with
+`case_progress`); everywhere else the loops run exactly as before.
+"""
+import contextlib
+import sys
+import threading
+from typing import Any, Callable, Iterator, Optional, Sequence, TypeVar
+
+Sink = Callable[[str], None]
+CaseHook = Callable[[int, int], None]     # (cases passed so far, total)
+T = TypeVar("T")
+
+_local = threading.local()
+_install_lock = threading.Lock()
+_proxy: Optional["ThreadStdout"] = None
+_restore: Any = None        # sys.stdout before the proxy went in
+_users = 0                  # open stdout_proxy blocks
+
+
+class ThreadStdout:
+    """sys.stdout replacement that routes each thread's writes to its own sink, if any."""
+
+    def __init__(self, default):
+        self._default = default
+
+    def write(self, text: str) -> int:
+        sink = getattr(_local, "sink", None)
+        if sink is None:
+            return self._default.write(text)
+        sink(text)
+        return len(text)
+
+    def flush(self) -> None:
+        if getattr(_local, "sink", None) is None:
+            self._default.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._default, name)
+
+
+@contextlib.contextmanager
+def stdout_proxy() -> Iterator[ThreadStdout]:
+    """
+    `sys.stdout` wrapped in a `ThreadStdout` for the duration of the block.  Blocks
+    share one wrapper; the last to exit puts the original stream back (unless
+    something else has replaced `sys.stdout` in the meantime).
+    """
+    global _proxy, _restore, _users
+    with _install_lock:
+        if _users == 0:
+            _restore = sys.stdout
+            _proxy = sys.stdout if isinstance(sys.stdout, ThreadStdout) else ThreadStdout(sys.stdout)
+            sys.stdout = _proxy
+        _users += 1
+        proxy = _proxy
+    try:
+        yield proxy
+    finally:
+        with _install_lock:
+            _users -= 1
+            if _users == 0:
+                if sys.stdout is _proxy:
+                    sys.stdout = _restore
+                _proxy = _restore = None
+
+@contextlib.contextmanager
+def thread_sink(sink: Optional[Sink]) -> Iterator[Sink]:
+    """
+    Route this thread's prints to `sink` inside the block.  Yields a callable
+    that writes to whatever received this thread's output before.
+    """
+    with stdout_proxy() as proxy:
+        prev = getattr(_local, "sink", None)
+        _local.sink = sink
+        try:
+            yield prev or proxy._default.write
+        finally:
+            _local.sink = prev
+
+
+@contextlib.contextmanager
+def case_progress(hook: Optional[CaseHook]) -> Iterator[None]:
+    """Call `hook(done, total)` from this thread's `hidden_cases` loops inside the block."""
+    prev = getattr(_local, "case_hook", None)
+    _local.case_hook = hook
+    try:
+        yield
+    finally:
+        _local.case_hook = prev
+
+def hidden_cases(cases: Sequence[T]) -> Iterator[T]:
+    """
+    Iterate over `cases`, reporting a case as passed once the loop asks for the
+    next one (a failing case returns or raises first, so it is never reported).
+    """
+    hook = getattr(_local, "case_hook", None)
+    if hook is None:
+        return iter(cases)
+    return _reported(cases, hook)
+
+def _reported(cases: Sequence[T], hook: CaseHook) -> Iterator[T]:
+    total = len(cases)
+    for done, case in enumerate(cases, 1):
+        yield case
+        hook(done, total)
@@ -1,6 +1,17 @@
 # compbio_grader/checks.py
-import os, random
-from typing import Callable, Tuple, List
+import hashlib, os, random
+from typing import Callable, Iterator, Tuple, List, Sequence
+
+from .artifacts import params_key
+from .capture import hidden_cases
+from .answers import IntAnswer, iter_int_answer
+from .compare import first_mismatch
+from .genomes import resolve_genome
+from .kmercode import MAX_K, KmerFormatError, codes_equal, encode_kmer_array, has_duplicate_codes, sort_codes
+from .memo import session_memo
+from .multipattern import PatternAutomaton, neighborhood, with_reverse_complements
+from .profiling import StudentProfiler, memory_budget, reference_peak
+from .revcomp import reverse_complement
 
 # ----------  ACRONYM SETUP ----------
 _WORD = "REPLICATOR"
@@ -27,12 +38,13 @@ _HIDDEN_TESTS = [
     ("CGCGCGCG",   "GCG", 3),
 ]
 
+@session_memo
 def check_patterncount(fn: Callable[[str, str], int]) -> Tuple[bool, str]:
     """
     Run hidden tests for PatternCount.
     Returns (passed: bool, awarded_letter: str)
     """
-    for dna, pat, ans in _HIDDEN_TESTS:
+    for dna, pat, ans in hidden_cases(_HIDDEN_TESTS):
         try:
             if fn(dna, pat) != ans:
                 print("❌ One or more hidden tests failed.")
@@ -81,28 +93,74 @@ _HIDDEN_FREQTABLE: List[Tuple[str, int]] = [
     ("ACACAGTGT", 2),           # mixed repeats
 ]
 
-def check_frequencytable(fn: Callable[[str, int], Dict[str, int]]):
+@session_memo
+def check_frequencytable(fn: Callable[[str, int], Dict[str, int]], *, memory: bool = False):
     """
     Run hidden tests for FrequencyTable.
-    Returns (passed: bool, awarded_letter: str)
+    Returns (passed: bool, awarded_letter: str); with memory=True the result's
+    .peak_memory is the largest allocation peak (bytes) of any call.
     """
+    prof = StudentProfiler(memory=memory)
     try:
-        for dna, k in _HIDDEN_FREQTABLE:
-            out = fn(dna, k)
+        for dna, k in hidden_cases(_HIDDEN_FREQTABLE):
+            out = prof.call(fn, dna, k)
             if not isinstance(out, dict):
                 print("❌ Function must return a dict.")
-                return False, ""
+                return prof.result(False, "")
             exp = _ref_frequency_table(dna, k)
             if out != exp:
                 print(f"❌ Mismatch for DNA='{dna[:12]}...' k={k}")
-                return False, ""
+                return prof.result(False, "")
     except Exception as e:
         print(f"❌ Error during checks: {e}")
-        return False, ""
+        return prof.result(False, "")
 
     # One exercise = one letter (use index 1 for exercise #2)
     letter = _SHUFFLED[1] if len(_SHUFFLED) > 1 else ""
-    return True, letter
+    return prof.result(True, letter)
+
+# Genome-scale FrequencyTable: with memory=True a submission may use at most this many
+# times the peak allocation of the reference, a plain dict of k-mer counts, on the same
+# input.  A Counter or defaultdict peaks at ~1.35x it and a Counter over a list of every
+# k-mer at ~3.7x (Vibrio cholerae, k=9); pre-building all 4^k k-mers goes far beyond at
+# larger k.
+_FREQTABLE_MEMORY_FACTOR = 6.0
+
+@session_memo
+def check_genome_frequencytable(fn: Callable[[str, int], Dict[str, int]], *,
+                                genome: str = "Vibrio_cholerae", k: int = 9, memory: bool = False):
+    """
+    Genome-scale FrequencyTable: calls fn(genome_text, k) on a registered genome and
+    compares the dict with the reference counts.  With memory=True it also fails when
+    the call's peak allocation exceeds the exercise's memory budget, derived from the
+    reference's own peak.
+    Returns (passed: bool, awarded_letter: str), the Exercise 2 letter.
+    """
+    entry = resolve_genome(genome)
+    try:
+        seq = entry.sequence()
+    except FileNotFoundError:
+        print(f"❌ Could not find '{entry.filename}' in the working directory.")
+        return False, ""
+    exp = _ref_frequency_table(seq, k)
+    prof = StudentProfiler(memory=memory)
+    if prof.track_memory:
+        prof.memory_budget = memory_budget(reference_peak(_ref_frequency_table, seq, k), _FREQTABLE_MEMORY_FACTOR)
+    try:
+        out = prof.call(fn, seq, k)
+        if not isinstance(out, dict):
+            print("❌ Function must return a dict.")
+            return prof.result(False, "")
+        if out != exp:
+            print(f"❌ Mismatch for the {k}-mer counts of {entry.label}: "
+                  f"expected {len(exp)} distinct {k}-mers, got {len(out)}.")
+            return prof.result(False, "")
+    except Exception as e:
+        print(f"❌ Error during genome-scale check: {e}")
+        return prof.result(False, "")
+
+    letter = _SHUFFLED[1] if len(_SHUFFLED) > 1 else ""
+    return prof.result(True, letter)
 
 # ----- Exercise 3: MaxMap -----
 
@@ -124,13 +182,14 @@ _HIDDEN_MAXMAP: List[Dict[str, int]] = [
     {f"K{i}": i for i in range(1000)}, # large dict
 ]
 
+@session_memo
 def check_maxmap(fn: Callable[[Dict[str, int]], int]) -> Tuple[bool, str]:
     """
     Run hidden tests for MaxMap.
     Returns (passed: bool, awarded_letter: str)
     """
     try:
-        for freq in _HIDDEN_MAXMAP:
+        for freq in hidden_cases(_HIDDEN_MAXMAP):
             result = fn(dict(freq))  # copy to avoid mutation
             expected = _ref_maxmap(freq)
             if result != expected:
@@ -169,54 +228,105 @@ _HIDDEN_FREQWORDS: List[Tuple[str, int]] = [
     ("ACGTTGCATGTCGCATGATGCATGAGAGCT", 4),  # classic case (visible used elsewhere)
 ]
 
-def check_frequentwords(fn: Callable[[str, int], List[str]]):
+@session_memo
+def check_frequentwords(fn: Callable[[str, int], List[str]], *, memory: bool = False):
     """
     Hidden tests for FrequentWords(DNA, k).
-    Returns (passed: bool, awarded_letter: str).
+    Returns (passed: bool, awarded_letter: str); with memory=True the result's
+    .peak_memory is the largest allocation peak (bytes) of any call.
     """
+    prof = StudentProfiler(memory=memory)
     try:
-        for dna, k in _HIDDEN_FREQWORDS:
-            got = fn(dna, k)
+        for dna, k in hidden_cases(_HIDDEN_FREQWORDS):
+            got = prof.call(fn, dna, k)
             if not isinstance(got, list):
                 print("❌ FrequentWords must return a list.")
-                return False, ""
-            # ensure elements are strings of length k (when k <= len(dna))
-            if k <= len(dna):
-                if any(not isinstance(x, str) or len(x) != k for x in got):
-                    print(f"❌ Output contains non-{k}-mer entries for k={k}.")
-                    return False, ""
-                # avoid duplicates
-                if len(set(got)) != len(got):
-                    print("❌ Output contains duplicate patterns.")
-                    return False, ""
-
-            exp_set: Set[str] = set(_ref_frequent_words(dna, k))
-            got_set: Set[str] = set(got)
-            if got_set != exp_set:
-                print(f"❌ Mismatch for DNA='{dna[:12]}...' k={k}\n"
-                      f"   expected: {sorted(exp_set)}\n"
-                      f"   got     : {sorted(got_set)}")
-                return False, ""
+                return prof.result(False, "")
+            if not _frequent_words_match(dna, k, got, _ref_frequent_words(dna, k)):
+                return prof.result(False, "")
     except Exception as e:
         print(f"❌ Error during hidden checks: {e}")
-        return False, ""
+        return prof.result(False, "")
 
     # One exercise = one letter (index 3 for exercise #4)
     letter = _SHUFFLED[3] if len(_SHUFFLED) > 3 else ""
-    return True, letter
+    return prof.result(True, letter)
+
+def _frequent_words_match(dna: str, k: int, got: List[str], expected: List[str]) -> bool:
+    """Compare a FrequentWords answer with the reference, printing the first problem found."""
+    # 2-bit codes: one pass validates length + alphabet, one sort finds duplicates and compares
+    if 0 < k <= min(len(dna), MAX_K):
+        try:
+            got_codes = sort_codes(encode_kmer_array(got, k))
+        except KmerFormatError as e:
+            if e.kind != "alphabet":
+                print(f"❌ Output contains non-{k}-mer entries for k={k}.")
+                return False
+            got_codes = None  # right shape, not ACGT: reported as a mismatch below
+        if got_codes is not None and has_duplicate_codes(got_codes):
+            print("❌ Output contains duplicate patterns.")
+            return False
+        if got_codes is not None and codes_equal(got_codes, encode_kmer_array(expected, k)):
+            return True
+    # ensure elements are strings of length k (when k <= len(dna))
+    if k <= len(dna):
+        if any(not isinstance(x, str) or len(x) != k for x in got):
+            print(f"❌ Output contains non-{k}-mer entries for k={k}.")
+            return False
+        # avoid duplicates
+        if len(set(got)) != len(got):
+            print("❌ Output contains duplicate patterns.")
+            return False
+
+    exp_set: Set[str] = set(expected)
+    got_set: Set[str] = set(got)
+    if got_set != exp_set:
+        print(f"❌ Mismatch for DNA='{dna[:12]}...' k={k}\n"
+              f"   expected: {sorted(exp_set)}\n"
+              f"   got     : {sorted(got_set)}")
+        return False
+    return True
+
+# Genome-scale FrequentWords: same reference table as FrequencyTable, so the same budget.
+@session_memo
+def check_genome_frequentwords(fn: Callable[[str, int], List[str]], *,
+                               genome: str = "Vibrio_cholerae", k: int = 9, memory: bool = False):
+    """
+    Genome-scale FrequentWords: calls fn(genome_text, k) on a registered genome.
+    With memory=True it also fails when the call's peak allocation exceeds the
+    exercise's memory budget, derived from the reference's own peak on the same genome.
+    Returns (passed: bool, awarded_letter: str), the Exercise 4 letter.
+    """
+    entry = resolve_genome(genome)
+    try:
+        seq = entry.sequence()
+    except FileNotFoundError:
+        print(f"❌ Could not find '{entry.filename}' in the working directory.")
+        return False, ""
+    expected = _ref_frequent_words(seq, k)
+    prof = StudentProfiler(memory=memory)
+    if prof.track_memory:
+        prof.memory_budget = memory_budget(reference_peak(_ref_frequent_words, seq, k), _FREQTABLE_MEMORY_FACTOR)
+    try:
+        got = prof.call(fn, seq, k)
+        if not isinstance(got, list):
+            print("❌ FrequentWords must return a list.")
+            return prof.result(False, "")
+        if not _frequent_words_match(seq, k, got, expected):
+            return prof.result(False, "")
+    except Exception as e:
+        print(f"❌ Error during genome-scale check: {e}")
+        return prof.result(False, "")
+
+    letter = _SHUFFLED[3] if len(_SHUFFLED) > 3 else ""
+    return prof.result(True, letter)
 
 # ----- Exercise 5: ReverseComplement -----
 from typing import Callable, Tuple, List
 
 def _ref_reverse_complement(pattern: str) -> str:
-    """Reference implementation for ReverseComplement."""
-    comp = {"A": "T", "T": "A", "G": "C", "C": "G"}
-    try:
-        rc = "".join(comp[b] for b in reversed(pattern.upper()))
-    except KeyError:
-        # invalid base — treat as unchanged
-        rc = "".join(comp.get(b, b) for b in reversed(pattern.upper()))
-    return rc
+    """Reference implementation for ReverseComplement (upper-cases; invalid bases are kept unchanged)."""
+    return reverse_complement(pattern)
 
 
 _HIDDEN_REVERSECOMP: List[str] = [
@@ -231,13 +341,14 @@ _HIDDEN_REVERSECOMP: List[str] = [
     "CCCGGGTTTAAA",      # larger sequence
 ]
 
+@session_memo
 def check_reversecomplement(fn: Callable[[str], str]) -> Tuple[bool, str]:
     """
     Run hidden tests for ReverseComplement.
     Returns (passed: bool, awarded_letter: str)
     """
     try:
-        for dna in _HIDDEN_REVERSECOMP:
+        for dna in hidden_cases(_HIDDEN_REVERSECOMP):
             result = fn(dna)
             expected = _ref_reverse_complement(dna)
             if result != expected:
@@ -259,6 +370,16 @@ def _ref_pattern_matching(DNA: str, pattern: str) -> List[int]:
     k = len(pattern)
     return [i for i in range(len(DNA) - k + 1) if DNA[i:i+k] == pattern]
 
+def _ref_pattern_stream(DNA: str, pattern: str) -> Iterator[int]:
+    """Same occurrences as _ref_pattern_matching, produced lazily with one str.find per hit."""
+    i = DNA.find(pattern)
+    while i != -1:
+        yield i
+        i = DNA.find(pattern, i + 1)
+
+def _describe_position(value, what: str) -> str:
+    return what if value is None else str(value)
+
 # Tricky but valid hidden tests
 _HIDDEN_PATTERNMATCHING: List[Tuple[str, str, List[int]]] = [
     ("GATATATGCATATACTT", "ATAT", [1, 3, 9]),     # standard
@@ -273,15 +394,25 @@ _HIDDEN_PATTERNMATCHING: List[Tuple[str, str, List[int]]] = [
     ("", "A", []),                                # empty DNA
 ]
 
+@session_memo
 def check_patternmatching(fn: Callable[[str, str], List[int]]):
     """
     Hidden tests for PatternMatching.
     Returns (passed: bool, awarded_letter: str)
     """
     try:
-        for dna, pat, expected in _HIDDEN_PATTERNMATCHING:
+        for dna, pat, expected in hidden_cases(_HIDDEN_PATTERNMATCHING):
             result = fn(dna, pat)
-            if result != expected:
+            if hasattr(result, "__next__"):
+                # generator output: compare as it is produced, stop at the first difference
+                mismatch = first_mismatch(expected, result)
+                if mismatch is not None:
+                    i, e, g = mismatch
+                    print(f"❌ Mismatch for DNA='{dna[:12]}...' pattern='{pat}':")
+                    print(f"   at occurrence #{i}: expected {_describe_position(e, 'no more positions')}, "
+                          f"got {_describe_position(g, 'end of output')}")
+                    return False, ""
+            elif result != expected:
                 print(f"❌ Mismatch for DNA='{dna[:12]}...' pattern='{pat}':")
                 print(f"   expected {expected}, got {result}")
                 return False, ""
@@ -293,6 +424,40 @@ def check_patternmatching(fn: Callable[[str, str], List[int]]):
     letter = _SHUFFLED[5] if len(_SHUFFLED) > 5 else ""
     return True, letter
 
+@session_memo
+def check_genome_patternmatching(fn: Callable[[str, str], IntAnswer], *,
+                                 genome: str = "Vibrio_cholerae", pattern: str = "CTTGATCAT"):
+    """
+    Genome-scale PatternMatching: calls fn(genome_text, pattern) on a registered genome.
+    The output (list, generator, array or space-separated string) is compared position by
+    position against the reference occurrence stream and rejected at the first divergence,
+    so neither side is ever held in full.
+    Returns (passed: bool, awarded_letter: str), the Exercise 6 letter.
+    """
+    entry = resolve_genome(genome)
+    try:
+        seq = entry.sequence()
+    except FileNotFoundError:
+        print(f"❌ Could not find '{entry.filename}' in the working directory.")
+        return False, ""
+    try:
+        out = fn(seq, pattern)
+        if isinstance(out, (bytes, dict)) or not hasattr(out, "__iter__"):
+            raise TypeError("Output must be a list of ints or a space-separated string of ints.")
+        mismatch = first_mismatch(_ref_pattern_stream(seq, pattern), iter_int_answer(out))
+    except Exception as e:
+        print(f"❌ Error during genome-scale check: {e}")
+        return False, ""
+    if mismatch is not None:
+        i, e, g = mismatch
+        print(f"❌ Mismatch scanning {entry.label} for '{pattern}':")
+        print(f"   at occurrence #{i}: expected {_describe_position(e, 'no more positions')}, "
+              f"got {_describe_position(g, 'end of output')}")
+        return False, ""
+
+    letter = _SHUFFLED[5] if len(_SHUFFLED) > 5 else ""
+    return True, letter
+
 # ----- Exercise 7: Genome-scale scan (fixed expected answer, two-letter award) -----
 from typing import Callable, List, Union
 
@@ -314,24 +479,51 @@ except NameError:
 # The one correct list of start positions (0-based) for CTTGATCAT in Vibrio cholerae:
 _EX7_CORRECT_POSITIONS: List[int] = [60039, 98409, 129189, 152283, 152354, 152411, 163207, 197028, 200160, 357976, 376771, 392723, 532935, 600085, 622755, 1065555]
 
-def _ex7_normalize_positions(out: Union[str, List[int]]) -> List[int]:
+def _ex7_position_stream(out: IntAnswer) -> Iterator[int]:
     """
-    Accept either a list[int] or a space-separated string of ints.
-    Return sorted unique positions (strictly increasing).
+    Accept a list/tuple/array/iterator of ints or a space-separated string of ints.
+    Return the positions lazily, in submission order.
     """
-    if isinstance(out, list):
-        pos = list(out)
-    elif isinstance(out, str):
-        s = out.strip()
-        pos = [] if not s else [int(x) for x in s.split()]
-    else:
+    if isinstance(out, (bytes, dict)) or not hasattr(out, "__iter__"):
         raise TypeError("Output must be a list of ints or a space-separated string of ints.")
-    pos = sorted(set(int(x) for x in pos))
-    return pos
+    return iter_int_answer(out)
 
-def check_genome_scan(fn: Callable[..., Union[str, List[int]]]):
+def _ex7_expected_positions(genome: str, pattern: str) -> List[int]:
+    """Bundle → hand-set V. cholerae constant → computed once per node from the genome."""
+    entry = resolve_genome(genome)
+    pattern = pattern.upper()
+    known = _EX7_CORRECT_POSITIONS if (entry.name, pattern) == ("Vibrio_cholerae", "CTTGATCAT") else None
+    return entry.reference("pattern_positions", pattern, known,
+                           lambda seq: _ref_pattern_matching(seq, pattern))
+
+def _ex7_positions_match(out: IntAnswer, ref: List[int], what: str) -> bool:
+    """
+    Order and duplicates don't matter.  Walk the submission once against the
+    reference set: the first wrong value fails immediately, and memory stays
+    bounded by the reference, not by what was submitted.
     """
-    Hidden check for Exercise 7 (V. cholerae genome scan).
+    expected = set(ref)
+    found = set()
+    for n, pos in enumerate(_ex7_position_stream(out)):
+        if pos not in expected:
+            print("❌ Your submitted positions don’t match the expected answer.")
+            print(f"   Submitted value #{n} ({pos}) is not a start position of {what}.")
+            return False
+        found.add(pos)
+    if len(found) != len(expected):
+        print("❌ Your submitted positions don’t match the expected answer.")
+        # Helpful diagnostics without leaking the reference list fully
+        print(f"   You submitted {len(found)} distinct positions; expected {len(expected)}.")
+        i, b = next((i, b) for i, b in enumerate(sorted(expected)) if b not in found)
+        print(f"   First missing position at index {i}: expected {b}")
+        return False
+    return True
+
+@session_memo
+def check_genome_scan(fn: Callable[..., Union[str, List[int]]], *,
+                      genome: str = "Vibrio_cholerae", pattern: str = "CTTGATCAT"):
+    """
+    Hidden check for Exercise 7 (V. cholerae genome scan; any registered `genome`/`pattern`).
     Expects a callable that returns the student's submitted positions (list[int] or space-separated string).
     The callable may ignore its arguments (we pass dummy args).
 
@@ -342,19 +534,8 @@ def check_genome_scan(fn: Callable[..., Union[str, List[int]]]):
     try:
         # Call with harmless dummy inputs; student wrapper will ignore them and return 'ans'
         out = fn("", "")
-        got = _ex7_normalize_positions(out)
-        ref = list(_EX7_CORRECT_POSITIONS)
-
-        if got != ref:
-            print("❌ Your submitted positions don’t match the expected answer.")
-            # Helpful diagnostics without leaking the reference list fully
-            print(f"   You submitted {len(got)} positions; expected {len(ref)}.")
-            # Show first mismatch if lengths equal
-            if len(got) == len(ref):
-                for i, (a, b) in enumerate(zip(got, ref)):
-                    if a != b:
-                        print(f"   First mismatch at index {i}: got {a}, expected {b}")
-                        break
+        ref = _ex7_expected_positions(genome, pattern)
+        if not _ex7_positions_match(out, ref, pattern):
             return False, []
     except Exception as e:
         print(f"❌ Error during submission check: {e}")
@@ -366,6 +547,60 @@ def check_genome_scan(fn: Callable[..., Union[str, List[int]]]):
     letters = [l for l in (l1, l2) if l]
     return True, letters
 
+# ----- Exercise 7 variant: a set of patterns, one scan -----
+def _multiscan_patterns(patterns: Sequence[str], reverse_complements: bool, d: int) -> List[str]:
+    """The requested patterns, each widened to its d-neighborhood and/or paired with its reverse complement."""
+    out = [p.upper() for p in patterns]
+    if d > 0:
+        out = [n for p in out for n in neighborhood(p, d)]
+    if reverse_complements:
+        out = with_reverse_complements(out)
+    return list(dict.fromkeys(out))
+
+def _multiscan_expected_positions(genome: str, patterns: List[str]) -> List[int]:
+    """Sorted distinct starts of any pattern, from one automaton pass; computed once per node."""
+    digest = hashlib.sha256(" ".join(sorted(patterns)).encode("ascii")).hexdigest()[:16]
+    return resolve_genome(genome).reference("multi_pattern_positions", params_key(len(patterns), digest), None,
+                                            lambda seq: PatternAutomaton(patterns).positions(seq))
+
+@session_memo
+def check_genome_multiscan(fn: Callable[[str, List[str]], Union[str, List[int]]], *,
+                           genome: str = "Vibrio_cholerae", patterns: Sequence[str] = ("ATGATCAAG",),
+                           reverse_complements: bool = True, d: int = 0):
+    """
+    Exercise 7 with a set of patterns: fn(genome_text, patterns) must return every start
+    position (list[int] or space-separated string) where at least one of the patterns occurs.
+    The set is `patterns`, each widened to all strings within Hamming distance `d` and, with
+    `reverse_complements`, joined by the reverse complements.  The reference finds all of them
+    in one Aho–Corasick pass (see `multipattern.py`).  A callable that ignores its arguments
+    and returns a fixed answer works too.
+
+    Returns (passed: bool, letters: List[str]), the two Exercise 7 letters.
+    """
+    entry = resolve_genome(genome)
+    try:
+        pattern_set = _multiscan_patterns(patterns, reverse_complements, d)
+        seq = entry.sequence()
+        ref = _multiscan_expected_positions(genome, pattern_set)
+    except FileNotFoundError:
+        print(f"❌ Could not find '{entry.filename}' in the working directory.")
+        return False, []
+    except Exception as e:
+        print(f"❌ Error during submission check: {e}")
+        return False, []
+    what = pattern_set[0] if len(pattern_set) == 1 else f"any of the {len(pattern_set)} patterns"
+    try:
+        out = fn(seq, list(pattern_set))
+        if not _ex7_positions_match(out, ref, what):
+            return False, []
+    except Exception as e:
+        print(f"❌ Error during submission check: {e}")
+        return False, []
+
+    letters = [l for l in (_SHUFFLED[6] if len(_SHUFFLED) > 6 else "",
+                           _SHUFFLED[7] if len(_SHUFFLED) > 7 else "") if l]
+    return True, letters
+
 # ----- Final scaled exercise: E. coli (9-mers forming (500,3)-clumps) -----
 from typing import Callable, Union, List, Set, Dict
 
@@ -386,9 +621,38 @@ def _ex9_parse_count(ans: Union[int, str]) -> int:
         return int(s)
     raise TypeError("Answer must be an int or a string containing an int.")
 
-def check_ecoli_clumps_count(fn: Callable[[], Union[int, str]]):
+def _ref_clump_kmers(genome: str, k: int, L: int, t: int) -> Set[str]:
+    """Reference: distinct k-mers occurring >= t times in some window of length L (one sliding pass)."""
+    found: Set[str] = set()
+    if k <= 0 or L < k or len(genome) < L:
+        return found
+    counts: Dict[str, int] = {}
+    for i in range(L - k + 1):
+        p = genome[i:i+k]
+        counts[p] = counts.get(p, 0) + 1
+    found.update(p for p, c in counts.items() if c >= t)
+    for i in range(1, len(genome) - L + 1):
+        counts[genome[i-1:i-1+k]] -= 1
+        p = genome[i+L-k:i+L]
+        c = counts.get(p, 0) + 1
+        counts[p] = c
+        if c >= t:
+            found.add(p)
+    return found
+
+def _ex9_expected_count(genome: str, k: int, L: int, t: int) -> int:
+    """Bundle → hand-set E. coli constant → computed once per node from the genome."""
+    entry = resolve_genome(genome)
+    known = _EX9_CORRECT_COUNT if (entry.name, k, L, t) == ("E_coli", 9, 500, 3) else None
+    return entry.reference("clumps", params_key(k, L, t), known,
+                           lambda seq: len(_ref_clump_kmers(seq, k, L, t)))
+
+@session_memo
+def check_ecoli_clumps_count(fn: Callable[[], Union[int, str]], *, genome: str = "E_coli",
+                             k: int = 9, L: int = 500, t: int = 3):
     """
-    Hidden check for: number of distinct 9-mers forming (500,3)-clumps in E. coli.
+    Hidden check for: number of distinct 9-mers forming (500,3)-clumps in E. coli
+    (or distinct k-mers forming (L,t)-clumps in any registered `genome`).
     The callable `fn` should return the student’s submitted answer (int or str).
 
     Returns:
@@ -396,7 +660,12 @@ def check_ecoli_clumps_count(fn: Callable[[], Union[int, str]]):
     On success, awards TWO letters (indices 8 and 9 of the shuffled acronym).
     """
     # sanity guard: make sure the host filled the constant
-    if not isinstance(_EX9_CORRECT_COUNT, int) or _EX9_CORRECT_COUNT < 0:
+    try:
+        expected = _ex9_expected_count(genome, k, L, t)
+    except FileNotFoundError:
+        print(f"❌ Could not find '{resolve_genome(genome).filename}' in the working directory.")
+        return False, []
+    if not isinstance(expected, int) or expected < 0:
         print("❌ Grader not initialized: _EX9_CORRECT_COUNT is not set.")
         return False, []
 
@@ -407,8 +676,8 @@ def check_ecoli_clumps_count(fn: Callable[[], Union[int, str]]):
         print(f"❌ Could not read your answer as an integer: {e}")
         return False, []
 
-    if got != _EX9_CORRECT_COUNT:
-        print("❌ Not quite. Your number of (500,3)-clump 9-mers does not match.")
+    if got != expected:
+        print(f"❌ Not quite. Your number of ({L},{t})-clump {k}-mers does not match.")
         return False, []
 
     # Success → award two letters (final bonus)
@@ -1,8 +1,22 @@
 
-from typing import Iterable, List, Tuple, Union, Callable
+from itertools import zip_longest
+from typing import Any, Iterable, Iterator, List, Optional, Set, Tuple, Union, Callable
 import os
 import random
 
+from .artifacts import params_key
+from .capture import hidden_cases
+from .answers import IntAnswer, as_int_array, int_arrays_equal
+from .compare import diff_sets, first_mismatch, preview, print_diff
+from .composition import genome_composition
+from .genomes import resolve_genome
+from .kmercode import kmer_multisets_equal
+from .memo import session_memo
+from .ori import sliding_frequent_with_rc
+from .profiling import StudentProfiler, memory_budget, reference_peak
+from .revcomp import reverse_complement, reverse_complement_many
+from .skew import compare_skew, decimate_skew, min_skew_positions, reference_skew, skew_array, skew_plot_series
+
 # ----------  ACRONYM / LETTER AWARDING ----------
 _WORD = "PROTEIN"
 
@@ -39,31 +53,32 @@ def _ref_skew_values(genome: str) -> List[int]:
         vals.append(skew)
     return vals
 
-_EXPECTED = _ref_skew_values(_EXERCISE_GENOME)
-
-# ----------  HELPER ----------
-def _as_int_list(maybe_vals: Union[str, Iterable[int], List[int]]) -> List[int]:
+def skew_plot_data(genome: str = "E_coli", width: int = 1000, method: str = "minmax", *,
+                   sequence: Optional[str] = None) -> Tuple[List[int], List[int]]:
     """
-    Accept either:
-      - a list/iterable of ints, or
-      - a space-separated string of ints
-    Returns list[int].
+    (positions, skew values) for drawing a genome's skew diagram `width` pixels wide,
+    e.g. plt.plot(*skew_plot_data("E_coli")).  `genome` is a registered name or a genome
+    file; pass the DNA text itself as `sequence=` instead.  See `skew.decimate_skew` for
+    the methods.
     """
-    if isinstance(maybe_vals, str):
-        parts = maybe_vals.strip().split()
-        return [int(x) for x in parts]
-    return [int(x) for x in maybe_vals]
+    if sequence is not None:
+        series = decimate_skew(skew_array(sequence.upper()), width, method)
+    else:
+        series = skew_plot_series(genome, width, method)
+    return series.positions, series.values
+
+_EXPECTED = _ref_skew_values(_EXERCISE_GENOME)
 
 # ----------  MAIN CHECK FUNCTION ----------
-def check_skew(ans: Union[str, Iterable[int], List[int]], *, award_letter: bool = True) -> Tuple[bool, str]:
+def check_skew(ans: IntAnswer, *, award_letter: bool = True) -> Tuple[bool, str]:
     """
     Compare submitted `ans` to the true skew values for 'GAGCCACCGCGATA'.
-    `ans` may be a list of ints or a space-separated string of ints.
+    `ans` may be a list/tuple/array/generator of ints or a space-separated string of ints.
 
     Returns (passed: bool, awarded_letter: str).
     """
     try:
-        got = _as_int_list(ans)
+        got = as_int_array(ans)
     except Exception as e:
         print(f"❌ Could not parse your answer: {e}")
         return False, ""
@@ -72,7 +87,7 @@ def check_skew(ans: Union[str, Iterable[int], List[int]], *, award_letter: bool
         print(f"❌ Wrong number of values. Expected {len(_EXPECTED)}, got {len(got)}.")
         return False, ""
 
-    if got != _EXPECTED:
+    if not int_arrays_equal(got, _EXPECTED):
         print("❌ Incorrect. Your skew values do not match the expected result.")
         return False, ""
 
@@ -89,15 +104,23 @@ def check_skew(ans: Union[str, Iterable[int], List[int]], *, award_letter: bool
 
 _EXPECTED_ECOLI_MIN_SKEW = [3923620, 3923621, 3923622, 3923623]
 
-def check_minimumskew(ans: Union[str, Iterable[int], List[int]], *, award_letter: bool = True) -> Tuple[bool, str]:
+def _expected_min_skew(genome: str) -> List[int]:
+    """Bundle → hand-set E. coli constant → computed once per node from the genome's skew array."""
+    entry = resolve_genome(genome)
+    known = _EXPECTED_ECOLI_MIN_SKEW if entry.name == "E_coli" else None
+    return entry.reference("min_skew", known=known, compute=lambda seq: min_skew_positions(entry.skew()))
+
+def check_minimumskew(ans: IntAnswer, *, genome: str = "E_coli", award_letter: bool = True) -> Tuple[bool, str]:
     """
     Check whether the submitted `ans` matches the known minimum-skew
-    positions for the E. coli genome.
+    positions for the E. coli genome (or any registered `genome`).
 
     Parameters
     ----------
-    ans : list[int] | str
-        Student answer — can be a list of ints or a space-separated string of ints.
+    ans : list[int] | str | array-like
+        Student answer — can be a list/tuple/array of ints or a space-separated string of ints.
+    genome : str
+        Registered genome name/alias (see genomes.py) or path to a genome file.
     award_letter : bool
         Whether to return a session letter.
 
@@ -106,20 +129,142 @@ def check_minimumskew(ans: Union[str, Iterable[int], List[int]], *, award_letter
     (passed: bool, letter: str)
     """
     try:
-        got = _as_int_list(ans)
+        got = as_int_array(ans)
     except Exception as e:
         print(f"❌ Could not parse your answer: {e}")
         return False, ""
 
-    if got != _EXPECTED_ECOLI_MIN_SKEW:
-        print("❌ Incorrect. Your positions do not match the expected E. coli minimum-skew indices.")
-        print(f"Expected: {_EXPECTED_ECOLI_MIN_SKEW}")
-        print(f"Got:      {got}")
+    label = resolve_genome(genome).label
+    try:
+        expected = _expected_min_skew(genome)
+    except FileNotFoundError:
+        print(f"❌ Could not find '{resolve_genome(genome).filename}' in the working directory.")
+        return False, ""
+    if not int_arrays_equal(got, expected):
+        print(f"❌ Incorrect. Your positions do not match the expected {label} minimum-skew indices.")
+        print(f"Expected: {preview(expected)}  ({len(expected)} values)")
+        print(f"Got:      {preview(got)}  ({len(got)} values)")
+        idx, exp_val, got_val = first_mismatch(expected, got)
+        print(f"First mismatch at index {idx}: expected {'nothing' if exp_val is None else exp_val}, "
+              f"got {'nothing' if got_val is None else got_val}")
         return False, ""
 
-    print("✅ Correct! Your positions match the E. coli minimum-skew indices.")
+    print(f"✅ Correct! Your positions match the {label} minimum-skew indices.")
     return (True, letter_for_exercise(1)) if award_letter else (True, "")
 
+# ==============================
+# EXERCISE 1b — Full-genome Skew (E. coli)
+# ==============================
+
+def check_genome_skew(ans: Any, *, genome: str = "E_coli", award_letter: bool = True) -> Tuple[bool, str]:
+    """
+    Check the skew array of a whole genome (default: E. coli; any registered name or genome file).
+
+    `ans` may be the full array (list/NumPy/array.array, with or without the leading 0),
+    or a compressed form:
+      - {"rle": [(value, run_length), ...]}       run-length encoding
+      - {"step": s, "values": [...], "offset": o} every s-th value starting at Skew_o
+      - {"sha256": hexdigest} or the bare digest  see `skew.skew_digest`
+    The reference array is built once per genome per node and compared chunk by chunk.
+
+    Returns (passed: bool, letter: str).
+    """
+    try:
+        ref = reference_skew(genome)
+    except FileNotFoundError:
+        print(f"❌ Could not find '{resolve_genome(genome).filename}' in the working directory.")
+        return False, ""
+    except Exception as e:
+        print(f"❌ Error reading '{resolve_genome(genome).filename}': {e}")
+        return False, ""
+
+    try:
+        mismatch = compare_skew(ref, ans)
+    except Exception as e:
+        print(f"❌ Could not parse your answer: {e}")
+        return False, ""
+
+    if mismatch is not None:
+        print(f"❌ Incorrect. {mismatch.message}")
+        if mismatch.expected is not None and mismatch.got is not None:
+            print(f"   Skew_{mismatch.index}: expected {mismatch.expected}, got {mismatch.got}")
+        return False, ""
+
+    print("✅ Correct! Your genome-wide skew matches.")
+    return (True, letter_for_exercise(0)) if award_letter else (True, "")
+
+# ==============================
+# EXERCISE 1c — Windowed base composition (E. coli figures)
+# ==============================
+
+_COMPOSITION_WINDOW = 100_000
+
+def _as_float_list(ans: Any) -> List[float]:
+    """Accept a list/tuple/array of numbers OR a single space/comma-separated string."""
+    if isinstance(ans, str):
+        return [float(t) for t in ans.replace(",", " ").split()]
+    return [float(x) for x in ans]
+
+def _check_window_series(ans: Any, expected: List[float], what: str, window: int, tolerance: float) -> bool:
+    try:
+        got = _as_float_list(ans)
+    except Exception as e:
+        print(f"❌ Could not parse your answer: {e}")
+        return False
+    if len(got) != len(expected):
+        print(f"❌ Expected {len(expected)} windows of {window:,} bases (the last one may be shorter), got {len(got)}.")
+        return False
+    for i, (e, g) in enumerate(zip(expected, got)):
+        if abs(e - g) > tolerance:
+            print(f"❌ Incorrect {what} for the window starting at {i * window:,}: "
+                  f"expected {e:.3f}%, got {g:.3f}%.")
+            if 0 < abs(g) <= 1 and abs(e) > 1:
+                print("   (Hint: values should be percentages, not fractions.)")
+            return False
+    return True
+
+def check_cytosine_frequency(ans: Any, *, genome: str = "E_coli", window: int = _COMPOSITION_WINDOW,
+                             base: str = "C", tolerance: float = 0.01, award_letter: bool = False) -> Tuple[bool, str]:
+    """
+    Frequency of C (or `base`) in % for consecutive windows of `window` bases along the
+    genome, as in images/ecoli_cytosine_frequency.png.  `ans` is a list or space-separated
+    string with one value per window; values may differ from the reference by `tolerance`.
+    Returns (passed: bool, letter: str).
+
+    Ungraded by default: the seven PROTEIN letters all belong to other exercises, so the
+    letter is "" unless award_letter=True, which hands out the skew letter (exercise 0)
+    for notebooks that grade the figure in place of check_skew.
+    """
+    try:
+        expected = genome_composition(genome).window_frequencies(base, window)
+    except FileNotFoundError:
+        print(f"❌ Could not find '{resolve_genome(genome).filename}' in the working directory.")
+        return False, ""
+    if not _check_window_series(ans, expected, f"frequency of {base.upper()}", window, tolerance):
+        return False, ""
+
+    print(f"✅ Correct! Your {base.upper()} frequencies match for all {len(expected)} windows.")
+    return (True, letter_for_exercise(0)) if award_letter else (True, "")
+
+def check_frequency_difference(ans: Any, *, genome: str = "E_coli", window: int = _COMPOSITION_WINDOW,
+                               tolerance: float = 0.01, award_letter: bool = False) -> Tuple[bool, str]:
+    """
+    Frequency of G minus frequency of C in % for consecutive windows of `window` bases,
+    as in images/ecoli_frequency_difference.png.  Same answer format and (ungraded) letter
+    rule as check_cytosine_frequency.
+    Returns (passed: bool, letter: str).
+    """
+    try:
+        expected = genome_composition(genome).window_differences("G", "C", window)
+    except FileNotFoundError:
+        print(f"❌ Could not find '{resolve_genome(genome).filename}' in the working directory.")
+        return False, ""
+    if not _check_window_series(ans, expected, "G - C difference", window, tolerance):
+        return False, ""
+
+    print(f"✅ Correct! Your G - C differences match for all {len(expected)} windows.")
+    return (True, letter_for_exercise(0)) if award_letter else (True, "")
+
 # ==============================
 # EXERCISE 5 — Approximate Pattern Count
 # ==============================
@@ -134,23 +279,25 @@ _HIDDEN_TESTS_EX5 = [
     ("ACGTACGAAGGG", "ACG", 2, 5),
 ]
 
+@session_memo
 def check_approximatepatterncount(fn: Callable[[str, str, int], int], *, award_letter: bool = True):
     """
     Run hidden tests for ApproximatePatternCount.
     """
-    for text, pattern, d, expected in _HIDDEN_TESTS_EX5:
+    prof = StudentProfiler()
+    for text, pattern, d, expected in hidden_cases(_HIDDEN_TESTS_EX5):
         try:
-            result = fn(text, pattern, d)
+            result = prof.call(fn, text, pattern, d)
         except Exception as e:
             print(f"❌ Error while running your function: {e}")
-            return False, ""
+            return prof.result(False, "")
         if result != expected:
             print(f"❌ Failed on input: ({pattern}, {text}, {d})")
             print(f"Expected {expected}, got {result}")
-            return False, ""
+            return prof.result(False, "")
 
     print("✅ All hidden tests passed!")
-    return (True, letter_for_exercise(2)) if award_letter else (True, "")
+    return prof.result(True, letter_for_exercise(2) if award_letter else "")
 
 # ===== Add to compbio_grader/checks2.py — Hidden Tests for Neighbors =====
 
@@ -186,32 +333,40 @@ _HIDDEN_TESTS_EX6 = [
     ("AGTC", 3),
 ]
 
+@session_memo
 def check_neighbors(fn, *, award_letter: bool = True):
     """
     Hidden tests for Neighbors. `fn` should be the student's Neighbors function.
     Compares set equality against a trusted reference implementation.
     Returns (passed: bool, letter: str).
     """
-    for pat, d in _HIDDEN_TESTS_EX6:
+    prof = StudentProfiler()
+    for pat, d in hidden_cases(_HIDDEN_TESTS_EX6):
         try:
-            got = set(fn(pat, d))
+            got = set(prof.call(fn, pat, d))
         except Exception as e:
             print(f"❌ Error while running your function on ({pat}, {d}): {e}")
-            return False, ""
+            return prof.result(False, "")
+        if any(not isinstance(x, str) for x in got):
+            print(f"❌ Output for Pattern={pat}, d={d} contains non-string entries, "
+                  f"e.g. {next(x for x in got if not isinstance(x, str))!r}.")
+            return prof.result(False, "")
         expected = set(_ref_neighbors(pat, d))
         if got != expected:
-            # Provide a compact diff
-            missing = expected - got
-            extra = got - expected
             print(f"❌ Mismatch for Pattern={pat}, d={d}")
-            if missing:
-                print(f"  Missing {min(len(missing),5)} example(s): {', '.join(list(sorted(missing))[:5])}")
-            if extra:
-                print(f"  Extra {min(len(extra),5)} example(s): {', '.join(list(sorted(extra))[:5])}")
-            return False, ""
+            try:
+                # Provide a compact diff
+                diff = diff_sets(expected, got, limit=5)
+                if diff.missing:
+                    print(f"  Missing {len(diff.missing)} example(s): {', '.join(diff.missing)}")
+                if diff.extra:
+                    print(f"  Extra {len(diff.extra)} example(s): {', '.join(diff.extra)}")
+            except Exception as e:
+                print(f"  (could not summarize the difference: {e})")
+            return prof.result(False, "")
 
     print("✅ All hidden Neighbors tests passed!")
-    return (True, letter_for_exercise(3)) if award_letter else (True, "")
+    return prof.result(True, letter_for_exercise(3) if award_letter else "")
 
 # ===== Add to compbio_grader/checks2.py — Hidden Tests for FrequentWordsApproximate =====
 
@@ -259,27 +414,80 @@ _HIDDEN_TESTS_EX5B: List[Tuple[str, int, int, List[str]]] = [
     ("ATATATAT", 2, 1, _ref_frequent_words_approx("ATATATAT", 2, 1)),
 ]
 
-def check_frequentwordsapproximate(fn: Callable[[str, int, int], List[str]], *, award_letter: bool = True):
+@session_memo
+def check_frequentwordsapproximate(fn: Callable[[str, int, int], List[str]], *, award_letter: bool = True,
+                                   memory: bool = False):
     """
     Hidden tests for FrequentWordsApproximate.
     Compares lexicographically sorted outputs to a trusted reference.
-    Returns (passed: bool, letter: str).
+    Returns (passed: bool, letter: str); with memory=True the result's .peak_memory
+    is the largest allocation peak (bytes) of any call.
     """
-    for text, k, d, expected in _HIDDEN_TESTS_EX5B:
+    prof = StudentProfiler(memory=memory)
+    for text, k, d, expected in hidden_cases(_HIDDEN_TESTS_EX5B):
         try:
-            got = fn(text, k, d)
+            got = prof.call(fn, text, k, d)
         except Exception as e:
             print(f"❌ Error on input (k={k}, d={d}): {e}")
-            return False, ""
-        if sorted(got) != sorted(expected):
+            return prof.result(False, "")
+        if not kmer_multisets_equal(expected, got, k):
             print("❌ Mismatch.")
             print(f"Text (len {len(text)}), k={k}, d={d}")
             print(f"Expected: {' '.join(expected)}")
-            print(f"Got:      {' '.join(sorted(got))}")
-            return False, ""
+            print(f"Got:      {' '.join(sorted(map(str, got)))}")
+            return prof.result(False, "")
 
     print("✅ All hidden FrequentWordsApproximate tests passed!")
-    return (True, letter_for_exercise(4)) if award_letter else (True, "")
+    return prof.result(True, letter_for_exercise(4) if award_letter else "")
+
+# With memory=True a submission may use this many times the reference's peak (plus a
+# fixed slack).  On a 500-base window at k=9, d=1 the reference peaks at ~1.2 MB and a
+# Counter over a list of every neighbor at ~1.5 MB, against ~22 MB for a 4^k table.
+_FWA_MEMORY_FACTOR = 4.0
+
+@session_memo
+def check_genome_frequentwordsapproximate(fn: Callable[[str, int, int], List[str]], *, genome: str = "E_coli",
+                                          start: Optional[int] = None, L: int = 500, k: int = 9, d: int = 1,
+                                          award_letter: bool = True, memory: bool = False):
+    """
+    FrequentWordsApproximate on the genome window [start, start+L), by default the
+    window starting at the first minimum-skew position.  Calls fn(window, k, d); with
+    memory=True it also fails when the call's peak allocation exceeds the exercise's
+    memory budget, derived from the reference's own peak on the same window.
+    Returns (passed: bool, letter: str), the Exercise 5 letter.
+    """
+    entry = resolve_genome(genome)
+    try:
+        seq = entry.sequence()
+        if start is None:
+            start = _expected_min_skew(genome)[0]
+    except FileNotFoundError:
+        print(f"❌ Could not find '{entry.filename}' in the working directory.")
+        return False, ""
+    except Exception as e:
+        print(f"❌ Error reading '{entry.filename}': {e}")
+        return False, ""
+    if start < 0 or start + L > len(seq):
+        print("❌ Window bounds are out of range for the provided genome.")
+        return False, ""
+
+    text = seq[start:start + L]
+    expected = _ref_frequent_words_approx(text, k, d)
+    prof = StudentProfiler(memory=memory)
+    if prof.track_memory:
+        prof.memory_budget = memory_budget(reference_peak(_ref_frequent_words_approx, text, k, d), _FWA_MEMORY_FACTOR)
+    try:
+        got = prof.call(fn, text, k, d)
+    except Exception as e:
+        print(f"❌ Error on the {entry.label} window at {start} (k={k}, d={d}): {e}")
+        return prof.result(False, "")
+    if not kmer_multisets_equal(expected, got, k):
+        print(f"❌ Mismatch for the {entry.label} window [{start}, {start + L}), k={k}, d={d}.")
+        print_diff(diff_sets(set(expected), set(map(str, got)), limit=10), limit=10)
+        return prof.result(False, "")
+
+    print(f"✅ Correct! Your FrequentWordsApproximate handles the {L}-base {entry.label} window.")
+    return prof.result(True, letter_for_exercise(4) if award_letter else "")
 
 # ===== Add to compbio_grader/checks2.py — Hidden Tests for FrequentWordsApproximateWithRC =====
 
@@ -305,8 +513,7 @@ def _ref_neighbors(pattern: str, d: int):
     return neighborhood
 
 def _ref_rc(s: str) -> str:
-    comp = str.maketrans("ACGT", "TGCA")
-    return s.translate(comp)[::-1]
+    return reverse_complement(s)
 
 def _ref_frequent_words_with_rc(Text: str, k: int, d: int) -> List[str]:
     n = len(Text)
@@ -320,8 +527,8 @@ def _ref_frequent_words_with_rc(Text: str, k: int, d: int) -> List[str]:
     if not counts:
         return []
     scores: Dict[str, int] = {}
-    for p, c in counts.items():
-        scores[p] = c + counts.get(_ref_rc(p), 0)
+    for (p, c), rc in zip(counts.items(), reverse_complement_many(counts)):
+        scores[p] = c + counts.get(rc, 0)
     maxs = max(scores.values())
     return sorted({p for p, s in scores.items() if s == maxs})
 
@@ -335,27 +542,29 @@ _HIDDEN_TESTS_EX6_RC: List[Tuple[str, int, int, List[str]]] = [
     ("CTAGCTAG", 3, 2, _ref_frequent_words_with_rc("CTAGCTAG", 3, 2)),
 ]
 
+@session_memo
 def check_frequentwords_approx_with_rc(fn: Callable[[str, int, int], List[str]], *, award_letter: bool = True):
     """
     Hidden tests for FrequentWords with mismatches + reverse complements.
     Compares lexicographically sorted outputs to a trusted reference.
     Returns (passed: bool, letter: str).
     """
-    for text, k, d, expected in _HIDDEN_TESTS_EX6_RC:
+    prof = StudentProfiler()
+    for text, k, d, expected in hidden_cases(_HIDDEN_TESTS_EX6_RC):
         try:
-            got = fn(text, k, d)
+            got = prof.call(fn, text, k, d)
         except Exception as e:
             print(f"❌ Error on input (k={k}, d={d}): {e}")
-            return False, ""
-        if sorted(got) != sorted(expected):
+            return prof.result(False, "")
+        if not kmer_multisets_equal(expected, got, k):
             print("❌ Mismatch.")
             print(f"Text (len {len(text)}), k={k}, d={d}")
             print(f"Expected: {' '.join(expected)}")
-            print(f"Got:      {' '.join(sorted(got))}")
-            return False, ""
+            print(f"Got:      {' '.join(sorted(map(str, got)))}")
+            return prof.result(False, "")
 
     print("✅ All hidden FrequentWordsApproximateWithRC tests passed!")
-    return (True, letter_for_exercise(5)) if award_letter else (True, "")
+    return prof.result(True, letter_for_exercise(5) if award_letter else "")
 
 # ==============================
 # EXERCISE 7 — Hidden check for E. coli ori window (k=9, d=1)
@@ -366,7 +575,7 @@ from collections import defaultdict
 
 # Reuse your acronym utilities if present:
 # - letter_for_exercise
-# - _as_int_list (not needed here)
+# - as_int_array (not needed here)
 # We'll define local refs for this checker.
 
 def _ref_hamming(a: str, b: str) -> int:
@@ -387,8 +596,6 @@ def _ref_neighbors(pattern: str, d: int) -> Set[str]:
             neighborhood.add(pattern[0] + t)
     return neighborhood
 
-def _ref_rc(s: str) -> str:
-    return s.translate(str.maketrans("ACGT", "TGCA"))[::-1]
 
 def _ref_frequent_with_rc(Text: str, k: int, d: int) -> List[str]:
     """
@@ -405,8 +612,8 @@ def _ref_frequent_with_rc(Text: str, k: int, d: int) -> List[str]:
     if not counts:
         return []
     scores = {}
-    for p, c in counts.items():
-        scores[p] = c + counts.get(_ref_rc(p), 0)
+    for (p, c), rc in zip(counts.items(), reverse_complement_many(counts)):
+        scores[p] = c + counts.get(rc, 0)
     max_score = max(scores.values())
     return sorted({p for p, s in scores.items() if s == max_score})
 
@@ -421,40 +628,44 @@ def _as_str_set(maybe_vals: Union[str, Iterable[str], List[str]]) -> Set[str]:
         tokens = [str(t) for t in maybe_vals]
     return {t.upper() for t in tokens}
 
-def check_ecoli_ori(ans: Union[str, Iterable[str], List[str]], *, award_letter: bool = True):
+def check_ecoli_ori(ans: Union[str, Iterable[str], List[str]], *, genome: str = "E_coli",
+                    start: Optional[int] = None, award_letter: bool = True):
     """
     Hidden checker for Exercise 7.
-    - Reads E. coli genome from 'E_coli.txt' in the current working directory.
-    - Slices the window [3923620, 3923620+500).
-    - Computes the most frequent 9-mers with <=1 mismatch + reverse complements.
+    - Uses the E. coli genome ('E_coli.txt') by default, or any registered `genome`.
+    - Slices the window [start, start+500); by default start is the first minimum-skew
+      position (3923620 for E. coli).
+    - Computes the most frequent 9-mers with <=1 mismatch + reverse complements, once per
+      genome per node (or takes them from the artifact bundle when present).
     - Compares against student's `ans` (list of strings OR space-separated string).
     Returns (passed: bool, letter: str).
     """
-    # Load genome
-    try:
-        with open("E_coli.txt") as f:
-            genome = f.read().replace("\n", "").strip().upper()
-    except FileNotFoundError:
-        print("❌ Could not find 'E_coli.txt' in the working directory.")
-        return False, ""
-    except Exception as e:
-        print(f"❌ Error reading 'E_coli.txt': {e}")
-        return False, ""
-
     # Define window and parameters
-    start = 3923620  # zero-based
     L = 500
     k = 9
     d = 1
+    entry = resolve_genome(genome)
 
-    if start < 0 or start + L > len(genome):
-        print("❌ Window bounds are out of range for the provided genome.")
-        return False, ""
+    try:
+        if start is None:
+            start = _expected_min_skew(genome)[0]  # zero-based
+        key = params_key(start, L, k, d)
 
-    window = genome[start:start + L]
+        def _compute(seq: str) -> List[str]:
+            if start < 0 or start + L > len(seq):
+                raise IndexError("Window bounds are out of range for the provided genome.")
+            return _ref_frequent_with_rc(seq[start:start + L], k, d)
 
-    # Compute expected winners
-    expected = set(_ref_frequent_with_rc(window, k, d))
+        expected = set(entry.reference("ori_motifs", key, compute=_compute))
+    except FileNotFoundError:
+        print(f"❌ Could not find '{entry.filename}' in the working directory.")
+        return False, ""
+    except IndexError as e:
+        print(f"❌ {e}")
+        return False, ""
+    except Exception as e:
+        print(f"❌ Error reading '{entry.filename}': {e}")
+        return False, ""
 
     # Normalize student answer
     try:
@@ -465,18 +676,85 @@ def check_ecoli_ori(ans: Union[str, Iterable[str], List[str]], *, award_letter:
 
     # Compare sets
     if got != expected:
-        missing = expected - got
-        extra = got - expected
         print("❌ Incorrect ori-window motifs.")
-        if missing:
-            show_miss = " ".join(sorted(list(missing))[:10])
-            print(f"  Missing ({len(missing)}): {show_miss}{' ...' if len(missing) > 10 else ''}")
-        if extra:
-            show_extra = " ".join(sorted(list(extra))[:10])
-            print(f"  Extra ({len(extra)}): {show_extra}{' ...' if len(extra) > 10 else ''}")
+        print_diff(diff_sets(expected, got, limit=10), limit=10)
         return False, ""
 
     print("✅ Correct! Your motifs match the most frequent 9-mers (≤1 mismatch, with RC) in the ori window.")
     # Exercise 7 → 0-based index 6 for letter assignment
     return (True, letter_for_exercise(6)) if award_letter else (True, "")
 
+
+
+# ==============================
+# EXERCISE 7b — Sliding ori windows (advanced)
+# ==============================
+
+def _window_answers(ans: Any) -> Iterator[Tuple[Optional[int], Set[str]]]:
+    """Yield (window_start or None, motif set) from a {start: motifs} mapping or a per-window sequence."""
+    if isinstance(ans, dict):
+        for s in sorted(ans):
+            yield int(s), _as_str_set(ans[s])
+    else:
+        for motifs in ans:
+            yield None, _as_str_set(motifs)
+
+def check_ori_windows(ans: Any, *, genome: str = "E_coli", start: Optional[int] = None,
+                      stop: Optional[int] = None, L: int = 500, k: int = 9, d: int = 1,
+                      award_letter: bool = True):
+    """
+    Hidden checker for the sliding-window ori exercise: the most frequent k-mers
+    (<= d mismatches, with reverse complements) in EVERY window genome[s:s+L], start <= s < stop.
+
+    By default the windows are those containing the first minimum-skew position.
+    `ans` is either a dict {window_start: motifs} or a sequence with one motif list
+    (or space-separated string) per window, in order.
+    The reference slides one base at a time, updating neighborhood counts incrementally.
+    Returns (passed: bool, letter: str).
+    """
+    entry = resolve_genome(genome)
+    try:
+        seq = entry.sequence()
+        if start is None or stop is None:
+            minima = _expected_min_skew(genome)
+            if start is None:
+                start = max(minima[0] - L + 1, 0)
+            if stop is None:
+                stop = minima[0] + 1
+    except FileNotFoundError:
+        print(f"❌ Could not find '{entry.filename}' in the working directory.")
+        return False, ""
+    except Exception as e:
+        print(f"❌ Error reading '{entry.filename}': {e}")
+        return False, ""
+
+    stop = min(stop, len(seq) - L + 1)
+    if start < 0 or start >= stop:
+        print("❌ Window range is empty or out of range for the provided genome.")
+        return False, ""
+
+    reference = sliding_frequent_with_rc(seq, L, k, d, start, stop)
+    n_windows = stop - start
+    try:
+        submitted = _window_answers(ans)
+        for i, ((ref_s, expected), (got_s, got)) in enumerate(zip_longest(reference, submitted, fillvalue=(None, None))):
+            if got is None:
+                print(f"❌ You submitted {i} windows; expected {n_windows} (starts {start}..{stop - 1}).")
+                return False, ""
+            if ref_s is None:
+                print(f"❌ You submitted more than the expected {n_windows} windows.")
+                return False, ""
+            if got_s is not None and got_s != ref_s:
+                print(f"❌ Expected a window starting at {ref_s}, found {got_s}.")
+                return False, ""
+            expected = set(expected)
+            if got != expected:
+                print(f"❌ Incorrect motifs for the window starting at {ref_s} (window #{i}).")
+                print_diff(diff_sets(expected, got, limit=10), limit=10)
+                return False, ""
+    except Exception as e:
+        print(f"❌ Could not parse your answer: {e}")
+        return False, ""
+
+    print(f"✅ Correct! All {n_windows} windows match.")
+    return (True, letter_for_exercise(6)) if award_letter else (True, "")
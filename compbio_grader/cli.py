@@ -0,0 +1,176 @@
+# compbio_grader/cli.py
+"""
+Command-line entry point.
+
+    compbio_grader prepare E_coli.txt Vibrio_cholerae.txt [-o bundle.json]
+    compbio_grader oracle [--problem frequency_table] [--sizes 100 1000] [--trials 3]
+    compbio_grader enqueue cohort.db --check check_neighbors subs/*.ipynb
+    compbio_grader worker cohort.db [--processes 4] [--exit-when-empty]
+    compbio_grader results cohort.db
+    compbio_grader regrade cohort.db          # re-queue results graded under an outdated exercise
+    compbio_grader compact results/ results.csv   # worker --sink logs → one CSV (or .parquet)
+"""
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional
+
+from . import artifacts
+
+
+def _cmd_prepare(args: argparse.Namespace) -> int:
+    print(f"Preparing reference artifacts for {len(args.genomes)} genome(s)...")
+    bundle = artifacts.prepare(
+        args.genomes, args.output,
+        patterns=tuple(args.pattern or artifacts.DEFAULT_PATTERNS),
+        clump=tuple(args.clump),
+        ori=tuple(args.ori),
+    )
+    print(f"✅ Wrote {args.output} (version {bundle['version']}, checksum {bundle['checksum'][:12]}...)")
+    return 0
+
+
+def _cmd_oracle(args: argparse.Namespace) -> int:
+    from . import oracle
+
+    if args.list:
+        for name in sorted(oracle.PROBLEMS):
+            print(f"{name}: {', '.join(oracle.alternatives(name)) or '(no alternatives)'}")
+        return 0
+    results = oracle.differential(args.problem, sizes=args.sizes, trials=args.trials, seed=args.seed)
+    return 0 if oracle.print_report(results) else 1
+
+
+def _cmd_enqueue(args: argparse.Namespace) -> int:
+    from .ingest import DEFAULT_NAMES, extract_file, read_cells
+    from .workqueue import WorkQueue
+
+    name = args.name or DEFAULT_NAMES.get(args.check)
+    if name is None:
+        print(f"❌ No default name for {args.check}; pass --name.")
+        return 2
+    kwargs = json.loads(args.kwargs) if args.kwargs else {}
+    with WorkQueue(args.queue) as q:
+        for path in args.submissions:
+            student = os.path.splitext(os.path.basename(path))[0]
+            if args.whole_file:
+                source = "\n\n".join(read_cells(path))
+            else:
+                ex = extract_file(path, [name])
+                if ex.missing:
+                    print(f"⚠️  {student}: '{name}' is not defined at the top level; the job will fail.")
+                source = ex.source
+            q.enqueue(student, args.check, source, name, **kwargs)
+        print(f"✅ Queued {len(args.submissions)} job(s) for {args.check}; queue now {q.counts()}")
+    return 0
+
+
+def _cmd_worker(args: argparse.Namespace) -> int:
+    from .workqueue import run_worker
+
+    n = run_worker(args.queue, processes=args.processes, lease=args.lease,
+                   exit_when_empty=args.exit_when_empty, sink_dir=args.sink, timeout=args.timeout)
+    print(f"Worker finished: {n} job(s) completed.")
+    return 0
+
+
+def _cmd_regrade(args: argparse.Namespace) -> int:
+    from .workqueue import WorkQueue
+
+    with WorkQueue(args.queue) as q:
+        n = q.requeue_stale()
+        print(f"✅ Re-queued {n} stale job(s); queue now {q.counts()}")
+    return 0
+
+
+def _cmd_compact(args: argparse.Namespace) -> int:
+    from .sink import compact
+
+    try:
+        n = compact(args.directory, args.output, include_output=args.include_output)
+    except ImportError as e:
+        print(f"❌ {e}")
+        return 2
+    print(f"✅ Wrote {n} record(s) to {args.output}")
+    return 0
+
+
+def _cmd_results(args: argparse.Namespace) -> int:
+    from .batch import print_clusters
+    from .workqueue import WorkQueue
+
+    with WorkQueue(args.queue) as q:
+        print(f"Jobs: {q.counts()}")
+        for check in q.checks():
+            report = q.report(check)
+            print(f"\n{check}")
+            for student, r in report.results.items():
+                mark = "✅" if r.passed else "❌"
+                print(f"  {mark} {student}{' (reused)' if r.reused else ''}{': ' + r.error if r.error else ''}")
+            print_clusters(report)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="compbio_grader", description="Hidden grader for the CompBio workshops")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("prepare", help="precompute reference answers into an artifact bundle")
+    p.add_argument("genomes", nargs="+", help="genome text/FASTA files (bundle key = file name without extension)")
+    p.add_argument("-o", "--output", default=artifacts.DEFAULT_BUNDLE, help="bundle path (default: %(default)s)")
+    p.add_argument("--pattern", action="append", help="pattern whose positions to record (repeatable; default CTTGATCAT)")
+    p.add_argument("--clump", nargs=3, type=int, metavar=("K", "L", "T"), default=artifacts.DEFAULT_CLUMP)
+    p.add_argument("--ori", nargs=3, type=int, metavar=("L", "K", "D"), default=artifacts.DEFAULT_ORI)
+    p.set_defaults(func=_cmd_prepare)
+
+    p = sub.add_parser("oracle", help="cross-check fast reference engines against the frozen naive oracles")
+    p.add_argument("--problem", action="append", help="problem to run (repeatable; default: all)")
+    p.add_argument("--sizes", nargs="+", type=int, default=[100, 1000, 10000], help="input sizes (default: %(default)s)")
+    p.add_argument("--trials", type=int, default=3, help="random inputs per size (default: %(default)s)")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--list", action="store_true", help="list problems and registered alternatives")
+    p.set_defaults(func=_cmd_oracle)
+
+    p = sub.add_parser("enqueue", help="add submissions to a grading work queue")
+    p.add_argument("queue", help="queue database (SQLite file on a filesystem shared by the workers)")
+    p.add_argument("submissions", nargs="+", help="student .ipynb or .py files (student = file name without extension)")
+    p.add_argument("--check", required=True, help="check function, e.g. check_neighbors")
+    p.add_argument("--name", help="function or answer variable the check receives (default: the check's usual name)")
+    p.add_argument("--whole-file", action="store_true",
+                   help="queue every code cell instead of only the graded name and what it depends on")
+    p.add_argument("--kwargs", help="JSON object of extra keyword arguments for the check")
+    p.set_defaults(func=_cmd_enqueue)
+
+    p = sub.add_parser("worker", help="grade jobs from a work queue (run one per node)")
+    p.add_argument("queue")
+    p.add_argument("--processes", type=int, help="sandbox processes on this node (default: CPU count)")
+    p.add_argument("--lease", type=float, default=120.0, help="job lease in seconds, renewed by heartbeats")
+    p.add_argument("--timeout", type=float, default=60.0, help="per-job time limit in seconds")
+    p.add_argument("--exit-when-empty", action="store_true", help="stop once no runnable job is left")
+    p.add_argument("--sink", help="also append every result to a per-worker log in this directory")
+    p.set_defaults(func=_cmd_worker)
+
+    p = sub.add_parser("regrade", help="re-queue jobs whose check, hidden cases or reference data changed")
+    p.add_argument("queue")
+    p.set_defaults(func=_cmd_regrade)
+
+    p = sub.add_parser("compact", help="merge result logs written with --sink into one CSV or Parquet file")
+    p.add_argument("directory")
+    p.add_argument("output", help="*.csv, or *.parquet (needs pyarrow)")
+    p.add_argument("--include-output", action="store_true", help="keep the printed check output column")
+    p.set_defaults(func=_cmd_compact)
+
+    p = sub.add_parser("results", help="show verdicts and identical-submission clusters from a work queue")
+    p.add_argument("queue")
+    p.set_defaults(func=_cmd_results)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
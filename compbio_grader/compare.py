@@ -0,0 +1,136 @@
+# compbio_grader/compare.py
+"""
+Bounded result diffing shared by the checks.
+
+Genome-scale answers can hold tens of thousands of positions or k-mers, so
+diagnostics must never sort or print whole collections.  Everything here is
+a single linear pass (sorted-merge or hash lookups) that keeps at most
+`limit` example values per side plus counts and the first mismatch.
+Unordered answers may mix types (a student list holding ints and strings);
+`diff_sets` orders its examples by type name first, so it never compares
+an int with a str.
+"""
+import heapq
+from itertools import islice, zip_longest
+from typing import Any, Collection, Iterable, List, NamedTuple, Optional, Sized, Tuple
+
+_END = object()
+_NATURAL = (str, int, float, bytes)
+
+
+class DiffSummary(NamedTuple):
+    missing_count: int                 # expected but not submitted
+    extra_count: int                   # submitted but not expected
+    missing: List[Any]                 # smallest `limit` missing values, sorted
+    extra: List[Any]                   # smallest `limit` extra values, sorted
+    first_mismatch: Optional[Tuple[int, Any, Any]]  # (index, expected, got); None = equal
+
+    @property
+    def equal(self) -> bool:
+        return self.first_mismatch is None
+
+
+def _order_key(value: Any) -> Tuple[str, Any]:
+    """Total order over mixed values: by type name, then by value (repr for types without a natural order)."""
+    return type(value).__name__, value if isinstance(value, _NATURAL) else repr(value)
+
+
+def _counted(values: Iterable[Any], box: List[int]) -> Iterable[Any]:
+    for v in values:
+        box[0] += 1
+        yield v
+
+
+def first_mismatch(expected: Iterable[Any], got: Iterable[Any]) -> Optional[Tuple[int, Any, Any]]:
+    """
+    Positional comparison of two sequences, stopping at the first difference.
+    Returns (index, expected_value, got_value) or None if equal; an exhausted side reads as None.
+    """
+    for i, (e, g) in enumerate(zip_longest(expected, got, fillvalue=_END)):
+        if e is _END or g is _END or e != g:
+            return i, (None if e is _END else e), (None if g is _END else g)
+    return None
+
+
+def diff_sorted(expected: Iterable[Any], got: Iterable[Any], limit: int = 10) -> DiffSummary:
+    """
+    Sorted-merge diff of two ascending iterables (each is consumed once).
+    The first mismatch index is the position where the two sorted sequences first differ.
+    """
+    it_e, it_g = iter(expected), iter(got)
+    e, g = next(it_e, _END), next(it_g, _END)
+    missing: List[Any] = []
+    extra: List[Any] = []
+    n_missing = n_extra = matched = 0
+    first = None
+    while e is not _END or g is not _END:
+        if g is _END or (e is not _END and e < g):
+            if first is None:
+                first = (matched, e, None if g is _END else g)
+            n_missing += 1
+            if len(missing) < limit:
+                missing.append(e)
+            e = next(it_e, _END)
+        elif e is _END or g < e:
+            if first is None:
+                first = (matched, None if e is _END else e, g)
+            n_extra += 1
+            if len(extra) < limit:
+                extra.append(g)
+            g = next(it_g, _END)
+        else:
+            matched += 1
+            e, g = next(it_e, _END), next(it_g, _END)
+    return DiffSummary(n_missing, n_extra, missing, extra, first)
+
+
+def diff_sets(expected: Collection[Any], got: Iterable[Any], limit: int = 10) -> DiffSummary:
+    """
+    Hash-based diff for unordered answers (duplicates in `got` are ignored).
+    `expected` should support fast membership (a set); `got` is consumed once.
+    Only the `limit` smallest examples per side are kept, via bounded heaps.
+    """
+    seen = set()
+    n_extra = [0]
+
+    def _extras():
+        for g in got:
+            if g in expected:
+                seen.add(g)
+            elif g not in seen:
+                seen.add(g)
+                yield g
+
+    extra = heapq.nsmallest(limit, _counted(_extras(), n_extra), key=_order_key)
+    n_missing = [0]
+    missing = heapq.nsmallest(limit, _counted((e for e in expected if e not in seen), n_missing), key=_order_key)
+    if not missing and not extra:
+        return DiffSummary(0, 0, [], [], None)
+
+    # Index in sorted order where the two answers first diverge.
+    if not extra or (missing and _order_key(missing[0]) <= _order_key(extra[0])):
+        pivot, first_missing, first_extra = _order_key(missing[0]), missing[0], None
+    else:
+        pivot, first_missing, first_extra = _order_key(extra[0]), None, extra[0]
+    index = sum(1 for e in expected if e in seen and _order_key(e) < pivot)
+    first = (index, first_missing, first_extra)
+    return DiffSummary(n_missing[0], n_extra[0], missing, extra, first)
+
+
+def preview(values: Iterable[Any], limit: int = 10, sep: str = " ") -> str:
+    """Render at most `limit` values, with a count of the rest when the input is sized."""
+    shown = list(islice(iter(values), limit + 1))
+    text = sep.join(map(str, shown[:limit]))
+    if len(shown) > limit:
+        text += f"{sep}... (+{len(values) - limit} more)" if isinstance(values, Sized) else f"{sep}..."
+    return text
+
+
+def print_diff(diff: DiffSummary, *, limit: int = 10, sep: str = " ", indent: str = "  ") -> None:
+    """Print the usual Missing/Extra lines for a DiffSummary."""
+    if diff.missing_count:
+        more = " ..." if diff.missing_count > limit else ""
+        print(f"{indent}Missing ({diff.missing_count}): {sep.join(map(str, diff.missing[:limit]))}{more}")
+    if diff.extra_count:
+        more = " ..." if diff.extra_count > limit else ""
+        print(f"{indent}Extra ({diff.extra_count}): {sep.join(map(str, diff.extra[:limit]))}{more}")
@@ -0,0 +1,131 @@
+# compbio_grader/composition.py
+"""
+Windowed nucleotide composition from prefix sums.
+
+`BaseComposition` scans a genome once and keeps, for each of A/C/G/T, the
+running count P[i] = occurrences in genome[:i] (int32, length n+1).  Any
+count over genome[start:end] is then P[end] - P[start], so window, half-strand
+and whole-genome frequencies are O(1) per query:
+
+    comp = genome_composition("E_coli")              # built once per process
+    comp.frequency("C", 0, 100_000)                  # fraction of C in the first 100 kb
+    comp.window_frequencies("C", 100_000)            # % C per window (the cytosine figure)
+    comp.window_differences("G", "C", 100_000)       # % G - % C per window
+    comp.half_strands(ori=3923620)                   # per-base frequencies on both half-strands
+
+Positions are 0-based; the genome is treated as circular only by
+`circular_count` and `half_strands`.
+"""
+from array import array
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, NamedTuple, Optional, Union
+
+from .genomes import read_genome, resolve_genome
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+BASES = "ACGT"
+
+_INDICATOR = {b: bytes(1 if c in (ord(b), ord(b.lower())) else 0 for c in range(256)) for b in BASES}
+
+
+def _prefix_counts(data: bytes, base: str):
+    if np is not None:
+        out = np.zeros(len(data) + 1, dtype=np.int32)
+        np.cumsum(np.frombuffer(data, dtype=np.uint8) == ord(base), dtype=np.int32, out=out[1:])
+        return out
+    ones = array("b")
+    ones.frombytes(data.translate(_INDICATOR[base]))
+    return array("i", accumulate(ones, initial=0))
+
+
+class HalfStrands(NamedTuple):
+    forward: Dict[str, float]   # ori -> ter, per-base fraction
+    reverse: Dict[str, float]   # ter -> ori (wrapping around the end)
+
+
+class BaseComposition:
+    """Per-base prefix counts of one genome; all queries are O(1) (per window)."""
+
+    __slots__ = ("n", "_prefix")
+
+    def __init__(self, genome: Union[str, bytes]):
+        data = genome.upper().encode("ascii", "replace") if isinstance(genome, str) else bytes(genome).upper()
+        self.n = len(data)
+        self._prefix = {b: _prefix_counts(data, b) for b in BASES}
+
+    def _bounds(self, start: int, end: Optional[int]):
+        end = self.n if end is None else end
+        if not 0 <= start <= end <= self.n:
+            raise IndexError(f"Window [{start}, {end}) is out of range for a genome of length {self.n}.")
+        return start, end
+
+    def _p(self, base: str):
+        try:
+            return self._prefix[base.upper()]
+        except KeyError:
+            raise ValueError(f"base must be one of {', '.join(BASES)}") from None
+
+    def count(self, base: str, start: int = 0, end: Optional[int] = None) -> int:
+        """Occurrences of `base` in genome[start:end]."""
+        p = self._p(base)
+        start, end = self._bounds(start, end)
+        return int(p[end]) - int(p[start])
+
+    def frequency(self, base: str, start: int = 0, end: Optional[int] = None) -> float:
+        """Fraction of genome[start:end] that is `base` (0.0 for an empty window)."""
+        start, end = self._bounds(start, end)
+        return self.count(base, start, end) / (end - start) if end > start else 0.0
+
+    def circular_count(self, base: str, start: int, end: int) -> int:
+        """Occurrences in the circular interval start -> end (wraps past the end when end < start)."""
+        if start <= end:
+            return self.count(base, start, end)
+        return self.count(base, start) + self.count(base, 0, end)
+
+    def window_counts(self, base: str, window: int) -> List[int]:
+        """Counts in consecutive windows [0, w), [w, 2w), ...; the last window may be shorter."""
+        if window <= 0:
+            raise ValueError("window must be positive.")
+        p = self._p(base)
+        edges = list(range(0, self.n, window)) + [self.n]
+        return [int(p[e]) - int(p[s]) for s, e in zip(edges, edges[1:])]
+
+    def window_frequencies(self, base: str, window: int, percent: bool = True) -> List[float]:
+        """Frequency of `base` per window (in % by default)."""
+        scale = 100.0 if percent else 1.0
+        return [scale * c / (min(s + window, self.n) - s)
+                for s, c in zip(range(0, self.n, window), self.window_counts(base, window))]
+
+    def window_differences(self, first: str, second: str, window: int, percent: bool = True) -> List[float]:
+        """Frequency of `first` minus frequency of `second` per window (e.g. G - C, in % by default)."""
+        a = self.window_frequencies(first, window, percent)
+        b = self.window_frequencies(second, window, percent)
+        return [x - y for x, y in zip(a, b)]
+
+    def half_strands(self, ori: int, ter: Optional[int] = None) -> HalfStrands:
+        """Per-base fractions on the ori -> ter and ter -> ori half-strands (ter defaults to opposite ori)."""
+        ter = (ori + self.n // 2) % self.n if ter is None else ter
+        fwd_len = (ter - ori) % self.n
+        rev_len = self.n - fwd_len
+
+        def side(start: int, end: int, length: int) -> Dict[str, float]:
+            if length == self.n:
+                return {b: self.frequency(b) for b in BASES}
+            return {b: (self.circular_count(b, start, end) / length if length else 0.0) for b in BASES}
+
+        return HalfStrands(side(ori, ter, fwd_len), side(ter, ori, rev_len))
+
+
+def genome_composition(genome: str) -> BaseComposition:
+    """Prefix counts for a registered genome (or genome file), built once per process and file stamp."""
+    entry = resolve_genome(genome)
+    return _composition(entry.path(), entry._stamp())
+
+@lru_cache(maxsize=4)
+def _composition(path: str, stamp: str) -> BaseComposition:
+    return BaseComposition(read_genome(path))
@@ -0,0 +1,246 @@
+# compbio_grader/fingerprint.py
+"""
+Content fingerprints for submissions, used to spot identical work in a batch.
+
+    answer_fingerprint([1, 2, 3]) == answer_fingerprint("1 2 3")
+    function_fingerprint(fn)      # bytecode + constants + closure + referenced globals
+
+Answers are hashed in normalized form (integer answers as int64 buffers,
+strings with whitespace collapsed), so the same values handed in as a list,
+a tuple, an array or a space-separated string share one fingerprint.
+Functions are hashed on what they execute, not how they are spelled:
+bytecode, constants, default arguments, closure contents and every global
+they reference (recursively for helper functions).  Local variable names,
+comments and line numbers do not count.
+
+A fingerprint is None when the value cannot be hashed without side effects
+(one-shot iterators) or has no stable content (arbitrary callable objects);
+such submissions are always evaluated.  Objects with only a default repr
+(`<Foo object at 0x...>`) are hashed by type alone, unless `strict=True`, which
+gives None for them too.
+"""
+import hashlib
+import inspect
+import json
+import types
+from array import array
+from collections.abc import Iterable, Iterator
+from functools import partial
+from typing import AbstractSet, Any, Dict, Optional, Sequence, Set
+
+from .answers import as_int_array
+
+_MAX_REPR = 1 << 16
+
+
+# Per-process letter permutations (see `checks._get_shuffled_word`): which letter an
+# exercise awards is not part of what it grades, so exercise fingerprints skip them.
+_SESSION_GLOBALS = frozenset({"_SHUFFLED"})
+
+
+class _Opaque(Exception):
+    """A strict fingerprint reached a value it can only hash by type."""
+
+
+def _int_payload(ans: Any) -> Optional[bytes]:
+    try:
+        arr = as_int_array(ans)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    data = arr.astype("<i8").tobytes() if hasattr(arr, "astype") else arr.tobytes()
+    return b"ints:" + data
+
+
+def _is_int_sequence(ans: Any) -> bool:
+    """Only exact integer containers share the int64 form, so [1.5] never collides with [1]."""
+    if isinstance(ans, range):
+        return True
+    if isinstance(ans, (list, tuple)):
+        return all(type(x) is int for x in ans)
+    if isinstance(ans, array):
+        return ans.typecode in "bBhHiIlLqQ"
+    if isinstance(ans, memoryview):
+        return ans.format in ("b", "B", "h", "H", "i", "I", "l", "L", "q", "Q")
+    dtype = getattr(ans, "dtype", None)
+    return dtype is not None and getattr(dtype, "kind", "") in ("i", "u")
+
+
+def _answer_payload(ans: Any) -> Optional[bytes]:
+    if ans is None or isinstance(ans, (bool, int, float, complex)):
+        return f"{type(ans).__name__}:{ans!r}".encode()
+    if isinstance(ans, str):
+        ints = _int_payload(ans) if ans.strip() else None
+        return ints or b"str:" + " ".join(ans.split()).encode("utf-8", "surrogatepass")
+    if isinstance(ans, (bytes, bytearray)):
+        return b"bytes:" + bytes(ans)
+    if isinstance(ans, dict):
+        try:
+            return b"dict:" + json.dumps(ans, sort_keys=True, default=repr).encode()
+        except TypeError:  # keys of mixed types
+            return b"dict:" + repr(sorted(ans.items(), key=repr)).encode()
+    if isinstance(ans, (set, frozenset)):
+        return b"set:" + repr(sorted(ans, key=repr)).encode()
+    if isinstance(ans, Iterator):
+        return None  # generator / iterator: hashing would consume it
+    if _is_int_sequence(ans):
+        ints = _int_payload(ans)
+        if ints is not None:
+            return ints
+    if hasattr(ans, "tobytes") and hasattr(ans, "dtype"):
+        return f"ndarray:{ans.dtype}:{getattr(ans, 'shape', '')}:".encode() + ans.tobytes()
+    if isinstance(ans, Iterable):
+        try:
+            return b"seq:" + repr(list(ans)).encode()
+        except TypeError:
+            return None
+    return None
+
+
+def answer_fingerprint(ans: Any) -> Optional[str]:
+    """SHA-256 of the normalized answer, or None if it cannot be hashed without consuming it."""
+    payload = _answer_payload(ans)
+    return None if payload is None else hashlib.sha256(payload).hexdigest()
+
+
+# ----------  FUNCTIONS ----------
+def _value_token(value: Any, h: "hashlib._Hash", seen: Set[int], strict: bool = False,
+                 skip: AbstractSet[str] = frozenset()) -> None:
+    if isinstance(value, types.FunctionType):
+        _hash_function(value, h, seen, strict, skip)
+    elif callable(value) and isinstance(getattr(value, "__wrapped__", None), types.FunctionType):
+        _hash_function(value.__wrapped__, h, seen, strict, skip)     # lru_cache and other wrapping decorators
+    elif isinstance(value, types.ModuleType):
+        h.update(f"module:{value.__name__}".encode())
+    elif isinstance(value, type):
+        h.update(f"type:{value.__module__}.{value.__qualname__}".encode())
+    elif isinstance(value, types.BuiltinFunctionType):
+        h.update(f"builtin:{getattr(value, '__module__', '')}.{value.__qualname__}".encode())
+    else:
+        payload = _answer_payload(value)
+        if payload is None:
+            text = repr(value)[:_MAX_REPR]
+            if " at 0x" in text:    # default object repr: the address changes every run
+                if strict:
+                    raise _Opaque(type(value).__qualname__)
+                text = ""
+            payload = f"{type(value).__qualname__}:{text}".encode()
+        h.update(hashlib.sha256(payload).digest())
+
+
+def _hash_code(code: types.CodeType, fn_globals: dict, h: "hashlib._Hash", seen: Set[int],
+               strict: bool = False, skip: AbstractSet[str] = frozenset()) -> None:
+    h.update(code.co_code)
+    h.update(repr((code.co_argcount, code.co_kwonlyargcount, code.co_flags & 0x0F)).encode())
+    h.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _hash_code(const, fn_globals, h, seen, strict, skip)
+        else:
+            h.update(f"{type(const).__name__}:{const!r}".encode())
+    # Globals may be read from any nested code object, so resolve names at every level.
+    # Names in `skip` still count through co_names, just not their current values.
+    for name in code.co_names:
+        if name in fn_globals and name not in skip:
+            h.update(f"global:{name}".encode())
+            _value_token(fn_globals[name], h, seen, strict, skip)
+
+
+def _hash_function(fn: types.FunctionType, h: "hashlib._Hash", seen: Set[int], strict: bool = False,
+                   skip: AbstractSet[str] = frozenset()) -> None:
+    if id(fn) in seen:
+        h.update(f"recurse:{fn.__name__}".encode())
+        return
+    seen.add(id(fn))
+    _hash_code(fn.__code__, fn.__globals__, h, seen, strict, skip)
+    for default in (fn.__defaults__ or ()):
+        _value_token(default, h, seen, strict, skip)
+    for key, default in sorted((fn.__kwdefaults__ or {}).items()):
+        h.update(f"kwdefault:{key}".encode())
+        _value_token(default, h, seen, strict, skip)
+    for cell in (fn.__closure__ or ()):
+        try:
+            _value_token(cell.cell_contents, h, seen, strict, skip)
+        except ValueError:  # empty cell
+            h.update(b"cell:empty")
+
+
+def function_fingerprint(fn: Any, *, strict: bool = False) -> Optional[str]:
+    """
+    SHA-256 over what `fn` executes: its bytecode, constants, defaults, closure
+    and referenced globals.  None for callables without inspectable code, and with
+    `strict` also when it reaches an object that can only be hashed by type.
+    """
+    h = hashlib.sha256()
+    if isinstance(fn, partial):
+        inner = function_fingerprint(fn.func, strict=strict)
+        if inner is None:
+            return None
+        h.update(inner.encode())
+        try:
+            for arg in fn.args:
+                _value_token(arg, h, set(), strict)
+            for key, value in sorted(fn.keywords.items()):
+                h.update(f"kw:{key}".encode())
+                _value_token(value, h, set(), strict)
+        except _Opaque:
+            return None
+        return h.hexdigest()
+    if not isinstance(fn, types.FunctionType):  # bound methods, callable objects: state is opaque
+        return None
+    try:
+        _hash_function(fn, h, set(), strict)
+    except _Opaque:
+        return None
+    return h.hexdigest()
+
+
+def source_fingerprint(source: str) -> str:
+    """
+    Fingerprint of notebook/source text without executing it: the compiled
+    module's bytecode and constants, so comments, blank lines and layout do not
+    count.  Falls back to the raw text if it does not compile.
+    """
+    h = hashlib.sha256()
+    try:
+        code = compile(source, "<submission>", "exec")
+    except (SyntaxError, ValueError):
+        h.update(b"text:" + source.encode("utf-8", "surrogatepass"))
+        return h.hexdigest()
+    _hash_code(code, {}, h, set())
+    return h.hexdigest()
+
+
+def submission_fingerprint(submission: Any, *, strict: bool = False) -> Optional[str]:
+    """function_fingerprint for callables, answer_fingerprint for everything else."""
+    if callable(submission) and not isinstance(submission, type):
+        return function_fingerprint(submission, strict=strict)
+    return answer_fingerprint(submission)
+
+
+def exercise_fingerprint(check: Any, args: Sequence[Any] = (), kwargs: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """
+    Fingerprint of one exercise as graded by `check(submission, *args, **kwargs)`: the
+    check's code, including hidden cases, constants and helpers through its referenced
+    globals, its extra arguments, and the reference data version (see
+    `genomes.reference_version`).  The per-process letter permutation is left out, so
+    the fingerprint is the same in every process.  None if the check or an argument has
+    no stable content.
+    """
+    from .genomes import reference_version
+
+    kwargs = kwargs or {}
+    check = inspect.unwrap(check)                           # without decorators such as session_memo
+    if isinstance(check, types.FunctionType):
+        h = hashlib.sha256()
+        _hash_function(check, h, set(), skip=_SESSION_GLOBALS)
+        parts = [h.hexdigest()]
+    else:
+        parts = [function_fingerprint(check)]
+    parts.extend(submission_fingerprint(a) for a in args)
+    for key, value in sorted(kwargs.items()):
+        parts.extend((key, submission_fingerprint(value)))
+    if any(p is None for p in parts):
+        return None
+    genome = kwargs.get("genome")
+    parts.append(reference_version([genome] if isinstance(genome, str) else ()))
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
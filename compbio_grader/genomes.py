@@ -0,0 +1,245 @@
+# compbio_grader/genomes.py
+"""
+Genome registry shared by the genome-scale checks.
+
+Genomes are plain-text files (optionally FASTA with '>' header lines).  Each
+registered genome has a canonical name (the file name without extension,
+e.g. 'E_coli'), a few aliases, and lazily computed reference products:
+
+    entry = resolve_genome("ecoli")
+    entry.sequence()                       # str, read once per process
+    entry.skew()                           # Skew_0..Skew_n, built once per node
+    entry.reference("clumps", "9,500,3", compute=...)
+
+Products are looked up in this order: the artifact bundle (see
+artifacts.py; skipped if the genome file no longer matches it), constants
+supplied by the caller, the on-disk cache, and finally `compute`.  The cache directory ($COMPBIO_GRADER_CACHE, default
+~/.cache/compbio_grader) is shared by every process on the node; builds
+are serialized with a file lock so each product is computed once.
+
+Genome files are searched for in $COMPBIO_GRADER_GENOME_DIR and then the
+working directory.  Any path that is not a registered name is accepted too.
+"""
+import hashlib
+import json
+import os
+from array import array
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX: builds may race, but writes are atomic
+    fcntl = None
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+from . import artifacts
+
+
+def read_genome(path: str) -> str:
+    """Return the genome in `path` as one upper-case string (headers and whitespace removed)."""
+    st = os.stat(path)
+    return _read_genome(path, st.st_size, st.st_mtime_ns)
+
+@lru_cache(maxsize=8)
+def _read_genome(path: str, size: int, mtime_ns: int) -> str:
+    """Cached per (path, size, mtime), so an edited file is read again."""
+    with open(path) as f:
+        lines = [ln.strip() for ln in f if not ln.startswith(">")]
+    return "".join(lines).replace(" ", "").upper()
+
+
+def cache_dir() -> str:
+    return os.getenv("COMPBIO_GRADER_CACHE") or os.path.join(os.path.expanduser("~"), ".cache", "compbio_grader")
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + ".lock", "a") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    tmp = f"{path}.tmp{os.getpid()}"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+class GenomeEntry:
+    """One registered genome and its cached reference products."""
+
+    def __init__(self, name: str, filename: str, label: str = "", aliases: Iterable[str] = ()):
+        self.name = name
+        self.filename = filename
+        self.label = label or name
+        self.aliases = tuple(aliases)
+        self._products: Dict[str, Any] = {}
+
+    def __repr__(self) -> str:
+        return f"GenomeEntry({self.name!r}, {self.filename!r})"
+
+    def path(self) -> str:
+        """Locate the genome file (raises FileNotFoundError with the file name if absent)."""
+        if os.path.isabs(self.filename) or os.path.dirname(self.filename):
+            candidates = [self.filename]
+        else:
+            genome_dir = os.getenv("COMPBIO_GRADER_GENOME_DIR")
+            candidates = ([os.path.join(genome_dir, self.filename)] if genome_dir else []) + [self.filename]
+        for c in candidates:
+            if os.path.exists(c):
+                return c
+        raise FileNotFoundError(self.filename)
+
+    def sequence(self) -> str:
+        return read_genome(self.path())
+
+    def _stamp(self) -> str:
+        """Size and mtime of the genome file ('-' if absent): in-process products are kept per stamp."""
+        try:
+            st = os.stat(self.path())
+        except FileNotFoundError:
+            return "-"
+        return f"{st.st_size}-{st.st_mtime_ns}"
+
+    def _cache_base(self) -> str:
+        st = os.stat(self.path())
+        return os.path.join(cache_dir(), f"{self.name}-{st.st_size}-{int(st.st_mtime)}")
+
+    def skew(self):
+        """
+        Skew_0..Skew_n as int32, built once per node and stored in the cache directory.
+        With NumPy the file is memory-mapped, so every process shares the same pages.
+        """
+        memo = f"skew@{self._stamp()}"
+        if memo in self._products:
+            return self._products[memo]
+        from .skew import skew_array
+
+        path = self._cache_base() + ".skew.i32"
+        if not os.path.exists(path):
+            with _file_lock(path):
+                if not os.path.exists(path):
+                    vals = skew_array(self.sequence())
+                    if np is not None:
+                        data = np.asarray(vals, dtype="<i4").tobytes()
+                    else:
+                        data = array("i", vals).tobytes()
+                    _atomic_write(path, data)
+        if np is not None:
+            vals = np.memmap(path, dtype="<i4", mode="r")
+        else:
+            vals = array("i")
+            with open(path, "rb") as f:
+                vals.frombytes(f.read())
+        self._products[memo] = vals
+        return vals
+
+    def reference(self, product: str, key: Optional[str] = None, known: Any = None,
+                  compute: Optional[Callable[[str], Any]] = None) -> Any:
+        """
+        A reference product, e.g. reference("clumps", "9,500,3", compute=lambda seq: ...).
+        `compute` receives the genome sequence and must return a JSON-serializable value.
+        Bundle entries are used only if they were built from the genome file as it is now.
+        """
+        stamp = self._stamp()
+        memo = f"{product}:{key}@{stamp}"
+        if memo in self._products:
+            return self._products[memo]
+        value = artifacts.lookup(self.name, product, key, sequence=None if stamp == "-" else self.sequence())
+        if value is None:
+            value = known
+        if value is None and compute is not None:
+            value = self._cached_compute(product, key, compute)
+        self._products[memo] = value
+        return value
+
+    def _cached_compute(self, product: str, key: Optional[str], compute: Callable[[str], Any]) -> Any:
+        path = self._cache_base() + f".{product}.json"
+        key = "" if key is None else key
+        with _file_lock(path):
+            try:
+                with open(path) as f:
+                    stored = json.load(f)
+            except (OSError, ValueError):
+                stored = {}
+            if key not in stored:
+                stored[key] = compute(self.sequence())
+                _atomic_write(path, json.dumps(stored).encode("utf-8"))
+        return stored[key]
+
+
+# ----------  REGISTRY ----------
+_REGISTRY: Dict[str, GenomeEntry] = {}
+_ALIASES: Dict[str, str] = {}
+_BY_PATH: Dict[str, GenomeEntry] = {}
+
+def _norm(name: str) -> str:
+    return "".join(ch for ch in name.strip().lower() if ch.isalnum())
+
+def register_genome(name: str, filename: str, *, label: str = "", aliases: Iterable[str] = ()) -> GenomeEntry:
+    """Register (or replace) a genome under `name` and its aliases."""
+    entry = GenomeEntry(name, filename, label, aliases)
+    _REGISTRY[name] = entry
+    for alias in (name, *aliases):
+        _ALIASES[_norm(alias)] = name
+    return entry
+
+def registered_genomes() -> Dict[str, GenomeEntry]:
+    return dict(_REGISTRY)
+
+def reference_version(extra: Iterable[str] = ()) -> str:
+    """
+    Identity of the reference data the checks read: the artifact bundle's checksum and
+    the size/mtime of every registered genome file (plus `extra` genomes) found here.
+    """
+    bundle = artifacts.load_bundle(artifacts.bundle_path())
+    parts = [f"bundle:{bundle['checksum'] if bundle else '-'}"]
+    entries = list(_REGISTRY.values()) + [resolve_genome(g) for g in extra]
+    for entry in entries:
+        try:
+            st = os.stat(entry.path())
+            parts.append(f"{entry.name}:{st.st_size}:{st.st_mtime_ns}")
+        except FileNotFoundError:
+            parts.append(f"{entry.name}:-")
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+def resolve_genome(genome: str) -> GenomeEntry:
+    """Registry name/alias → entry; anything else is treated as a path to a genome file."""
+    name = _ALIASES.get(_norm(genome))
+    if name is not None:
+        return _REGISTRY[name]
+    entry = _BY_PATH.get(genome)
+    if entry is None:
+        base = os.path.basename(genome)
+        known = next((e for e in _REGISTRY.values() if e.filename == base), None)
+        if known is not None and base == genome:
+            return known
+        if known is not None:   # a registered genome stored elsewhere: same name, explicit path
+            entry = GenomeEntry(known.name, genome, known.label)
+        else:
+            entry = GenomeEntry(artifacts.genome_key(genome), genome)
+        _BY_PATH[genome] = entry
+    return entry
+
+
+register_genome("E_coli", "E_coli.txt", label="E. coli",
+                aliases=("ecoli", "e_coli", "escherichia_coli", "E. coli"))
+register_genome("Vibrio_cholerae", "Vibrio_cholerae.txt", label="V. cholerae",
+                aliases=("vcholerae", "v_cholerae", "vibrio", "V. cholerae"))
+register_genome("Thermotoga_petrophila", "Thermotoga-petrophila.txt", label="T. petrophila",
+                aliases=("thermotoga", "tpetrophila", "t_petrophila", "T. petrophila"))
+register_genome("Salmonella_enterica", "Salmonella_enterica.txt", label="S. enterica",
+                aliases=("salmonella", "senterica", "s_enterica", "S. enterica"))
@@ -0,0 +1,218 @@
+# compbio_grader/hamming.py
+"""
+Hamming distances on 2-bit k-mer codes (see `kmercode.py`).
+
+Two codes differ at a base exactly when that base's 2-bit slot of a ^ b is
+non-zero, so with x = a ^ b the mismatch count is
+
+    popcount((x | x >> 1) & 0b0101...01)
+
+one XOR, one shift, one mask and one popcount for the whole k-mer instead of
+a Python-level loop over its characters.  The batch forms encode a genome
+once and then compare one pattern against every k-mer (or many patterns
+against many k-mers) in vectorized NumPy passes when NumPy is installed, or
+with the same bit trick on Python ints otherwise.  `approximate_positions`
+and `approximate_count` turn the trick sideways and need no NumPy: one bit
+per genome position, with the mismatches at every position summed in
+bit-sliced counters held in Python ints.
+
+    hamming("GGGCCGTTGGT", "GGACCGTTGAC")               # 3
+    hamming_to_genome("ATTCTGGA", text)                  # distance at every start position
+    approximate_positions("ATTCTGGA", text, 3)           # starts within distance 3
+    distance_matrix(patterns, kmers)                     # many-vs-many, rows = patterns
+    motif_distance("AAA", ["TTACCTTAAC", "GATATCTGTC"])  # d(Pattern, Dna)
+
+The code-based forms need k <= 32 and ACGT input; anything else (including
+digits, which must not pass for encoded bases) falls back to comparing
+characters, so results always equal the naive definition.  The one-pair
+`hamming` only pays off for long strings: encoding two short k-mers costs
+about as much as comparing them, which is why the checks' d-neighborhood
+references keep a plain character comparison.
+"""
+from array import array
+from typing import List, Optional, Sequence
+
+from .kmercode import _NOT_ACGT, MAX_K, encode_kmer, encode_kmer_array, encode_text, mask
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+_LOW64 = mask(MAX_K) // 3          # 0b0101...01: the low bit of every 2-bit slot
+_TO_DIGITS = str.maketrans("ACGT", "0123")
+_MATRIX_CHUNK = 1 << 22            # cells per NumPy block in distance_matrix
+
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count
+else:  # Python < 3.10
+    def _popcount(x: int) -> int:
+        return bin(x).count("1")
+
+if np is not None:
+    if hasattr(np, "bitwise_count"):
+        def _np_popcount(x):
+            return np.bitwise_count(x).astype(np.uint8, copy=False)
+    else:
+        _POP8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+        def _np_popcount(x):
+            return _POP8[x.view(np.uint8)].reshape(x.shape + (8,)).sum(axis=-1, dtype=np.uint8)
+
+
+def _naive(a: str, b: str) -> int:
+    return sum(x != y for x, y in zip(a, b))
+
+
+# ----------  ONE PAIR ----------
+def hamming_codes(a: int, b: int) -> int:
+    """Mismatches between two k-mer codes of the same k (k <= 32)."""
+    x = a ^ b
+    return _popcount((x | x >> 1) & _LOW64)
+
+def hamming(a: str, b: str) -> int:
+    """
+    Mismatches between `a` and `b` over their common length (like
+    sum(x != y for x, y in zip(a, b)), which it falls back to for non-ACGT text).
+    """
+    if len(a) != len(b):
+        n = min(len(a), len(b))
+        a, b = a[:n], b[:n]
+    if not a or a.translate(_NOT_ACGT) or b.translate(_NOT_ACGT):
+        return _naive(a, b)
+    x = int(a.translate(_TO_DIGITS), 4) ^ int(b.translate(_TO_DIGITS), 4)
+    return _popcount((x | x >> 1) & (_LOW64 if len(a) <= MAX_K else mask(len(a)) // 3))
+
+
+# ----------  ONE VS MANY ----------
+def code_distances(code: int, codes):
+    """Distance from one code to each of `codes`: uint8 array (NumPy) or `array('B')`."""
+    if np is not None and isinstance(codes, np.ndarray):
+        x = codes ^ np.uint64(code)
+        x |= x >> np.uint64(1)
+        x &= np.uint64(_LOW64)
+        return _np_popcount(x)
+    return array("B", [_popcount((x | x >> 1) & _LOW64) for x in [c ^ code for c in codes]])
+
+def _encoded(pattern: str, text: str):
+    """(pattern code, codes of every k-mer of text), or None when the bit kernel does not apply."""
+    k = len(pattern)
+    if not 0 < k <= MAX_K or len(text) < k:
+        return None
+    try:
+        return encode_kmer(pattern), encode_text(text, k)
+    except ValueError:
+        return None
+
+def hamming_to_genome(pattern: str, text: str):
+    """Distance from `pattern` to the k-mer starting at every position 0..len(text)-k of `text`."""
+    enc = _encoded(pattern, text)
+    if enc is None:
+        k = len(pattern)
+        return array("I", [_naive(pattern, text[i:i+k]) for i in range(len(text) - k + 1)])
+    return code_distances(*enc)
+
+def _match_bits(raw: bytes, ch: int) -> int:
+    """Bit len(raw)-1-i set iff raw[i] == ch (first character in the highest bit, like a k-mer code)."""
+    table = bytes(0x31 if i == ch else 0x30 for i in range(256))   # b"1" / b"0"
+    return int(raw.translate(table), 2)
+
+def _within_bits(pattern: str, text: str, d: int) -> Optional[int]:
+    """
+    Bit len(text)-1-i set iff `pattern` is within distance `d` of text[i:i+k];
+    None when this does not apply (empty pattern, non-ASCII input).
+    Mismatches are summed for all positions at once in bit-sliced counters (one
+    Python int per counter bit, one bit per position), so the work is k big-int
+    additions rather than len(text) Python steps.
+    """
+    k, n = len(pattern), len(text) - len(pattern) + 1
+    if k == 0:
+        return None
+    if n <= 0 or d < 0:
+        return 0
+    valid = ((1 << n) - 1) << (k - 1)     # bits of the start positions 0..n-1
+    if d >= k:
+        return valid
+    try:
+        raw, praw = text.encode("ascii"), pattern.encode("ascii")
+    except UnicodeEncodeError:
+        return None
+    match = {ch: _match_bits(raw, ch) for ch in set(praw)}
+    planes: List[int] = []      # planes[t] = bit t of every position's mismatch count
+    for j, ch in enumerate(praw):
+        carry = valid & ~(match[ch] << j)
+        for t in range(len(planes)):
+            if not carry:
+                break
+            planes[t], carry = planes[t] ^ carry, planes[t] & carry
+        if carry:
+            planes.append(carry)
+    less, equal = 0, valid      # count < d / count == d so far, from the top bit down
+    for t in reversed(range(max(len(planes), d.bit_length()))):
+        plane = planes[t] if t < len(planes) else 0
+        if d >> t & 1:
+            less |= equal & ~plane
+            equal &= plane
+        else:
+            equal &= ~plane
+    return (less | equal) & valid
+
+def _start_positions(bits: int, length: int) -> List[int]:
+    """Positions i whose bit length-1-i is set."""
+    bits = format(bits, f"0{length}b")
+    out = []
+    i = bits.find("1")
+    while i != -1:
+        out.append(i)
+        i = bits.find("1", i + 1)
+    return out
+
+def approximate_positions(pattern: str, text: str, d: int) -> List[int]:
+    """Start positions where `pattern` occurs in `text` with at most `d` mismatches."""
+    bits = _within_bits(pattern, text, d)
+    if bits is None:
+        k = len(pattern)
+        return [i for i in range(len(text) - k + 1) if _naive(pattern, text[i:i+k]) <= d]
+    return _start_positions(bits, len(text))
+
+def approximate_count(pattern: str, text: str, d: int) -> int:
+    """Count_d(Text, Pattern): occurrences of `pattern` in `text` with at most `d` mismatches."""
+    bits = _within_bits(pattern, text, d)
+    if bits is None:
+        return len(approximate_positions(pattern, text, d))
+    return _popcount(bits)
+
+
+# ----------  MANY VS MANY ----------
+def distance_matrix(patterns: Sequence[str], kmers: Sequence[str]):
+    """
+    Distances between every pattern (rows) and every k-mer (columns), all of one
+    length k <= 32: a (len(patterns), len(kmers)) uint8 array with NumPy, else a
+    list of `array('B')` rows.  Raises KmerFormatError on malformed entries.
+    """
+    patterns, kmers = list(patterns), list(kmers)
+    if not patterns:
+        return np.zeros((0, len(kmers)), dtype=np.uint8) if np is not None else []
+    k = len(patterns[0])
+    p_codes = encode_kmer_array(patterns, k)
+    k_codes = encode_kmer_array(kmers, k)
+    if np is None:
+        return [code_distances(p, k_codes) for p in p_codes]
+    out = np.empty((len(p_codes), len(k_codes)), dtype=np.uint8)
+    step = max(1, _MATRIX_CHUNK // max(len(k_codes), 1))
+    for s in range(0, len(p_codes), step):
+        x = p_codes[s:s + step, None] ^ k_codes[None, :]
+        x |= x >> np.uint64(1)
+        x &= np.uint64(_LOW64)
+        out[s:s + step] = _np_popcount(x)
+    return out
+
+def motif_distance(pattern: str, dna: Sequence[str]) -> int:
+    """d(Pattern, Dna): sum over the strings of the smallest distance from `pattern` to any of their k-mers."""
+    total = 0
+    for text in dna:
+        dist = hamming_to_genome(pattern, text)
+        if len(dist) == 0:
+            raise ValueError(f"Pattern of length {len(pattern)} is longer than a string of length {len(text)}.")
+        total += int(min(dist))
+    return total
@@ -0,0 +1,238 @@
+# compbio_grader/ingest.py
+"""
+Pull the graded definitions out of a notebook or source file without running it.
+
+Executing an exported notebook top to bottom re-reads genomes, redraws plots
+and re-runs every exploratory cell.  `extract_file` instead parses the code
+cells with `ast` and keeps only the top-level statements that define the
+requested names (`PatternCount`, `Neighbors`, `ans`, ...) plus everything
+those statements need: helper functions, imports, constants, and statements
+that fill a needed container (`ans.append(...)`, `counts[k] = ...`, loops
+that do either).  Statements are kept in notebook order.
+
+    ex = extract_file("alice.ipynb", ["Neighbors"])
+    ex.missing                      # requested names the notebook never defines
+    code = compile_cached(ex.source)   # compiled once per distinct source
+    ns = load_names("alice.ipynb", ["Neighbors"])   # both steps + exec
+
+IPython magics and shell lines (`%time`, `!ls`) are neutralized; cells
+that do not parse are skipped.  The analysis is static, so definitions made
+through `exec`, `globals()` or star imports of student modules are not
+followed (star imports themselves are always kept).
+"""
+import ast
+import hashlib
+import json
+import threading
+from collections import OrderedDict, defaultdict
+from types import CodeType
+from typing import Any, Dict, Iterable, List, NamedTuple, Sequence, Set, Tuple
+
+_MAX_CODE = 512
+_CELL_MAGICS_KEPT = ("%%time", "%%timeit", "%%capture")
+
+# Name each check receives from the student's notebook (answer checks take `ans`).
+DEFAULT_NAMES: Dict[str, str] = {
+    "check_patterncount": "PatternCount",
+    "check_frequencytable": "FrequencyTable",
+    "check_genome_frequencytable": "FrequencyTable",
+    "check_maxmap": "MaxMap",
+    "check_frequentwords": "FrequentWords",
+    "check_genome_frequentwords": "FrequentWords",
+    "check_reversecomplement": "ReverseComplement",
+    "check_patternmatching": "PatternMatching",
+    "check_genome_patternmatching": "PatternMatching",
+    "check_approximatepatterncount": "ApproximatePatternCount",
+    "check_neighbors": "Neighbors",
+    "check_frequentwordsapproximate": "FrequentWordsApproximate",
+    "check_genome_frequentwordsapproximate": "FrequentWordsApproximate",
+    "check_frequentwords_approx_with_rc": "FrequentWordsApproximateWithRC",
+    "check_skew": "ans",
+    "check_minimumskew": "ans",
+    "check_genome_skew": "ans",
+    "check_cytosine_frequency": "ans",
+    "check_frequency_difference": "ans",
+    "check_ecoli_ori": "ans",
+    "check_ori_windows": "ans",
+}
+
+
+class Extract(NamedTuple):
+    source: str                 # the kept statements, cell by cell
+    names: Tuple[str, ...]      # what was asked for
+    missing: Tuple[str, ...]    # asked for but never defined at top level
+    kept: int                   # top-level statements kept
+    total: int                  # top-level statements seen
+    skipped_cells: int          # code cells that did not parse
+
+
+# ----------  READING ----------
+def _clean_cell(src: str) -> str:
+    """Neutralize IPython syntax; '' for cells that are not Python (%%bash, %%html, ...)."""
+    lines = src.splitlines()
+    if lines and lines[0].lstrip().startswith("%%"):
+        if not lines[0].strip().startswith(_CELL_MAGICS_KEPT):
+            return ""
+        lines[0] = ""
+    out = []
+    for line in lines:
+        stripped = line.lstrip()
+        if stripped.startswith(("%", "!")):
+            line = line[:len(line) - len(stripped)] + "pass"
+        out.append(line)
+    return "\n".join(out) + "\n"
+
+def notebook_cells(nb: Dict[str, Any]) -> List[str]:
+    """Source of every code cell of a decoded notebook."""
+    cells = []
+    for cell in nb.get("cells", ()):
+        if cell.get("cell_type") == "code":
+            src = cell.get("source", "")
+            cells.append("".join(src) if isinstance(src, list) else src)
+    return cells
+
+def read_cells(path: str) -> List[str]:
+    """Code cells of a .ipynb file, or the whole file as one cell for anything else."""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".ipynb"):
+            # Outputs (plots, printed genomes) are the bulk of a notebook; drop them while decoding.
+            return notebook_cells(json.load(f, object_hook=lambda d: {k: v for k, v in d.items() if k != "outputs"}))
+        return [f.read()]
+
+
+# ----------  ANALYSIS ----------
+def _root_name(node: ast.AST):
+    while isinstance(node, (ast.Attribute, ast.Subscript, ast.Starred)):
+        node = node.value
+    return node.id if isinstance(node, ast.Name) else None
+
+def _walk_scope(node: ast.AST) -> Iterable[ast.AST]:
+    """ast.walk that does not descend into nested function, lambda or class bodies."""
+    todo = [node]
+    while todo:
+        n = todo.pop()
+        yield n
+        for child in ast.iter_child_nodes(n):
+            if not isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)):
+                todo.append(child)
+
+def _loads(node: ast.AST) -> Set[str]:
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load)}
+
+def _function_uses(fn: ast.AST) -> Set[str]:
+    """Global names a function (or class) may read: all loads minus its parameters and locals."""
+    params = {a.arg for a in ast.walk(fn) if isinstance(a, ast.arg)}
+    stores = {n.id for n in ast.walk(fn) if isinstance(n, ast.Name) and not isinstance(n.ctx, ast.Load)}
+    declared = {name for n in ast.walk(fn) if isinstance(n, (ast.Global, ast.Nonlocal)) for name in n.names}
+    return _loads(fn) - ((params | stores) - declared)
+
+def _analyze(node: ast.stmt) -> Tuple[Set[str], Set[str], bool]:
+    """(names the statement binds or mutates, names it reads, keep unconditionally)."""
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return {node.name}, _function_uses(node), False
+    if isinstance(node, ast.Import):
+        return {(a.asname or a.name).split(".")[0] for a in node.names}, set(), False
+    if isinstance(node, ast.ImportFrom):
+        if node.module == "__future__" or any(a.name == "*" for a in node.names):
+            return set(), set(), True
+        return {a.asname or a.name for a in node.names}, set(), False
+    binds: Set[str] = set()
+    for n in _walk_scope(node):
+        if isinstance(n, ast.Name) and not isinstance(n.ctx, ast.Load):
+            binds.add(n.id)
+        elif isinstance(n, (ast.Attribute, ast.Subscript)) and not isinstance(n.ctx, ast.Load):
+            binds.add(_root_name(n.value))
+        elif isinstance(n, ast.Expr) and isinstance(n.value, ast.Call) and isinstance(n.value.func, ast.Attribute):
+            binds.add(_root_name(n.value.func.value))     # ans.append(...), counts.update(...)
+        elif isinstance(n, (ast.Global, ast.Nonlocal)):
+            binds.update(n.names)
+    binds.discard(None)
+    return binds, _loads(node), False
+
+def _statement_lines(node: ast.stmt) -> range:
+    first = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", ())])
+    return range(first, node.end_lineno + 1)
+
+
+def extract(cells: Sequence[str], names: Iterable[str]) -> Extract:
+    """Keep the statements of `cells` that define `names`, plus their dependency closure."""
+    names = tuple(names)
+    parsed: List[Tuple[int, List[str], ast.stmt]] = []
+    skipped = 0
+    for i, cell in enumerate(cells):
+        src = _clean_cell(cell)
+        if not src.strip():
+            continue
+        try:
+            tree = ast.parse(src)
+        except (SyntaxError, ValueError):
+            skipped += 1
+            continue
+        lines = src.splitlines()
+        parsed.extend((i, lines, stmt) for stmt in tree.body)
+
+    binders: Dict[str, List[int]] = defaultdict(list)
+    uses: List[Set[str]] = []
+    keep: Set[int] = set()
+    for idx, (_, _, stmt) in enumerate(parsed):
+        b, u, always = _analyze(stmt)
+        for name in b:
+            binders[name].append(idx)
+        uses.append(u)
+        if always:
+            keep.add(idx)
+
+    todo = list(names) + [n for idx in keep for n in uses[idx]]
+    seen: Set[str] = set()
+    while todo:
+        name = todo.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        for idx in binders.get(name, ()):
+            if idx not in keep:
+                keep.add(idx)
+                todo.extend(uses[idx])
+
+    # Source lines to keep, per cell in notebook order (a set, so `a = 1; b = 2` is emitted once).
+    kept_lines: "OrderedDict[int, Tuple[List[str], Set[int]]]" = OrderedDict()
+    for idx in sorted(keep):
+        cell, lines, stmt = parsed[idx]
+        kept_lines.setdefault(cell, (lines, set()))[1].update(_statement_lines(stmt))
+    chunks = [f"# --- cell {cell} ---\n" + "\n".join(lines[n - 1] for n in sorted(numbers))
+              for cell, (lines, numbers) in kept_lines.items()]
+
+    missing = tuple(n for n in names if n not in binders)
+    return Extract("\n\n".join(chunks) + "\n" if chunks else "", names, missing, len(keep), len(parsed), skipped)
+
+def extract_file(path: str, names: Iterable[str]) -> Extract:
+    return extract(read_cells(path), names)
+
+
+# ----------  COMPILED-CODE CACHE ----------
+_code_cache: "OrderedDict[str, CodeType]" = OrderedDict()
+_code_lock = threading.Lock()
+
+def compile_cached(source: str, filename: str = "<student>") -> CodeType:
+    """compile(source, filename, "exec"), reusing the code object for source seen before in this process."""
+    key = hashlib.sha256(f"{filename}\0{source}".encode("utf-8", "surrogatepass")).hexdigest()
+    with _code_lock:
+        code = _code_cache.get(key)
+        if code is not None:
+            _code_cache.move_to_end(key)
+            return code
+    code = compile(source, filename, "exec")
+    with _code_lock:
+        _code_cache[key] = code
+        while len(_code_cache) > _MAX_CODE:
+            _code_cache.popitem(last=False)
+    return code
+
+def load_names(path: str, names: Iterable[str]) -> Dict[str, Any]:
+    """Extract `names` from `path`, run only the kept statements, and return {name: value}."""
+    ex = extract_file(path, names)
+    if ex.missing:
+        raise NameError(f"{path} does not define {', '.join(ex.missing)}.")
+    ns: Dict[str, Any] = {"__name__": "__student__"}
+    exec(compile_cached(ex.source, path), ns)
+    return {n: ns[n] for n in ex.names}
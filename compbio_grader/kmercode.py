@@ -0,0 +1,179 @@
+# compbio_grader/kmercode.py
+"""
+2-bit integer codes for k-mers: A=0, C=1, G=2, T=3, first base in the high bits.
+
+With this layout the complement of a base is `code ^ 3`, and lexicographic
+order of k-mers equals numeric order of their codes, so sorted code arrays
+compare exactly like sorted string lists.  k is limited to 32 (one uint64).
+"""
+from array import array
+from typing import Iterable, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+MAX_K = 32
+BASES = "ACGT"
+
+_TO_DIGITS = str.maketrans("ACGT", "0123")
+_NOT_ACGT = str.maketrans("", "", "ACGT")  # deletes ACGT; anything left over is another character
+_TO_DIGIT_BYTES = bytes.maketrans(b"ACGT", b"\x00\x01\x02\x03")
+
+
+def encode_kmer(kmer: str) -> int:
+    """ACGT string → 2-bit code (raises ValueError on any other character, including lower case)."""
+    if not kmer:
+        return 0
+    if kmer.translate(_NOT_ACGT):   # checked before translating, so digits in the input never pass for bases
+        raise ValueError(f"Not an ACGT k-mer: {kmer!r}")
+    return int(kmer.translate(_TO_DIGITS), 4)
+
+
+def decode_kmer(code: int, k: int) -> str:
+    """2-bit code → ACGT string of length k."""
+    return "".join(BASES[(code >> (2 * (k - 1 - i))) & 3] for i in range(k))
+
+
+def encode_kmers(kmers: Iterable[str]) -> List[int]:
+    return [encode_kmer(p) for p in kmers]
+
+
+def mask(k: int) -> int:
+    """All 2k low bits set."""
+    return (1 << (2 * k)) - 1
+
+
+# ----------  BULK ENCODING / COMPARISON ----------
+class KmerFormatError(ValueError):
+    """
+    A submitted k-mer list failed validation.  `index` points at the first
+    offending entry; `kind` is "type", "length" or "alphabet".
+    """
+
+    def __init__(self, index: int, kind: str, reason: str):
+        super().__init__(f"entry {index}: {reason}")
+        self.index = index
+        self.kind = kind
+        self.reason = reason
+
+
+if np is not None:
+    _LUT = np.full(256, 255, dtype=np.uint8)
+    for _i, _b in enumerate(b"ACGT"):
+        _LUT[_b] = _i
+
+
+def encode_kmer_array(kmers: Sequence[str], k: int):
+    """
+    Encode a list of k-mers into one uint64 array (NumPy) or `array('Q')`.
+    Length and alphabet are validated for all entries at once; raises KmerFormatError.
+    """
+    if not 0 < k <= MAX_K:
+        raise ValueError(f"k must be in 1..{MAX_K}")
+    kmers = kmers if isinstance(kmers, (list, tuple)) else list(kmers)
+    n = len(kmers)
+    for i, p in enumerate(kmers):
+        if not isinstance(p, str):
+            raise KmerFormatError(i, "type", f"not a string ({type(p).__name__})")
+    if np is None:
+        out = array("Q")
+        for i, p in enumerate(kmers):
+            if len(p) != k:
+                raise KmerFormatError(i, "length", f"length {len(p)} != {k}")
+            try:
+                out.append(encode_kmer(p))
+            except ValueError:
+                raise KmerFormatError(i, "alphabet", "non-ACGT character") from None
+        return out
+    lengths = np.fromiter(map(len, kmers), dtype=np.int64, count=n)
+    bad = np.flatnonzero(lengths != k)
+    if bad.size:
+        i = int(bad[0])
+        raise KmerFormatError(i, "length", f"length {int(lengths[i])} != {k}")
+    joined = "".join(kmers)
+    if not joined.isascii():
+        i = next(i for i, p in enumerate(kmers) if not p.isascii())
+        raise KmerFormatError(i, "alphabet", "non-ACGT character")
+    digits = _LUT[np.frombuffer(joined.encode("ascii"), dtype=np.uint8)]
+    bad = np.flatnonzero(digits == 255)
+    if bad.size:
+        raise KmerFormatError(int(bad[0]) // k, "alphabet", "non-ACGT character")
+    weights = np.uint64(4) ** np.arange(k - 1, -1, -1, dtype=np.uint64)
+    return (digits.reshape(n, k).astype(np.uint64) * weights).sum(axis=1, dtype=np.uint64)
+
+
+def encode_text(text: str, k: int):
+    """
+    Codes of every overlapping k-mer of an ACGT text, in order: one uint64 array
+    (NumPy) or `array('Q')` of length len(text) - k + 1.  Raises ValueError on any
+    other character.
+    """
+    if not 0 < k <= MAX_K:
+        raise ValueError(f"k must be in 1..{MAX_K}")
+    try:
+        raw = text.encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError("Text is not ACGT.") from None
+    n = max(len(raw) - k + 1, 0)
+    if np is not None:
+        digits = _LUT[np.frombuffer(raw, dtype=np.uint8)]
+        if digits.size and digits.max() == 255:
+            raise ValueError("Text is not ACGT.")
+        codes = np.zeros(n, dtype=np.uint64)
+        if n:
+            for j in range(k):     # k vectorized passes instead of n Python steps
+                codes <<= np.uint64(2)
+                codes |= digits[j:j + n]
+        return codes
+    if raw.translate(None, b"ACGT"):
+        raise ValueError("Text is not ACGT.")
+    digits = raw.translate(_TO_DIGIT_BYTES)
+    out = array("Q")
+    m = mask(k)
+    code = 0
+    for i, b in enumerate(digits):
+        code = ((code << 2) | b) & m
+        if i >= k - 1:
+            out.append(code)
+    return out
+
+
+def sort_codes(codes):
+    if np is not None and isinstance(codes, np.ndarray):
+        return np.sort(codes)
+    return array("Q", sorted(codes))
+
+
+def has_duplicate_codes(sorted_codes) -> bool:
+    if np is not None and isinstance(sorted_codes, np.ndarray):
+        return bool(sorted_codes.size > 1 and np.any(sorted_codes[1:] == sorted_codes[:-1]))
+    return any(a == b for a, b in zip(sorted_codes, sorted_codes[1:]))
+
+
+def codes_equal(a, b) -> bool:
+    if len(a) != len(b):
+        return False
+    if np is not None and (isinstance(a, np.ndarray) or isinstance(b, np.ndarray)):
+        return bool(np.array_equal(np.asarray(a, dtype=np.uint64), np.asarray(b, dtype=np.uint64)))
+    return a == b
+
+
+def kmer_multisets_equal(expected: Sequence[str], got: Iterable[str], k: int) -> bool:
+    """
+    sorted(got) == sorted(expected), computed on 2-bit codes: each side is encoded
+    and sorted once.  Falls back to string sorting when k is out of the 2-bit range.
+    """
+    got = got if isinstance(got, (list, tuple)) else list(got)
+    if len(got) != len(expected):
+        return False
+    if not got:
+        return True
+    if not 0 < k <= MAX_K:
+        return sorted(got) == sorted(expected)
+    try:
+        g = encode_kmer_array(got, k)
+    except KmerFormatError:
+        return False
+    return codes_equal(sort_codes(g), sort_codes(encode_kmer_array(expected, k)))
@@ -0,0 +1,88 @@
+# compbio_grader/memo.py
+"""
+Session memo for function-taking checks.
+
+Re-running `check_neighbors(Neighbors)` with unchanged code returns the
+previous verdict instantly and replays what the check printed.  The key is
+the check's `exercise_fingerprint` (its code, hidden cases and the reference
+data version), the profiling and memory-tracking switches, and the strict
+`function_fingerprint` of the student's function (bytecode, constants,
+closure values and referenced globals, see `fingerprint.py`) and of any
+extra arguments.  Redefining the function — or a helper or global it uses —
+or changing the reference data invalidates the entry automatically.
+Functions or arguments that cannot be hashed by value (including anything
+that reaches an object with only a default repr) are never memoized.
+
+Set COMPBIO_GRADER_MEMO=0 to disable.
+"""
+import functools
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Tuple
+
+from .capture import thread_sink
+from .fingerprint import exercise_fingerprint, submission_fingerprint
+from .profiling import memory_tracking_enabled, profiling_enabled
+
+_MAX_ENTRIES = 256
+
+_memo: "OrderedDict[Tuple, Tuple[Any, str]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def memo_enabled() -> bool:
+    return os.getenv("COMPBIO_GRADER_MEMO", "1").strip().lower() not in ("0", "false", "no", "off")
+
+def clear_memo() -> None:
+    with _lock:
+        _memo.clear()
+
+def _memo_key(check: Callable, fn: Any, args, kwargs) -> Optional[Tuple]:
+    # Profiled and unprofiled runs print different output, and memory budgets
+    # change verdicts, so each combination is memoized apart.
+    parts = [f"{check.__module__}.{check.__qualname__}", profiling_enabled(), memory_tracking_enabled()]
+    for value in (fn, *args, *(v for _, v in sorted(kwargs.items()))):
+        fp = submission_fingerprint(value, strict=True)
+        if fp is None:
+            return None
+        parts.append(fp)
+    parts.extend(sorted(kwargs))
+    exercise = exercise_fingerprint(check, args, kwargs)
+    if exercise is None:
+        return None
+    parts.append(exercise)
+    return tuple(parts)
+
+
+def session_memo(check: Callable[..., Tuple[bool, Any]]) -> Callable[..., Tuple[bool, Any]]:
+    """Decorator for `check(fn, ...)`: reuse the verdict and output while `fn` is unchanged."""
+
+    @functools.wraps(check)
+    def wrapper(fn, *args, **kwargs):
+        key = _memo_key(check, fn, args, kwargs) if memo_enabled() else None
+        if key is not None:
+            with _lock:
+                hit = _memo.get(key)
+                if hit is not None:
+                    _memo.move_to_end(key)
+            if hit is not None:
+                result, output = hit
+                print(output, end="")
+                return result
+        printed: List[str] = []
+
+        def tee(text: str) -> None:
+            printed.append(text)
+            downstream(text)
+
+        with thread_sink(tee) as downstream:
+            result = check(fn, *args, **kwargs)
+        if key is not None:
+            with _lock:
+                _memo[key] = (result, "".join(printed))
+                while len(_memo) > _MAX_ENTRIES:
+                    _memo.popitem(last=False)
+        return result
+
+    return wrapper
@@ -0,0 +1,145 @@
+# compbio_grader/multipattern.py
+"""
+Aho–Corasick automaton: every occurrence of every pattern in one pass.
+
+Searching a genome for a set of patterns (all DnaA-box variants, a pattern
+and its reverse complement, the whole d-neighborhood of a motif) one
+`str.find` scan per pattern costs len(patterns) passes.  `PatternAutomaton`
+builds a trie of the patterns with failure links, then flattens it into a
+dense transition table (one row per trie node, one column per character of
+the patterns' alphabet), so the scan is a single linear walk with one list
+lookup per base, and overlapping hits of different patterns are all reported.
+
+    auto = PatternAutomaton(with_reverse_complements(["ATGATCAAG"]))
+    auto.find_all(genome)            # {"ATGATCAAG": [...], "CTTGATCAT": [...]}
+    auto.positions(genome)           # sorted starts where any pattern occurs
+    auto.count_all(genome)
+
+    PatternAutomaton(neighborhood("ATGATCAAG", 1)).positions(genome)
+
+Patterns must be non-empty ASCII strings; matching is case-sensitive, like
+`str.find`.
+"""
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Sequence, Tuple
+
+from .ori import _neighbors
+from .revcomp import reverse_complement_many
+
+
+class Match(NamedTuple):
+    start: int
+    pattern: str
+
+
+def with_reverse_complements(patterns: Iterable[str]) -> List[str]:
+    """The patterns followed by their reverse complements, without duplicates (palindromes appear once)."""
+    patterns = list(patterns)
+    return list(dict.fromkeys(patterns + reverse_complement_many(patterns)))
+
+def neighborhood(pattern: str, d: int) -> List[str]:
+    """Every ACGT string within Hamming distance `d` of `pattern`, sorted."""
+    return sorted(_neighbors(pattern, d))
+
+
+class PatternAutomaton:
+    """Aho–Corasick automaton over a fixed set of patterns; scans are O(len(text) + hits)."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: Tuple[str, ...] = tuple(dict.fromkeys(patterns))
+        if not self.patterns:
+            raise ValueError("At least one pattern is required.")
+        for p in self.patterns:
+            if not isinstance(p, str) or not p or not p.isascii():
+                raise ValueError(f"Patterns must be non-empty ASCII strings, got {p!r}.")
+        alphabet = sorted({ch for p in self.patterns for ch in p})
+        self.width = len(alphabet) + 1               # last column: any character outside the alphabet
+        # bytes → column index; bytes not in any pattern map to the "other" column
+        self._columns = bytes(alphabet.index(chr(b)) if chr(b) in alphabet else len(alphabet)
+                              for b in range(256))
+
+        # Trie: children[node][column], -1 where there is no edge.
+        children: List[List[int]] = [[-1] * self.width]
+        ends: List[List[int]] = [[]]
+        for idx, p in enumerate(self.patterns):
+            node = 0
+            for col in p.encode("ascii").translate(self._columns):
+                nxt = children[node][col]
+                if nxt == -1:
+                    nxt = len(children)
+                    children[node][col] = nxt
+                    children.append([-1] * self.width)
+                    ends.append([])
+                node = nxt
+            ends[node].append(idx)
+
+        # Breadth-first: failure links, inherited outputs, and the dense transition table.
+        fail = [0] * len(children)
+        delta = [0] * (len(children) * self.width)
+        queue = deque()
+        for col, child in enumerate(children[0]):
+            if child == -1:
+                delta[col] = 0
+            else:
+                delta[col] = child
+                queue.append(child)
+        while queue:
+            node = queue.popleft()
+            ends[node].extend(ends[fail[node]])
+            row, fail_row = node * self.width, fail[node] * self.width
+            for col, child in enumerate(children[node]):
+                if child == -1:
+                    delta[row + col] = delta[fail_row + col]
+                else:
+                    delta[row + col] = child
+                    fail[child] = delta[fail_row + col]
+                    queue.append(child)
+        self._delta = delta
+        self._ends: List[Tuple[int, ...]] = [tuple(e) for e in ends]
+        self._lengths = [len(p) for p in self.patterns]
+
+    @property
+    def states(self) -> int:
+        return len(self._ends)
+
+    def _hits(self, text: str) -> Iterator[Tuple[int, int]]:
+        """(end index, pattern index) for every occurrence, in order of end index."""
+        codes = text.encode("ascii", "replace").translate(self._columns)
+        delta, ends, width = self._delta, self._ends, self.width
+        state = 0
+        for i, col in enumerate(codes):
+            state = delta[state * width + col]
+            if ends[state]:
+                for idx in ends[state]:
+                    yield i, idx
+
+    def iter_matches(self, text: str) -> Iterator[Match]:
+        """Every occurrence of every pattern, ordered by where it ends."""
+        lengths, patterns = self._lengths, self.patterns
+        for i, idx in self._hits(text):
+            yield Match(i - lengths[idx] + 1, patterns[idx])
+
+    def find_all(self, text: str) -> Dict[str, List[int]]:
+        """pattern → ascending start positions (0-based, overlaps included)."""
+        found: Dict[str, List[int]] = {p: [] for p in self.patterns}
+        lists = [found[p] for p in self.patterns]
+        lengths = self._lengths
+        for i, idx in self._hits(text):
+            lists[idx].append(i - lengths[idx] + 1)
+        return found
+
+    def count_all(self, text: str) -> Dict[str, int]:
+        counts = [0] * len(self.patterns)
+        for _, idx in self._hits(text):
+            counts[idx] += 1
+        return dict(zip(self.patterns, counts))
+
+    def positions(self, text: str) -> List[int]:
+        """Sorted distinct start positions where at least one pattern occurs."""
+        lengths = self._lengths
+        return sorted({i - lengths[idx] + 1 for i, idx in self._hits(text)})
+
+
+def find_all(text: str, patterns: Sequence[str]) -> Dict[str, List[int]]:
+    """Start positions of each pattern in `text` (one pass for all of them)."""
+    return PatternAutomaton(patterns).find_all(text)
@@ -0,0 +1,319 @@
+# compbio_grader/oracle.py
+"""
+Frozen reference implementations ("oracles") and a differential harness.
+
+The functions below are verbatim copies of the original, deliberately naive
+`_ref_*` functions from checks.py / checks2.py (plus window-by-window
+definitions of the clump and ori-window problems, which had none).  They are
+never optimized: they define the expected answers.  Faster engines are registered as
+alternatives for a problem and cross-validated against the oracle on
+random inputs of increasing size:
+
+    register_alternative("frequency_table", my_fast_table)
+    print_report(differential(sizes=(100, 1_000, 10_000)))
+
+or offline from the shell:
+
+    compbio_grader oracle --sizes 100 1000 10000 --trials 3
+
+The engines that currently back the checks are registered on first use.
+"""
+import random
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+
+# ----------  FROZEN ORACLES (do not optimize) ----------
+def pattern_count(dna: str, pattern: str) -> int:
+    k = len(pattern)
+    return sum(1 for i in range(len(dna) - k + 1) if dna[i:i+k] == pattern)
+
+def frequency_table(dna: str, k: int) -> Dict[str, int]:
+    n = len(dna)
+    freq: Dict[str, int] = {}
+    if k <= 0:
+        return {}
+    for i in range(n - k + 1):
+        pat = dna[i:i+k]
+        freq[pat] = freq.get(pat, 0) + 1
+    return freq
+
+def maxmap(freqMap: Dict[str, int]) -> int:
+    if not freqMap:
+        return 0
+    return max(freqMap.values())
+
+def frequent_words(dna: str, k: int) -> List[str]:
+    freq = frequency_table(dna, k)
+    if not freq:
+        return []
+    m = maxmap(freq)
+    return sorted([p for p, c in freq.items() if c == m])
+
+def reverse_complement(pattern: str) -> str:
+    comp = {"A": "T", "T": "A", "G": "C", "C": "G"}
+    try:
+        rc = "".join(comp[b] for b in reversed(pattern.upper()))
+    except KeyError:
+        rc = "".join(comp.get(b, b) for b in reversed(pattern.upper()))
+    return rc
+
+def reverse_complements(kmers: Sequence[str]) -> List[str]:
+    return [reverse_complement(p) for p in kmers]
+
+def pattern_matching(DNA: str, pattern: str) -> List[int]:
+    k = len(pattern)
+    return [i for i in range(len(DNA) - k + 1) if DNA[i:i+k] == pattern]
+
+def multi_pattern_matching(DNA: str, patterns: Sequence[str]) -> List[int]:
+    """Starts of any of the patterns, one pattern_matching scan per pattern."""
+    return sorted({i for p in patterns for i in pattern_matching(DNA, p)})
+
+def clump_kmers(genome: str, k: int, L: int, t: int) -> Set[str]:
+    """Distinct k-mers occurring >= t times in some window of length L, recounting every window."""
+    found: Set[str] = set()
+    for s in range(len(genome) - L + 1):
+        for p, c in frequency_table(genome[s:s+L], k).items():
+            if c >= t:
+                found.add(p)
+    return found
+
+def skew_values(genome: str) -> List[int]:
+    vals = [0]
+    skew = 0
+    for ch in genome:
+        if ch == "G":
+            skew += 1
+        elif ch == "C":
+            skew -= 1
+        vals.append(skew)
+    return vals
+
+def hamming(a: str, b: str) -> int:
+    return sum(x != y for x, y in zip(a, b))
+
+def approximate_pattern_matching(pattern: str, text: str, d: int) -> List[int]:
+    k = len(pattern)
+    return [i for i in range(len(text) - k + 1) if hamming(pattern, text[i:i+k]) <= d]
+
+def neighbors(pattern: str, d: int):
+    alphabet = ("A", "C", "G", "T")
+    if d == 0:
+        return [pattern]
+    if len(pattern) == 1:
+        return list(alphabet)
+    neighborhood = set()
+    suffix_neighbors = neighbors(pattern[1:], d)
+    for text in suffix_neighbors:
+        if hamming(pattern[1:], text) < d:
+            for x in alphabet:
+                neighborhood.add(x + text)
+        else:
+            neighborhood.add(pattern[0] + text)
+    return sorted(neighborhood)
+
+def frequent_words_approx(Text: str, k: int, d: int) -> List[str]:
+    counts: Dict[str, int] = defaultdict(int)
+    for i in range(len(Text) - k + 1):
+        kmer = Text[i:i+k]
+        for neigh in neighbors(kmer, d):
+            counts[neigh] += 1
+    if not counts:
+        return []
+    maxc = max(counts.values())
+    return sorted([p for p, c in counts.items() if c == maxc])
+
+def _rc(s: str) -> str:
+    return s.translate(str.maketrans("ACGT", "TGCA"))[::-1]
+
+def frequent_words_with_rc(Text: str, k: int, d: int) -> List[str]:
+    n = len(Text)
+    if k <= 0 or d < 0 or n < k:
+        return []
+    counts: Dict[str, int] = defaultdict(int)
+    for i in range(n - k + 1):
+        kmer = Text[i:i+k]
+        for neigh in neighbors(kmer, d):
+            counts[neigh] += 1
+    if not counts:
+        return []
+    scores: Dict[str, int] = {}
+    for p, c in counts.items():
+        scores[p] = c + counts.get(_rc(p), 0)
+    maxs = max(scores.values())
+    return sorted({p for p, s in scores.items() if s == maxs})
+
+def ori_windows(genome: str, L: int, k: int, d: int) -> List[List[str]]:
+    """frequent_words_with_rc in every window of length L."""
+    return [frequent_words_with_rc(genome[s:s+L], k, d) for s in range(len(genome) - L + 1)]
+
+
+# ----------  PROBLEMS ----------
+class Problem(NamedTuple):
+    name: str
+    oracle: Callable[..., Any]
+    make_args: Callable[[random.Random, int], Tuple]   # (rng, size) -> oracle arguments
+    normalize: Callable[[Any], Any] = lambda out: out
+
+
+def _dna(rng: random.Random, n: int, alphabet: str = "ACGT") -> str:
+    return "".join(rng.choice(alphabet) for _ in range(n))
+
+def _planted(rng: random.Random, n: int, pattern: str) -> str:
+    """Random DNA with `pattern` planted at a few spots, so matches and overlaps actually occur."""
+    s = list(_dna(rng, n))
+    for _ in range(max(1, n // 50)):
+        if n >= len(pattern):
+            i = rng.randrange(n - len(pattern) + 1)
+            s[i:i + len(pattern)] = pattern
+    return "".join(s)
+
+def _as_dict(out: Any) -> Dict[str, int]:
+    return dict(out.items())
+
+def _as_sorted(out: Iterable[Any]) -> List[Any]:
+    return sorted(out)
+
+def _as_ints(out: Iterable[Any]) -> List[int]:
+    return [int(v) for v in out]
+
+
+PROBLEMS: Dict[str, Problem] = {p.name: p for p in (
+    Problem("pattern_count", pattern_count, lambda r, n: (_planted(r, n, "ATAT"), "ATAT")),
+    Problem("frequency_table", frequency_table, lambda r, n: (_dna(r, n), r.randint(1, 8)), _as_dict),
+    Problem("frequent_words", frequent_words, lambda r, n: (_dna(r, n), r.randint(1, 6))),
+    Problem("reverse_complement", reverse_complement, lambda r, n: (_dna(r, n, "ACGTacgtN"),)),
+    Problem("reverse_complements", reverse_complements,
+            lambda r, n: ([_dna(r, 9) for _ in range(max(1, n // 9))],)),
+    Problem("pattern_matching", pattern_matching, lambda r, n: (_planted(r, n, "ACAC"), "ACAC"), _as_ints),
+    Problem("multi_pattern_matching", multi_pattern_matching,
+            lambda r, n: (_planted(r, n, "ATGATCAAG"), ["ATGATCAAG", "CTTGATCAT", "ATGAT", "GATCA", "TCA"]), _as_ints),
+    Problem("clump_kmers", clump_kmers, lambda r, n: (_dna(r, n), 3, min(n, 40), 3), _as_sorted),
+    Problem("skew_values", skew_values, lambda r, n: (_dna(r, n, "ACGTN"),), _as_ints),
+    Problem("approximate_pattern_matching", approximate_pattern_matching,
+            lambda r, n: ("ATTCTGGA", _planted(r, n, "ATTCTGGA"), r.randint(0, 3)), _as_ints),
+    Problem("neighbors", neighbors, lambda r, n: (_dna(r, min(3 + n.bit_length() // 3, 10)), r.randint(0, 2)), _as_sorted),
+    Problem("frequent_words_approx", frequent_words_approx, lambda r, n: (_dna(r, n), 4, 1), _as_sorted),
+    Problem("frequent_words_with_rc", frequent_words_with_rc, lambda r, n: (_dna(r, n), 4, 1), _as_sorted),
+    Problem("ori_windows", ori_windows, lambda r, n: (_dna(r, n), min(n, 60), 3, 1), list),
+)}
+
+_ALTERNATIVES: Dict[str, Dict[str, Callable[..., Any]]] = defaultdict(dict)
+_builtins_loaded = False
+
+
+def register_alternative(problem: str, fn: Callable[..., Any], name: Optional[str] = None) -> None:
+    """Register `fn` (same signature as the oracle) as an implementation of `problem`."""
+    if problem not in PROBLEMS:
+        raise KeyError(f"Unknown problem '{problem}'. Known: {', '.join(sorted(PROBLEMS))}")
+    _ALTERNATIVES[problem][name or getattr(fn, "__qualname__", repr(fn))] = fn
+
+def _load_builtin_alternatives() -> None:
+    """The engines the checks use today."""
+    global _builtins_loaded
+    if _builtins_loaded:
+        return
+    _builtins_loaded = True
+    from . import checks, checks2, hamming, multipattern, ori, revcomp, skew
+
+    register_alternative("pattern_count", checks._ref_pattern_count, "checks._ref_pattern_count")
+    register_alternative("frequent_words", checks._ref_frequent_words, "checks._ref_frequent_words")
+    register_alternative("reverse_complement", revcomp.reverse_complement, "revcomp.reverse_complement")
+    register_alternative("reverse_complements", revcomp.reverse_complement_many, "one joined translate")
+    register_alternative("pattern_matching", checks._ref_pattern_stream, "str.find stream")
+    register_alternative("multi_pattern_matching", lambda g, ps: multipattern.PatternAutomaton(ps).positions(g),
+                         "Aho-Corasick")
+    register_alternative("clump_kmers", checks._ref_clump_kmers, "sliding window")
+    register_alternative("skew_values", skew.skew_array, "skew.skew_array")
+    register_alternative("approximate_pattern_matching", hamming.approximate_positions, "bit-sliced counters")
+    register_alternative("approximate_pattern_matching",
+                         lambda p, t, d: [i for i, x in enumerate(hamming.hamming_to_genome(p, t)) if x <= d],
+                         "2-bit XOR + popcount")
+    register_alternative("neighbors", ori._neighbors, "ori._neighbors (BFS)")
+    register_alternative("frequent_words_with_rc", checks2._ref_frequent_words_with_rc, "batched revcomp")
+    register_alternative("ori_windows",
+                         lambda g, L, k, d: [w for _, w in ori.sliding_frequent_with_rc(g, L, k, d)],
+                         "SlidingMotifCounter")
+
+def alternatives(problem: str) -> Dict[str, Callable[..., Any]]:
+    _load_builtin_alternatives()
+    return dict(_ALTERNATIVES.get(problem, {}))
+
+
+# ----------  DIFFERENTIAL HARNESS ----------
+class DiffResult(NamedTuple):
+    problem: str
+    alternative: str
+    size: int
+    trials: int
+    agreed: int
+    oracle_seconds: float
+    alternative_seconds: float
+    failure: Optional[str] = None      # first disagreement or crash, if any
+
+    @property
+    def speedup(self) -> float:
+        return self.oracle_seconds / self.alternative_seconds if self.alternative_seconds > 0 else float("inf")
+
+
+def _timed(fn: Callable[..., Any], args: Tuple) -> Tuple[Any, float]:
+    t0 = time.perf_counter()
+    out = fn(*args)
+    if hasattr(out, "__next__"):
+        out = list(out)  # lazy engines pay for their work inside the timed region
+    return out, time.perf_counter() - t0
+
+def _short(value: Any, limit: int = 80) -> str:
+    text = repr(value)
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def differential(problems: Optional[Sequence[str]] = None, *, sizes: Sequence[int] = (100, 1000, 10000),
+                 trials: int = 3, seed: int = 0) -> List[DiffResult]:
+    """
+    Run every registered alternative against the oracle on `trials` random
+    inputs per size; the same inputs (from `seed`) feed both sides.
+    """
+    _load_builtin_alternatives()
+    results: List[DiffResult] = []
+    for name in (problems or sorted(PROBLEMS)):
+        problem = PROBLEMS[name]
+        for alt_name, alt in alternatives(name).items():
+            for size in sizes:
+                rng = random.Random(f"{seed}:{name}:{size}")
+                agreed = 0
+                t_oracle = t_alt = 0.0
+                failure = None
+                for trial in range(trials):
+                    args = problem.make_args(rng, size)
+                    expected, dt = _timed(problem.oracle, args)
+                    t_oracle += dt
+                    try:
+                        got, dt = _timed(alt, args)
+                        t_alt += dt
+                        got = problem.normalize(got)
+                    except Exception as e:
+                        failure = failure or f"trial {trial}: {type(e).__name__}: {e}"
+                        continue
+                    if problem.normalize(expected) == got:
+                        agreed += 1
+                    elif failure is None:
+                        failure = (f"trial {trial} args={_short(args)}: "
+                                   f"expected {_short(problem.normalize(expected))}, got {_short(got)}")
+                results.append(DiffResult(name, alt_name, size, trials, agreed, t_oracle, t_alt, failure))
+    return results
+
+
+def print_report(results: Sequence[DiffResult]) -> bool:
+    """Print agreement and speedup side by side; True if every alternative agreed everywhere."""
+    print(f"{'problem':<24} {'alternative':<28} {'size':>8} {'agree':>7} {'oracle s':>10} {'alt s':>10} {'speedup':>8}")
+    ok = True
+    for r in results:
+        mark = "✅" if r.agreed == r.trials else "❌"
+        ok = ok and r.agreed == r.trials
+        print(f"{r.problem:<24} {r.alternative:<28} {r.size:>8} {r.agreed:>3}/{r.trials:<3} "
+              f"{r.oracle_seconds:>10.4f} {r.alternative_seconds:>10.4f} {r.speedup:>7.1f}x {mark}")
+        if r.failure:
+            print(f"    {r.failure}")
+    return ok
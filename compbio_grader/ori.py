@@ -0,0 +1,125 @@
+# compbio_grader/ori.py
+"""
+Sliding-window reference for the "most frequent k-mers with mismatches and
+reverse complements" problem, evaluated in every window along a genome.
+
+Instead of recounting each window from scratch, `SlidingMotifCounter`
+keeps Count_d for every pattern and updates it as the window slides by one
+base: the outgoing k-mer's d-neighborhood is decremented and the incoming
+one's incremented.  Scores (Count_d(p) + Count_d(rc(p))) live in buckets
+keyed by score, so the running maximum moves by at most a few steps per
+slide and the winners are read straight from the top bucket.
+"""
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .revcomp import reverse_complement_many
+
+_ALPHABET = "ACGT"
+
+
+@lru_cache(maxsize=1 << 16)
+def _neighbors(pattern: str, d: int) -> Tuple[str, ...]:
+    """All strings within Hamming distance d of `pattern` (cached: every k-mer enters and leaves once)."""
+    if d == 0:
+        return (pattern,)
+    out = {pattern}
+    frontier = {pattern}
+    for _ in range(d):
+        nxt = set()
+        for p in frontier:
+            for i, ch in enumerate(p):
+                for x in _ALPHABET:
+                    if x != ch:
+                        nxt.add(p[:i] + x + p[i+1:])
+        nxt -= out
+        out |= nxt
+        frontier = nxt
+    return tuple(out)
+
+
+@lru_cache(maxsize=1 << 16)
+def _neighbors_with_rc(kmer: str, d: int) -> Tuple[Tuple[str, str], ...]:
+    """(neighbor, reverse complement) pairs, complemented in one batched translate."""
+    neigh = _neighbors(kmer, d)
+    return tuple(zip(neigh, reverse_complement_many(neigh)))
+
+
+class SlidingMotifCounter:
+    """Count_d and RC-combined scores for a multiset of k-mers that changes one k-mer at a time."""
+
+    def __init__(self, k: int, d: int):
+        self.k = k
+        self.d = d
+        self.counts: Dict[str, int] = {}
+        self.scores: Dict[str, int] = {}
+        self.buckets: Dict[int, Set[str]] = defaultdict(set)
+        self.max_score = 0
+
+    def _bump(self, p: str, delta: int) -> None:
+        old = self.scores.get(p, 0)
+        new = old + delta
+        if old:
+            bucket = self.buckets[old]
+            bucket.discard(p)
+            if not bucket:
+                del self.buckets[old]
+        if new:
+            self.scores[p] = new
+            self.buckets[new].add(p)
+            if new > self.max_score:
+                self.max_score = new
+        else:
+            del self.scores[p]
+
+    def _update(self, kmer: str, delta: int) -> None:
+        counts = self.counts
+        for n, rc in _neighbors_with_rc(kmer, self.d):
+            c = counts.get(n, 0) + delta
+            if c:
+                counts[n] = c
+            else:
+                del counts[n]
+            # score(n) and score(rc(n)) both include Count_d(n); a palindrome gets both bumps
+            self._bump(n, delta)
+            self._bump(rc, delta)
+        while self.max_score and self.max_score not in self.buckets:
+            self.max_score -= 1
+
+    def add(self, kmer: str) -> None:
+        self._update(kmer, +1)
+
+    def remove(self, kmer: str) -> None:
+        self._update(kmer, -1)
+
+    def winners(self) -> List[str]:
+        """Patterns with the maximal score, restricted (like the reference) to those with Count_d > 0."""
+        if not self.max_score:
+            return []
+        return sorted(p for p in self.buckets[self.max_score] if p in self.counts)
+
+
+def sliding_frequent_with_rc(genome: str, L: int, k: int, d: int,
+                             start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[int, List[str]]]:
+    """
+    Yield (s, winners) for every window genome[s:s+L] with start <= s < stop,
+    where winners == _ref_frequent_with_rc(genome[s:s+L], k, d).
+    """
+    last = len(genome) - L + 1
+    stop = last if stop is None else min(stop, last)
+    start = max(start, 0)
+    if start >= stop:
+        return
+    if k <= 0 or d < 0 or L < k:
+        for s in range(start, stop):
+            yield s, []
+        return
+    counter = SlidingMotifCounter(k, d)
+    for i in range(start, start + L - k + 1):
+        counter.add(genome[i:i+k])
+    yield start, counter.winners()
+    for s in range(start + 1, stop):
+        counter.remove(genome[s-1:s-1+k])
+        counter.add(genome[s+L-k:s+L])
+        yield s, counter.winners()
@@ -0,0 +1,265 @@
+# compbio_grader/profiling.py
+"""
+Hotspot feedback for slow or failing student functions.
+
+Checks call the student's function through a `StudentProfiler`, which runs
+cProfile around the call while a small time budget lasts (2 s by default)
+and then stops profiling, so the overhead is bounded no matter how many
+hidden cases there are.  When the check fails, or the student's code was
+slow overall, the check prints where the time went:
+
+    ⏱  Where your code spent its time (1.84s in your function):
+         81%  hamming (line 3)
+         12%  <built-in method builtins.sum>
+
+and returns a `CheckResult`, a (passed, letter) tuple that also carries the
+hotspots in `.profile`.
+
+Profiling is on by default in notebooks and off in batch mode
+(`grade_batch`, sandbox workers).  COMPBIO_GRADER_PROFILE=1 / =0 forces it
+on or off everywhere.
+
+Memory tracking is opt-in, since tracemalloc slows every allocation down
+several times over.  With `memory=True` (the checks take the same keyword)
+the profiler records the peak number of bytes the student's calls allocate,
+reported as `.peak_memory` on the result.  Given a `memory_budget`, a check
+that would pass fails instead when the peak exceeds it; the genome-scale
+checks derive their budget from the reference's own peak on the same input,
+measured once per input (`reference_peak`, `memory_budget`).  The keyword is
+ignored in batch mode; COMPBIO_GRADER_MEMORY=1 / =0 forces tracking on or
+off everywhere.  tracemalloc is process-wide, so checks running
+concurrently in threads see each other's allocations (on Python 3.8, where
+the peak cannot be reset, a call made while another is being traced is not
+measured at all).
+"""
+import contextlib
+import cProfile
+import functools
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+_DEFAULT_BUDGET = 2.0       # seconds of profiled student time per check
+_DEFAULT_SLOW = 1.0         # total student seconds after which a passing check reports hotspots too
+_FAILING_MIN = 0.1          # below this a failing check's profile is noise, not feedback
+_DEFAULT_TOP = 5
+_MIN_SHARE = 0.05
+_MEMORY_SLACK = 8 * 2**20   # bytes every budget allows on top of the reference's peak
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_batch_depth = 0
+_batch_lock = threading.Lock()
+
+
+class Hotspot(NamedTuple):
+    label: str
+    seconds: float        # cumulative time, including callees
+    share: float          # of the profiled student time
+
+
+class CheckResult(tuple):
+    """(passed, letter) plus profiling details; unpacks and compares like the plain tuple."""
+
+    def __new__(cls, passed: bool, letter: Any, profile: Optional[List[Hotspot]] = None,
+                peak_memory: Optional[int] = None):
+        self = super().__new__(cls, (passed, letter))
+        self.profile = profile or []
+        self.peak_memory = peak_memory    # bytes, None when memory was not tracked
+        return self
+
+    def __getnewargs__(self):
+        return (self[0], self[1], self.profile, self.peak_memory)
+
+    @property
+    def passed(self) -> bool:
+        return self[0]
+
+    @property
+    def letter(self) -> Any:
+        return self[1]
+
+
+# ----------  ON / OFF ----------
+@contextlib.contextmanager
+def batch_mode() -> Iterator[None]:
+    """Mark the enclosed grading as batch work (no profiling unless forced by the env var)."""
+    global _batch_depth
+    with _batch_lock:
+        _batch_depth += 1
+    try:
+        yield
+    finally:
+        with _batch_lock:
+            _batch_depth -= 1
+
+def enter_batch_mode() -> None:
+    """Process-wide batch mode for long-lived grading workers."""
+    global _batch_depth
+    with _batch_lock:
+        _batch_depth += 1
+
+def profiling_enabled() -> bool:
+    env = os.getenv("COMPBIO_GRADER_PROFILE")
+    if env is not None and env.strip():
+        return env.strip().lower() not in ("0", "false", "no", "off")
+    return _batch_depth == 0
+
+def memory_tracking_enabled(requested: bool = False) -> bool:
+    """Whether to trace allocations: COMPBIO_GRADER_MEMORY if set, else `requested` outside batch mode."""
+    env = os.getenv("COMPBIO_GRADER_MEMORY")
+    if env is not None and env.strip():
+        return env.strip().lower() not in ("0", "false", "no", "off")
+    return requested and _batch_depth == 0
+
+
+# ----------  MEMORY ----------
+@contextlib.contextmanager
+def _traced_peak(out: List[int]) -> Iterator[None]:
+    """
+    Append the peak traced allocation (bytes above the starting point) of the block to `out`.
+    Appends nothing on Python < 3.9 when tracing was already on, as the peak cannot be reset there.
+    """
+    started = not tracemalloc.is_tracing()
+    if not started and not hasattr(tracemalloc, "reset_peak"):
+        yield
+        return
+    if started:
+        tracemalloc.start()
+    else:
+        tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    try:
+        yield
+    finally:
+        out.append(max(tracemalloc.get_traced_memory()[1] - base, 0))
+        if started:
+            tracemalloc.stop()
+
+def measure_peak(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[Any, Optional[int]]:
+    """(fn(*args, **kwargs), peak bytes allocated during the call, or None if it could not be measured)."""
+    peak: List[int] = []
+    with _traced_peak(peak):
+        value = fn(*args, **kwargs)
+    return value, peak[0] if peak else None
+
+@functools.lru_cache(maxsize=8)
+def _reference_peak(fn: Callable[..., Any], args: Tuple[Any, ...]) -> Optional[int]:
+    return measure_peak(fn, *args)[1]
+
+def reference_peak(fn: Callable[..., Any], *args: Any) -> Optional[int]:
+    """Peak bytes a deterministic reference allocates on `args`, measured once per distinct input."""
+    return _reference_peak(fn, args)
+
+def memory_budget(reference_peak: Optional[int], factor: float) -> Optional[int]:
+    """
+    `factor` times the reference's peak, and never less than the reference plus a
+    fixed slack; None (no budget) when the reference peak is unknown.
+    """
+    if reference_peak is None:
+        return None
+    return max(int(factor * reference_peak), reference_peak + _MEMORY_SLACK)
+
+def format_bytes(n: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.2f} GB"
+
+
+# ----------  PROFILER ----------
+def _label(key) -> str:
+    filename, lineno, func = key
+    if filename == "~":
+        return func if func.startswith("<") else f"<{func}>"
+    return f"{func} (line {lineno})"
+
+def _is_ours(filename: str) -> bool:
+    return filename.startswith(_PACKAGE_DIR)
+
+
+class StudentProfiler:
+    """Times every student call; profiles them with cProfile until `budget` seconds are used up (optionally tracks peak memory)."""
+
+    def __init__(self, enabled: Optional[bool] = None, *, budget: float = _DEFAULT_BUDGET,
+                 slow: float = _DEFAULT_SLOW, top: int = _DEFAULT_TOP, memory: bool = False,
+                 memory_budget: Optional[int] = None):
+        self.enabled = profiling_enabled() if enabled is None else enabled
+        self.budget = budget
+        self.slow = slow
+        self.top = top
+        self.track_memory = memory_tracking_enabled(memory)
+        self.memory_budget = memory_budget
+        self.total = 0.0              # all student time
+        self.profiled = 0.0           # student time spent under the profiler
+        self.peak_memory: Optional[int] = 0 if self.track_memory else None
+        self._entries = set()         # code objects we called directly (always ~100%, not interesting)
+        self._prof = cProfile.Profile() if self.enabled else None
+
+    def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        code = getattr(fn, "__code__", None)
+        if code is not None:
+            self._entries.add((code.co_filename, code.co_firstlineno, code.co_name))
+        profile = self._prof is not None and self.profiled < self.budget
+        peak: List[int] = []
+        try:
+            with _traced_peak(peak) if self.track_memory else contextlib.nullcontext():
+                t0 = time.perf_counter()
+                if profile:
+                    try:
+                        self._prof.enable()
+                    except ValueError:  # another profiler is active in this thread
+                        profile = False
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    if profile:
+                        self._prof.disable()
+                    dt = time.perf_counter() - t0
+                    self.total += dt
+                    if profile:
+                        self.profiled += dt
+        finally:
+            if peak:
+                self.peak_memory = max(self.peak_memory, peak[0])
+
+    def hotspots(self) -> List[Hotspot]:
+        """Top functions by cumulative time, as a share of the profiled student time."""
+        if self._prof is None or self.profiled <= 0:
+            return []
+        stats = pstats.Stats(self._prof).stats
+        rows = []
+        for key, (_, _, _, cumtime, _) in stats.items():
+            filename = key[0]
+            if key in self._entries or _is_ours(filename) or "_lsprof.Profiler" in key[2]:
+                continue
+            share = min(cumtime / self.profiled, 1.0)
+            if share >= _MIN_SHARE:
+                rows.append(Hotspot(_label(key), cumtime, share))
+        rows.sort(key=lambda h: h.seconds, reverse=True)
+        return rows[:self.top]
+
+    def over_memory_budget(self) -> bool:
+        return (self.memory_budget is not None and self.peak_memory is not None
+                and self.peak_memory > self.memory_budget)
+
+    def result(self, passed: bool, letter: Any) -> CheckResult:
+        """
+        Build the check's return value, printing hotspots when it failed or was slow.
+        A passing check fails here if the student's peak memory went over `memory_budget`.
+        """
+        if passed and self.over_memory_budget():
+            print(f"❌ Your function allocated {format_bytes(self.peak_memory)} at its peak; "
+                  f"the budget for this exercise is {format_bytes(self.memory_budget)}.")
+            print("   Avoid building every possible k-mer (4^k entries) or every neighbor list up front.")
+            passed, letter = False, [] if isinstance(letter, list) else ""
+        worth_it = self.total >= (min(_FAILING_MIN, self.slow) if not passed else self.slow)
+        spots = self.hotspots() if worth_it else []
+        if spots:
+            print(f"⏱  Where your code spent its time ({self.total:.2f}s in your function):")
+            for h in spots:
+                print(f"     {h.share:>4.0%}  {h.label}")
+        return CheckResult(passed, letter, spots, self.peak_memory)
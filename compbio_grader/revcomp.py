@@ -0,0 +1,105 @@
+# compbio_grader/revcomp.py
+"""
+Reverse-complement kernels.
+
+All variants share the semantics of the ReverseComplement exercise: input is
+upper-cased, A/C/G/T are complemented, and any other character (N, gaps, ...)
+is kept as-is.  The translation tables are built once at import time.
+
+    reverse_complement("acgtN")            -> "NACGT"
+    reverse_complement(b"ACCG")            -> b"CGGT"
+    reverse_complement_many(kmers)         -> one translate over all k-mers
+    reverse_complement_codes(codes, k)     -> on 2-bit codes, via bit tricks
+    reverse_complement_inplace(bytearray)  -> whole genomes, O(chunk) extra memory
+"""
+import string
+from typing import Iterable, List, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+from .kmercode import MAX_K, mask
+
+_PAIRS = {"A": "T", "T": "A", "C": "G", "G": "C"}
+
+# str: lower → upper, then complement ACGT
+_STR_TABLE = str.maketrans({c: _PAIRS.get(c.upper(), c.upper()) for c in string.ascii_letters})
+# bytes: same mapping on all 256 byte values
+_BYTES_TABLE = bytes(
+    ord(_PAIRS.get(chr(b).upper(), chr(b).upper())) if chr(b) in string.ascii_letters else b
+    for b in range(256)
+)
+
+_INPLACE_CHUNK = 1 << 20
+
+
+def reverse_complement(seq: Union[str, bytes, bytearray]) -> Union[str, bytes, bytearray]:
+    """Reverse complement of a str, bytes or bytearray (same type out)."""
+    if isinstance(seq, str):
+        if not seq.isascii():
+            return seq.upper().translate(_STR_TABLE)[::-1]
+        return seq.translate(_STR_TABLE)[::-1]
+    return seq.translate(_BYTES_TABLE)[::-1]
+
+
+def reverse_complement_many(kmers: Iterable[str]) -> List[str]:
+    """
+    Reverse complements of many k-mers with a single translate: the k-mers are
+    joined, translated and reversed as one string, which also reverses their order.
+    """
+    kmers = list(kmers)
+    if not kmers:
+        return []
+    joined = "\n".join(kmers)
+    if not joined.isascii():
+        return [reverse_complement(p) for p in kmers]
+    out = joined.translate(_STR_TABLE)[::-1].split("\n")
+    out.reverse()
+    return out
+
+
+def reverse_complement_inplace(buf: bytearray) -> bytearray:
+    """Reverse-complement a whole genome held in a bytearray, chunk by chunk; returns `buf`."""
+    view = memoryview(buf)
+    for i in range(0, len(buf), _INPLACE_CHUNK):
+        view[i:i + _INPLACE_CHUNK] = bytes(view[i:i + _INPLACE_CHUNK]).translate(_BYTES_TABLE)
+    view.release()
+    buf.reverse()
+    return buf
+
+
+# ----------  2-BIT CODES ----------
+_M1 = 0x3333333333333333
+_M2 = 0x0F0F0F0F0F0F0F0F
+_M3 = 0x00FF00FF00FF00FF
+_M4 = 0x0000FFFF0000FFFF
+_M64 = (1 << 64) - 1
+
+
+def reverse_complement_code(code: int, k: int) -> int:
+    """Reverse complement of a 2-bit k-mer code (k <= 32): complement is XOR 3, then reverse base order."""
+    if not 0 < k <= MAX_K:
+        raise ValueError(f"k must be in 1..{MAX_K}")
+    x = (~code) & _M64
+    x = ((x >> 2) & _M1) | ((x & _M1) << 2)
+    x = ((x >> 4) & _M2) | ((x & _M2) << 4)
+    x = ((x >> 8) & _M3) | ((x & _M3) << 8)
+    x = ((x >> 16) & _M4) | ((x & _M4) << 16)
+    x = ((x >> 32) | (x << 32)) & _M64
+    return (x >> (64 - 2 * k)) & mask(k)
+
+
+def reverse_complement_codes(codes: Union[Sequence[int], "np.ndarray"], k: int):
+    """Batched `reverse_complement_code`; vectorized over a uint64 array when NumPy is available."""
+    if np is None or not isinstance(codes, np.ndarray):
+        return [reverse_complement_code(c, k) for c in codes]
+    if not 0 < k <= MAX_K:
+        raise ValueError(f"k must be in 1..{MAX_K}")
+    x = ~codes.astype(np.uint64)
+    for shift, m in ((2, _M1), (4, _M2), (8, _M3), (16, _M4)):
+        s, m = np.uint64(shift), np.uint64(m)
+        x = ((x >> s) & m) | ((x & m) << s)
+    x = (x >> np.uint64(32)) | (x << np.uint64(32))
+    return (x >> np.uint64(64 - 2 * k)) & np.uint64(mask(k))
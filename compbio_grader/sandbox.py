@@ -0,0 +1,273 @@
+# compbio_grader/sandbox.py
+"""
+Pre-forked pool of resource-limited workers for grading student code.
+
+Each worker is a child process that has already imported `compbio_grader`
+(and anything else listed in `preload`) and loaded the genomes listed in
+`warm_genomes` from the genome registry, so a job only pays for exec-ing the
+student's source and running the check.  Workers run under resource limits
+and are recycled after `max_jobs` jobs or once their memory has grown by more
+than `max_rss_growth_mb`.  Workers are started through a fork server where
+the platform has one, so replacements can be started safely from any thread.
+
+Isolation is limited to rlimits (address space, CPU time, file size) and a
+separate process: student code can still read and write files and open
+network connections with the grader's permissions.  This protects the grader
+from runaway or crashing code, not from hostile code; run the workers in a
+container or under a dedicated account for that.
+
+    with SandboxPool(size=4) as pool:
+        res = pool.run("check_neighbors", source, "Neighbors")
+        print(res.output)
+"""
+import contextlib
+import importlib
+import io
+import multiprocessing as mp
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import resource
+except ImportError:  # non-POSIX: run without rlimits
+    resource = None
+
+_DEFAULT_MAX_JOBS = 50
+_DEFAULT_MAX_RSS_GROWTH_MB = 256
+_DEFAULT_MEMORY_LIMIT_MB = 2048
+_DEFAULT_TIMEOUT = 60.0
+
+
+class SandboxResult(NamedTuple):
+    passed: bool
+    letters: Any        # str or List[str], whatever the check awards
+    output: str         # everything the check printed
+    error: str = ""     # non-empty if the job crashed, timed out or was killed
+
+
+# ----------  WORKER SIDE ----------
+def _rss_mb() -> float:
+    """Current resident set size in MB (falls back to peak RSS)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        if resource is None:
+            return 0.0
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def _apply_limits(memory_limit_mb: Optional[int]) -> None:
+    if resource is None:
+        return
+    if memory_limit_mb:
+        limit = memory_limit_mb * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    # Student code has no business writing big files.
+    _, hard = resource.getrlimit(resource.RLIMIT_FSIZE)
+    resource.setrlimit(resource.RLIMIT_FSIZE, (16 * 1024 * 1024, hard))
+
+def _set_cpu_budget(seconds: Optional[float]) -> None:
+    """Allow `seconds` more CPU time from now; the kernel sends SIGXCPU past that."""
+    if resource is None or not seconds:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    used = usage.ru_utime + usage.ru_stime
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = int(used + seconds) + 1
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+def _run_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    import compbio_grader
+    from .ingest import compile_cached
+
+    buf = io.StringIO()
+    try:
+        check = getattr(compbio_grader, job["check"])
+        ns: Dict[str, Any] = {"__name__": "__student__"}
+        with contextlib.redirect_stdout(buf):
+            exec(compile_cached(job["source"]), ns)
+            if job["name"] not in ns:
+                raise NameError(f"Your code does not define '{job['name']}'.")
+            passed, letters = check(ns[job["name"]], *job["args"], **job["kwargs"])
+        return {"passed": bool(passed), "letters": letters, "output": buf.getvalue(), "error": ""}
+    except MemoryError:
+        return {"passed": False, "letters": "", "output": buf.getvalue(), "error": "Memory limit exceeded."}
+    except (SystemExit, KeyboardInterrupt) as e:
+        # sys.exit() or a stray interrupt in student code must not take the warm worker down.
+        return {"passed": False, "letters": "", "output": buf.getvalue(),
+                "error": f"{type(e).__name__}: your code stopped the interpreter ({e})"}
+    except Exception as e:
+        return {"passed": False, "letters": "", "output": buf.getvalue(), "error": f"{type(e).__name__}: {e}"}
+
+def _warm(genomes: Sequence[str]) -> None:
+    from .genomes import resolve_genome
+
+    for g in genomes:
+        try:
+            entry = resolve_genome(g)
+            entry.sequence()
+            entry.skew()
+        except FileNotFoundError:
+            pass
+
+def _worker_main(conn, preload: Sequence[str], warm_genomes: Sequence[str], memory_limit_mb: Optional[int]) -> None:
+    from .profiling import enter_batch_mode
+
+    enter_batch_mode()
+    for mod in preload:
+        importlib.import_module(mod)
+    _warm(warm_genomes)
+    _apply_limits(memory_limit_mb)
+    conn.send(("ready", _rss_mb()))
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if job is None:
+            break
+        _set_cpu_budget(job.get("timeout"))
+        reply = _run_job(job)
+        conn.send((reply, _rss_mb()))
+    conn.close()
+
+
+# ----------  POOL SIDE ----------
+class _Worker:
+    def __init__(self, ctx, preload: Sequence[str], warm_genomes: Sequence[str], memory_limit_mb: Optional[int]):
+        self.conn, child = ctx.Pipe()
+        self.proc = ctx.Process(target=_worker_main, args=(child, tuple(preload), tuple(warm_genomes), memory_limit_mb),
+                                daemon=True)
+        self.proc.start()
+        child.close()
+        _, self.baseline_rss = self.conn.recv()
+        self.rss = self.baseline_rss
+        self.jobs = 0
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, BrokenPipeError):
+            pass
+        self.proc.join(1.0)
+        if self.proc.is_alive():
+            self.proc.kill()
+            self.proc.join()
+        self.conn.close()
+
+
+class SandboxPool:
+    """
+    A fixed-size pool of warm, resource-limited grading processes.
+
+    Parameters
+    ----------
+    size : int
+        Number of workers (default: CPU count).
+    max_jobs : int
+        Recycle a worker after this many jobs.
+    max_rss_growth_mb : float
+        Recycle a worker once its RSS has grown this much past its warm baseline.
+    memory_limit_mb : int | None
+        Address-space limit (RLIMIT_AS) for each worker.
+    timeout : float
+        Wall-clock (and CPU) seconds allowed per job; the worker is killed past it.
+    preload : sequence of str
+        Modules imported once in every worker before it accepts jobs.
+    warm_genomes : sequence of str
+        Registered genome names whose sequence and skew array each worker loads up front.
+    """
+
+    def __init__(self, size: Optional[int] = None, *,
+                 max_jobs: int = _DEFAULT_MAX_JOBS,
+                 max_rss_growth_mb: float = _DEFAULT_MAX_RSS_GROWTH_MB,
+                 memory_limit_mb: Optional[int] = _DEFAULT_MEMORY_LIMIT_MB,
+                 timeout: float = _DEFAULT_TIMEOUT,
+                 preload: Iterable[str] = ("compbio_grader", "compbio_grader.genomes"),
+                 warm_genomes: Iterable[str] = ()):
+        # Replacement workers are started from whichever thread released the old
+        # one; forking a threaded process is unsafe, so prefer a fork server.
+        methods = mp.get_all_start_methods()
+        self._ctx = mp.get_context("forkserver" if "forkserver" in methods else methods[0])
+        self.size = size or os.cpu_count() or 1
+        self.max_jobs = max_jobs
+        self.max_rss_growth_mb = max_rss_growth_mb
+        self.memory_limit_mb = memory_limit_mb
+        self.timeout = timeout
+        self.preload = tuple(preload)
+        self.warm_genomes = tuple(warm_genomes)
+        if self._ctx.get_start_method() == "forkserver":
+            self._ctx.set_forkserver_preload(list(self.preload))
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        for _ in range(self.size):
+            self._idle.put(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        return _Worker(self._ctx, self.preload, self.warm_genomes, self.memory_limit_mb)
+
+    def _release(self, worker: _Worker, healthy: bool) -> None:
+        worn_out = (worker.jobs >= self.max_jobs
+                    or worker.rss - worker.baseline_rss > self.max_rss_growth_mb)
+        if not healthy or worn_out or self._closed:
+            worker.stop()
+            if self._closed:
+                return
+            worker = self._spawn()
+        self._idle.put(worker)
+
+    def run(self, check: str, source: str, name: str, *args, **kwargs) -> SandboxResult:
+        """
+        Exec `source` in a worker and call `compbio_grader.<check>(<name>, *args, **kwargs)`,
+        where `name` is the student's function or answer variable.
+        """
+        if self._closed:
+            raise RuntimeError("SandboxPool is closed.")
+        job = {"check": check, "source": source, "name": name,
+               "args": args, "kwargs": kwargs, "timeout": self.timeout}
+        worker = self._idle.get()
+        healthy = False
+        try:
+            worker.conn.send(job)
+            if not worker.conn.poll(self.timeout):
+                return SandboxResult(False, "", "", f"Time limit exceeded ({self.timeout:g}s).")
+            reply, worker.rss = worker.conn.recv()
+            worker.jobs += 1
+            healthy = True
+            return SandboxResult(reply["passed"], reply["letters"], reply["output"], reply["error"])
+        except (EOFError, OSError):
+            return SandboxResult(False, "", "", f"Worker died (exit code {worker.proc.exitcode}).")
+        finally:
+            self._release(worker, healthy)
+
+    def run_many(self, jobs: Iterable[Tuple]) -> List[SandboxResult]:
+        """Run `(check, source, name, *args)` tuples across all workers; results keep input order."""
+        with ThreadPoolExecutor(max_workers=self.size) as ex:
+            return list(ex.map(lambda j: self.run(*j), jobs))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().stop()
+            except queue.Empty:
+                break
+
+    def __enter__(self) -> "SandboxPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
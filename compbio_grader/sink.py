@@ -0,0 +1,204 @@
+# compbio_grader/sink.py
+"""
+Append-only result log for large grading runs.
+
+Each process appends fixed-schema records as JSON lines to its own segment
+file in a shared directory, so any number of workers (threads, processes,
+nodes on a shared filesystem) write concurrently without locking each other.
+Writes are buffered; the segment is flushed and fsync'ed every
+`flush_every` records or `fsync_interval` seconds, and on close.  Nothing
+is kept in memory beyond the write buffer.
+
+    with ResultSink("results/") as sink:
+        sink.write(student="alice", check="check_neighbors", passed=True, letters="R")
+    compact("results/", "results.csv")          # or "results.parquet" with pyarrow
+
+`iter_records` streams every segment back (a line cut short by a crash is
+skipped); `compact` turns them into one columnar file.
+"""
+import csv
+import json
+import os
+import socket
+import threading
+import time
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+try:
+    import pyarrow
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency
+    pyarrow = None
+
+_SEGMENT_PREFIX = "results-"
+_SEGMENT_SUFFIX = ".jsonl"
+_DEFAULT_FLUSH_EVERY = 256
+_DEFAULT_FSYNC_INTERVAL = 1.0
+_PARQUET_ROW_GROUP = 65536
+
+
+class ResultRecord(NamedTuple):
+    student: str
+    check: str
+    passed: bool
+    letters: str = ""            # JSON-encoded when the check awards a list
+    reused: bool = False
+    error: str = ""
+    fingerprint: str = ""        # submission fingerprint
+    exercise: str = ""           # exercise fingerprint
+    seconds: float = 0.0
+    worker: str = ""
+    timestamp: float = 0.0
+    output: str = ""
+
+FIELDS = ResultRecord._fields
+
+
+def _letters_text(letters: Any) -> str:
+    return letters if isinstance(letters, str) else json.dumps(letters)
+
+def record_from_result(student: str, check: str, result: Any, **extra: Any) -> ResultRecord:
+    """Build a record from a BatchResult (or anything with passed/letters/output/error fields)."""
+    return ResultRecord(
+        student=student, check=check, passed=bool(result.passed),
+        letters=_letters_text(result.letters),
+        reused=bool(getattr(result, "reused", False)),
+        error=getattr(result, "error", "") or "",
+        fingerprint=getattr(result, "fingerprint", None) or "",
+        exercise=getattr(result, "exercise", None) or "",
+        output=getattr(result, "output", "") or "",
+        **extra,
+    )
+
+
+# ----------  WRITING ----------
+class ResultSink:
+    """One process's append-only segment in `directory` (open one per process; threads may share it)."""
+
+    def __init__(self, directory: str, *, flush_every: int = _DEFAULT_FLUSH_EVERY,
+                 fsync_interval: float = _DEFAULT_FSYNC_INTERVAL, worker: Optional[str] = None):
+        os.makedirs(directory, exist_ok=True)
+        self.worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+        name = f"{_SEGMENT_PREFIX}{socket.gethostname()}-{os.getpid()}-{time.time_ns()}{_SEGMENT_SUFFIX}"
+        self.path = os.path.join(directory, name)
+        self.flush_every = flush_every
+        self.fsync_interval = fsync_interval
+        self._file = open(self.path, "a", encoding="utf-8", buffering=1 << 16)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self.written = 0
+
+    def write(self, record: Optional[ResultRecord] = None, **fields: Any) -> None:
+        """Append one record (a ResultRecord, or its fields as keywords)."""
+        if record is None:
+            fields.setdefault("worker", self.worker)
+            fields.setdefault("timestamp", time.time())
+            if "letters" in fields:
+                fields["letters"] = _letters_text(fields["letters"])
+            record = ResultRecord(**fields)
+        elif not record.timestamp or not record.worker:
+            record = record._replace(timestamp=record.timestamp or time.time(), worker=record.worker or self.worker)
+        line = json.dumps(record._asdict(), ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self.written += 1
+            self._pending += 1
+            if self._pending >= self.flush_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._sync()
+
+    def write_result(self, student: str, check: str, result: Any, **extra: Any) -> None:
+        self.write(record_from_result(student, check, result, **extra))
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._sync()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._sync()
+                self._file.close()
+
+    def __enter__(self) -> "ResultSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ----------  READING / COMPACTING ----------
+def segments(directory: str) -> List[str]:
+    return sorted(os.path.join(directory, f) for f in os.listdir(directory)
+                  if f.startswith(_SEGMENT_PREFIX) and f.endswith(_SEGMENT_SUFFIX))
+
+def iter_records(directory: str) -> Iterator[ResultRecord]:
+    """Every record in every segment, one at a time."""
+    for path in segments(directory):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break   # last write cut short
+                try:
+                    data = json.loads(line)
+                    record = ResultRecord(**{k: data[k] for k in FIELDS if k in data})
+                except (ValueError, TypeError):
+                    continue
+                yield record
+
+
+def _compact_csv(records: Iterator[ResultRecord], out: str, include_output: bool) -> int:
+    fields = [f for f in FIELDS if include_output or f != "output"]
+    n = 0
+    with open(out, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(fields)
+        for r in records:
+            row = r._asdict()
+            w.writerow([row[k] for k in fields])
+            n += 1
+    return n
+
+def _compact_parquet(records: Iterator[ResultRecord], out: str, include_output: bool) -> int:
+    if pyarrow is None:
+        raise ImportError("Writing Parquet needs pyarrow (pip install pyarrow); use a .csv output instead.")
+    fields = [f for f in FIELDS if include_output or f != "output"]
+    types = {"passed": pyarrow.bool_(), "reused": pyarrow.bool_(), "seconds": pyarrow.float64(),
+             "timestamp": pyarrow.float64()}
+    schema = pyarrow.schema([(f, types.get(f, pyarrow.string())) for f in fields])
+    n = 0
+    with pq.ParquetWriter(out, schema) as writer:
+        batch: Dict[str, List[Any]] = {f: [] for f in fields}
+        for r in records:
+            for f in fields:
+                batch[f].append(getattr(r, f))
+            n += 1
+            if len(batch["student"]) >= _PARQUET_ROW_GROUP:
+                writer.write_table(pyarrow.table(batch, schema=schema))
+                batch = {f: [] for f in fields}
+        if batch["student"]:
+            writer.write_table(pyarrow.table(batch, schema=schema))
+    return n
+
+def compact(directory: str, out: str, *, include_output: bool = False) -> int:
+    """
+    Stream every segment in `directory` into one columnar file: Parquet if `out`
+    ends in .parquet (needs pyarrow), CSV otherwise.  Returns the number of records.
+    """
+    tmp = f"{out}.tmp{os.getpid()}"
+    writer = _compact_parquet if out.endswith(".parquet") else _compact_csv
+    try:
+        n = writer(iter_records(directory), tmp, include_output)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    os.replace(tmp, out)
+    return n
@@ -0,0 +1,294 @@
+# compbio_grader/skew.py
+"""
+Genome-scale skew kernels.
+
+`skew_array` computes Skew_0..Skew_n for a whole genome in one pass (NumPy
+cumsum when available, otherwise a C-level `itertools.accumulate` over a
+translated byte string).  `reference_skew` takes the array from the genome
+registry, which builds it once per node and shares it across processes.
+
+Answers can be verified in several forms without expanding them:
+
+    - the full array (with or without the leading Skew_0 = 0)
+    - run-length encoding: {"rle": [(value, run_length), ...], "offset": 0}
+    - a downsampled series: {"step": s, "values": [...], "offset": 0}
+    - a digest: {"sha256": hexdigest} or the bare 64-character hex string
+
+For plotting, `decimate_skew` reduces a skew array to a few thousand points
+that draw the same picture at a given pixel width: "minmax" keeps the lowest
+and highest point of every pixel column (exact envelope, so the minimum-skew
+dip survives), "lttb" keeps one visually representative point per bucket
+(Largest-Triangle-Three-Buckets).  `skew_plot_series` does the same straight
+from a registered genome.
+"""
+import hashlib
+import re
+from array import array
+from itertools import accumulate
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .answers import as_int_array
+from .genomes import resolve_genome
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+# G → +1, C → -1 (0xff as a signed byte), everything else → 0
+_STEP = bytes(1 if b in b"Gg" else 0xFF if b in b"Cc" else 0 for b in range(256))
+
+_CHUNK = 1 << 16
+_HEX_DIGEST = re.compile(r"[0-9a-fA-F]{64}")
+
+
+def _steps(genome: Union[str, bytes]) -> bytes:
+    data = genome.encode("ascii", "replace") if isinstance(genome, str) else bytes(genome)
+    return data.translate(_STEP)
+
+
+def skew_array(genome: Union[str, bytes]):
+    """
+    Skew_0..Skew_n of `genome` as an int32 buffer of length n+1
+    (`numpy.ndarray` if NumPy is installed, else `array.array('i')`).
+    """
+    steps = _steps(genome)
+    if np is not None:
+        out = np.zeros(len(steps) + 1, dtype=np.int32)
+        np.cumsum(np.frombuffer(steps, dtype=np.int8), dtype=np.int32, out=out[1:])
+        return out
+    signed = array("b")
+    signed.frombytes(steps)
+    return array("i", accumulate(signed, initial=0))
+
+
+def min_skew_positions(values: Any) -> List[int]:
+    """All i where Skew_i is minimal."""
+    if np is not None:
+        arr = np.asarray(values)
+        return np.flatnonzero(arr == arr.min()).tolist() if arr.size else []
+    if not len(values):
+        return []
+    m = min(values)
+    return [i for i, v in enumerate(values) if v == m]
+
+
+def skew_digest(values: Any) -> str:
+    """SHA-256 of a skew series encoded as little-endian int32 (what {"sha256": ...} answers hold)."""
+    h = hashlib.sha256()
+    if np is not None:
+        h.update(np.asarray(as_int_array(values), dtype="<i4").tobytes())
+        return h.hexdigest()
+    vals = values if isinstance(values, array) and values.typecode in "iq" else as_int_array(values)
+    for i in range(0, len(vals), _CHUNK):
+        chunk = array("i", vals[i:i + _CHUNK])
+        if chunk.itemsize != 4:
+            raise RuntimeError("Platform has no 32-bit array typecode.")
+        if array("i", [1]).tobytes()[0] != 1:
+            chunk.byteswap()
+        h.update(chunk.tobytes())
+    return h.hexdigest()
+
+
+class SkewReference(NamedTuple):
+    values: Any          # Skew_0..Skew_n
+    digest: str          # skew_digest(values)
+    digest_1based: str   # skew_digest(values[1:])
+
+
+def reference_skew(genome: str) -> SkewReference:
+    """
+    Skew array and digests for a registered genome (or genome file), built once per node.
+    Both come from the entry's products, which are kept per file stamp, so an edited
+    genome file is picked up on the next call.
+    """
+    entry = resolve_genome(genome)
+    vals = entry.skew()
+    digests = entry.reference("skew_sha256", compute=lambda seq: [skew_digest(vals), skew_digest(vals[1:])])
+    return SkewReference(vals, digests[0], digests[1])
+
+
+# ----------  STREAMING COMPARISON ----------
+class SkewMismatch(NamedTuple):
+    index: int                 # genome position (Skew_index) of the first disagreement
+    expected: Optional[int]
+    got: Optional[int]
+    message: str
+
+
+def _segment_equal(ref, start: int, got) -> Optional[int]:
+    """Compare ref[start:start+len(got)] to `got`; return offset of first difference or None."""
+    for i in range(0, len(got), _CHUNK):
+        a = ref[start + i:start + i + _CHUNK]
+        b = got[i:i + _CHUNK]
+        if np is not None:
+            diff = np.flatnonzero(np.asarray(a) != np.asarray(b))
+            if diff.size:
+                return i + int(diff[0])
+        elif a != b:
+            for j, (x, y) in enumerate(zip(a, b)):
+                if x != y:
+                    return i + j
+    return None
+
+
+def _compare_full(ref, got) -> Optional[SkewMismatch]:
+    n = len(ref) - 1
+    if len(got) == n + 1:
+        start = 0
+    elif len(got) == n:
+        start = 1       # Skew_1..Skew_n (no leading 0)
+    else:
+        return SkewMismatch(-1, None, None,
+                            f"Wrong number of values. Expected {n + 1} (or {n} without Skew_0), got {len(got)}.")
+    off = _segment_equal(ref, start, got)
+    if off is None:
+        return None
+    i = start + off
+    return SkewMismatch(i, int(ref[i]), int(got[off]), f"First mismatch at position {i}.")
+
+
+def _compare_rle(ref, runs: Iterable[Tuple[int, int]], offset: Optional[int]) -> Optional[SkewMismatch]:
+    n = len(ref)
+    if offset is None:
+        # For a materialized list the total run length tells us whether Skew_0 is included.
+        offset = 0
+        if isinstance(runs, (list, tuple)):
+            offset = 1 if sum(int(r) for _, r in runs) == n - 1 else 0
+    pos = offset
+    for value, run in runs:
+        value, run = int(value), int(run)
+        if run <= 0:
+            return SkewMismatch(pos, None, None, f"Run lengths must be positive (got {run} at position {pos}).")
+        if pos + run > n:
+            return SkewMismatch(pos, None, None, "Runs extend past the end of the genome.")
+        seg = ref[pos:pos + run]
+        same = bool((np.asarray(seg) == value).all()) if np is not None else seg.count(value) == run
+        if not same:
+            off = next(j for j, x in enumerate(seg) if x != value)
+            return SkewMismatch(pos + off, int(seg[off]), value, f"First mismatch at position {pos + off}.")
+        pos += run
+    if pos != n:
+        return SkewMismatch(pos, int(ref[pos]), None, f"Runs end at position {pos}; expected them to reach {n}.")
+    return None
+
+
+def _compare_downsampled(ref, step: int, values, offset: int) -> Optional[SkewMismatch]:
+    if step <= 0 or offset < 0:
+        return SkewMismatch(-1, None, None, "Downsampling needs step > 0 and offset >= 0.")
+    got = as_int_array(values)
+    expect_len = len(range(offset, len(ref), step))
+    if len(got) != expect_len:
+        return SkewMismatch(-1, None, None,
+                            f"Wrong number of samples. Expected {expect_len} for step={step}, offset={offset}; got {len(got)}.")
+    sampled = ref[offset::step]
+    off = _segment_equal(sampled, 0, got)
+    if off is None:
+        return None
+    i = offset + off * step
+    return SkewMismatch(i, int(ref[i]), int(got[off]), f"First mismatch at sample {off} (position {i}).")
+
+
+def compare_skew(ref: SkewReference, ans: Any) -> Optional[SkewMismatch]:
+    """Verify a skew answer in any supported form; None means it matches."""
+    if isinstance(ans, str) and _HEX_DIGEST.fullmatch(ans.strip()):
+        ans = {"sha256": ans.strip()}
+    if isinstance(ans, dict):
+        if "sha256" in ans:
+            d = str(ans["sha256"]).strip().lower()
+            if d in (ref.digest, ref.digest_1based):
+                return None
+            return SkewMismatch(-1, None, None, "Digest does not match the reference skew array.")
+        if "rle" in ans:
+            offset = ans.get("offset")
+            return _compare_rle(ref.values, ans["rle"], None if offset is None else int(offset))
+        if "step" in ans and "values" in ans:
+            return _compare_downsampled(ref.values, int(ans["step"]), ans["values"], int(ans.get("offset", 0)))
+        raise ValueError("Unknown answer form; expected keys 'sha256', 'rle', or 'step' + 'values'.")
+    return _compare_full(ref.values, as_int_array(ans))
+
+
+# ----------  DECIMATION (PLOTTING) ----------
+class SkewSeries(NamedTuple):
+    positions: List[int]   # genome positions i of the kept points, increasing
+    values: List[int]      # Skew_i at those positions
+
+
+def _minmax_positions(values: Any, width: int) -> List[int]:
+    n = len(values)
+    bucket = -(-n // width)
+    rows = -(-n // bucket)
+    if np is not None:
+        arr = np.asarray(values)
+        pad = rows * bucket - n
+        if pad:
+            arr = np.concatenate((arr, np.full(pad, arr[-1], dtype=arr.dtype)))
+        grid = arr.reshape(rows, bucket)
+        base = np.arange(rows, dtype=np.int64) * bucket
+        # argmin/argmax return the first occurrence, so padding (a copy of the last value) is never picked
+        keep = np.concatenate(([0], base + grid.argmin(axis=1), base + grid.argmax(axis=1), [n - 1]))
+        return np.unique(keep).tolist()
+    keep = {0, n - 1}
+    for start in range(0, n, bucket):
+        seg = values[start:start + bucket]
+        keep.add(start + seg.index(min(seg)))
+        keep.add(start + seg.index(max(seg)))
+    return sorted(keep)
+
+
+def _lttb_positions(values: Any, width: int) -> List[int]:
+    n = len(values)
+    inner = width - 2
+    edges = [1 + (n - 2) * b // inner for b in range(inner + 1)]
+    keep = [0]
+    a = 0
+    if np is not None:
+        y = np.asarray(values, dtype=np.float64)
+        for b in range(inner):
+            lo, hi = edges[b], edges[b + 1]
+            nlo, nhi = (edges[b + 1], edges[b + 2]) if b + 1 < inner else (n - 1, n)
+            cx = (nlo + nhi - 1) / 2.0
+            cy = y[nlo:nhi].mean()
+            xs = np.arange(lo, hi, dtype=np.float64)
+            area = np.abs((a - cx) * (y[lo:hi] - y[a]) - (a - xs) * (cy - y[a]))
+            a = lo + int(area.argmax())
+            keep.append(a)
+    else:
+        for b in range(inner):
+            lo, hi = edges[b], edges[b + 1]
+            nlo, nhi = (edges[b + 1], edges[b + 2]) if b + 1 < inner else (n - 1, n)
+            cx = (nlo + nhi - 1) / 2.0
+            cy = sum(values[nlo:nhi]) / (nhi - nlo)
+            ya = values[a]
+            a = max(range(lo, hi), key=lambda i: abs((a - cx) * (values[i] - ya) - (a - i) * (cy - ya)))
+            keep.append(a)
+    keep.append(n - 1)
+    return keep
+
+
+def decimate_skew(values: Any, width: int = 1000, method: str = "minmax") -> SkewSeries:
+    """
+    Reduce Skew_0..Skew_n to a series that plots identically `width` pixels wide.
+    "minmax": first/last point plus the min and max of each of `width` columns (<= 2*width+2 points).
+    "lttb":   exactly `width` points chosen by Largest-Triangle-Three-Buckets.
+    Series that are already short enough are returned whole.
+    """
+    if width < 3:
+        raise ValueError("width must be at least 3.")
+    if method not in ("minmax", "lttb"):
+        raise ValueError("method must be 'minmax' or 'lttb'.")
+    n = len(values)
+    if n <= (2 * width if method == "minmax" else width):
+        positions = list(range(n))
+    elif method == "minmax":
+        positions = _minmax_positions(values, width)
+    else:
+        positions = _lttb_positions(values, width)
+    if np is not None:
+        return SkewSeries(positions, np.asarray(values)[positions].tolist())
+    return SkewSeries(positions, [int(values[i]) for i in positions])
+
+
+def skew_plot_series(genome: str = "E_coli", width: int = 1000, method: str = "minmax") -> SkewSeries:
+    """Decimated skew series of a registered genome (or genome file), from its cached skew array."""
+    return decimate_skew(reference_skew(genome).values, width, method)
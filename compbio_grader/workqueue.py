@@ -0,0 +1,366 @@
+# compbio_grader/workqueue.py
+"""
+SQLite-backed work queue for grading a cohort across several nodes.
+
+Any number of worker processes — on one box or on hosts sharing a
+filesystem — pull (submission, check) jobs from one database file, run them
+in their own `SandboxPool`, and write results back to the same file.  There
+is no broker: a job is claimed by taking a time-limited lease in a single
+`BEGIN IMMEDIATE` transaction, the worker extends the lease with heartbeats
+while the job runs, and a job whose lease lapses (worker crashed, node lost)
+is handed to the next worker that asks.  Identical submissions (same check,
+arguments and compiled source) are graded once; later copies reuse the
+stored verdict.
+
+    q = WorkQueue("cohort.db")
+    q.enqueue("alice", "check_neighbors", source, "Neighbors")
+    run_worker("cohort.db", processes=4, exit_when_empty=True)   # on every node
+    print_clusters(q.report("check_neighbors"))
+
+From the shell:
+
+    compbio_grader enqueue cohort.db --check check_neighbors --name Neighbors subs/*.py
+    compbio_grader worker cohort.db --processes 4 --exit-when-empty
+    compbio_grader results cohort.db
+
+Every result records the exercise fingerprint it was graded under (the
+check's code and hidden cases, its arguments and the reference data
+version).  After fixing a hidden case or updating a reference constant,
+`requeue_stale` (`compbio_grader regrade cohort.db`) puts back only the jobs
+graded under an outdated fingerprint, and workers re-grade just those.
+
+Set `journal_mode="DELETE"` for network filesystems where SQLite's WAL mode
+is not safe.  Workers log SQLite errors ("database is locked" under heavy
+contention, a briefly unreachable file) to the `compbio_grader.workqueue`
+logger and retry with exponential backoff; a slot gives up only after
+`_RETRY_ATTEMPTS` failures in a row.
+"""
+import hashlib
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from .batch import BatchReport, BatchResult
+from .fingerprint import exercise_fingerprint, source_fingerprint
+
+_DEFAULT_LEASE = 120.0
+_DEFAULT_MAX_ATTEMPTS = 3
+_RETRY_DELAY = 0.5          # seconds before the first retry of a failed queue operation
+_RETRY_MAX_DELAY = 30.0
+_RETRY_ATTEMPTS = 10
+
+_log = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    student       TEXT NOT NULL,
+    check_name    TEXT NOT NULL,
+    source        TEXT NOT NULL,
+    name          TEXT NOT NULL,
+    args          TEXT NOT NULL,
+    kwargs        TEXT NOT NULL,
+    job_key       TEXT NOT NULL,
+    state         TEXT NOT NULL DEFAULT 'pending',   -- pending | leased | done | failed
+    owner         TEXT,
+    lease_expires REAL,
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    result        TEXT,
+    reused        INTEGER NOT NULL DEFAULT 0,
+    exercise      TEXT,                              -- exercise_fingerprint the result was graded under
+    updated       REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs(state, lease_expires);
+CREATE INDEX IF NOT EXISTS jobs_key ON jobs(job_key, state);
+"""
+
+
+class Job(NamedTuple):
+    id: int
+    student: str
+    check: str
+    source: str
+    name: str
+    args: List[Any]
+    kwargs: Dict[str, Any]
+    job_key: str
+    attempts: int
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue:
+    """One connection to the queue database (open one per process)."""
+
+    def __init__(self, path: str, *, journal_mode: str = "WAL", timeout: float = 30.0):
+        self.path = path
+        self._db = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._db.execute(f"PRAGMA journal_mode={journal_mode}")
+            self._db.executescript(_SCHEMA)
+            columns = {row[1] for row in self._db.execute("PRAGMA table_info(jobs)")}
+            if "exercise" not in columns:   # queue created before results were fingerprinted
+                self._db.execute("ALTER TABLE jobs ADD COLUMN exercise TEXT")
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "WorkQueue":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _tx(self, fn):
+        """Run fn(cursor) inside BEGIN IMMEDIATE ... COMMIT (one writer at a time across processes)."""
+        with self._lock:
+            cur = self._db.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                out = fn(cur)
+                cur.execute("COMMIT")
+            except BaseException:
+                if self._db.in_transaction:   # a failed COMMIT (e.g. "database is locked") leaves it open
+                    cur.execute("ROLLBACK")
+                raise
+            return out
+
+    # ----- producer side -----
+    def enqueue(self, student: str, check: str, source: str, name: str, *args, **kwargs) -> int:
+        """Queue `compbio_grader.<check>(<name from source>, *args, **kwargs)` for `student`."""
+        args_json = json.dumps(list(args))
+        kwargs_json = json.dumps(kwargs, sort_keys=True)
+        key = hashlib.sha256(
+            "\0".join((check, name, args_json, kwargs_json, source_fingerprint(source))).encode()
+        ).hexdigest()
+        return self._tx(lambda cur: cur.execute(
+            "INSERT INTO jobs (student, check_name, source, name, args, kwargs, job_key, updated) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (student, check, source, name, args_json, kwargs_json, key, time.time())).lastrowid)
+
+    # ----- worker side -----
+    def claim(self, worker: str, lease: float = _DEFAULT_LEASE,
+              max_attempts: int = _DEFAULT_MAX_ATTEMPTS) -> Optional[Job]:
+        """Lease the oldest runnable job (pending, or leased with an expired lease)."""
+        def take(cur):
+            now = time.time()
+            cur.execute("UPDATE jobs SET state = 'failed', owner = NULL, updated = ? "
+                        "WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?",
+                        (now, now, max_attempts))
+            # Prefer jobs with no identical twin in flight: the twin's verdict can be reused later.
+            row = cur.execute(
+                "SELECT id, student, check_name, source, name, args, kwargs, job_key, attempts FROM jobs AS j "
+                "WHERE state = 'pending' OR (state = 'leased' AND lease_expires < ?) "
+                "ORDER BY EXISTS (SELECT 1 FROM jobs AS t WHERE t.job_key = j.job_key AND t.id != j.id "
+                "                 AND t.state = 'leased' AND t.lease_expires >= ?), id LIMIT 1",
+                (now, now)).fetchone()
+            if row is None:
+                return None
+            cur.execute("UPDATE jobs SET state = 'leased', owner = ?, lease_expires = ?, "
+                        "attempts = attempts + 1, updated = ? WHERE id = ?",
+                        (worker, now + lease, now, row[0]))
+            return Job(row[0], row[1], row[2], row[3], row[4], json.loads(row[5]), json.loads(row[6]),
+                       row[7], row[8] + 1)
+        return self._tx(take)
+
+    def heartbeat(self, job_ids: List[int], worker: str, lease: float = _DEFAULT_LEASE) -> None:
+        """Extend the leases this worker still holds."""
+        if not job_ids:
+            return
+        marks = ",".join("?" * len(job_ids))
+        self._tx(lambda cur: cur.execute(
+            f"UPDATE jobs SET lease_expires = ? WHERE owner = ? AND state = 'leased' AND id IN ({marks})",
+            (time.time() + lease, worker, *job_ids)))
+
+    def cached_result(self, job_key: str, exercise: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Result of an identical job that already finished under the same exercise fingerprint, if any."""
+        if exercise is None:
+            return None
+        with self._lock:
+            row = self._db.execute("SELECT result FROM jobs WHERE job_key = ? AND state = 'done' "
+                                   "AND exercise = ? LIMIT 1", (job_key, exercise)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def complete(self, job: Job, worker: str, result: Dict[str, Any], reused: bool = False,
+                 exercise: Optional[str] = None) -> bool:
+        """Store the result; False if the lease was lost to another worker in the meantime."""
+        payload = json.dumps(result)
+        return self._tx(lambda cur: cur.execute(
+            "UPDATE jobs SET state = 'done', result = ?, reused = ?, exercise = ?, owner = NULL, updated = ? "
+            "WHERE id = ? AND owner = ? AND state = 'leased'",
+            (payload, int(reused), exercise, time.time(), job.id, worker)).rowcount == 1)
+
+    def requeue_stale(self) -> int:
+        """
+        Put finished jobs back in the queue when their exercise fingerprint differs from
+        the one the current code and reference data give.  Returns the number re-queued.
+        """
+        import compbio_grader
+
+        with self._lock:
+            groups = self._db.execute("SELECT DISTINCT check_name, args, kwargs FROM jobs "
+                                      "WHERE state IN ('done', 'failed')").fetchall()
+        requeued = 0
+        for check, args_json, kwargs_json in groups:
+            if not hasattr(compbio_grader, check):
+                continue    # jobs for an unknown check fail again however often they run
+            current = exercise_fingerprint(getattr(compbio_grader, check), json.loads(args_json),
+                                           json.loads(kwargs_json))
+            requeued += self._tx(lambda cur: cur.execute(
+                "UPDATE jobs SET state = 'pending', attempts = 0, result = NULL, reused = 0, exercise = NULL, "
+                "owner = NULL, lease_expires = NULL, updated = ? "
+                "WHERE check_name = ? AND args = ? AND kwargs = ? AND state IN ('done', 'failed') "
+                "AND (exercise IS NULL OR ? IS NULL OR exercise != ?)",
+                (time.time(), check, args_json, kwargs_json, current, current)).rowcount)
+        return requeued
+
+    # ----- reporting -----
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._db.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        return dict(rows)
+
+    def checks(self) -> List[str]:
+        with self._lock:
+            return [r[0] for r in self._db.execute("SELECT DISTINCT check_name FROM jobs ORDER BY check_name")]
+
+    def report(self, check: str) -> BatchReport:
+        """Finished jobs for one check as a BatchReport (clusters = identical submissions)."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT student, job_key, result, reused, exercise FROM jobs "
+                "WHERE check_name = ? AND state = 'done' ORDER BY id", (check,)).fetchall()
+        results: Dict[str, BatchResult] = {}
+        members: Dict[str, List[str]] = {}
+        evaluated = 0
+        for student, key, payload, reused, exercise in rows:
+            r = json.loads(payload)
+            results[student] = BatchResult(r["passed"], r["letters"], r["output"], key, bool(reused), r["error"],
+                                           exercise)
+            members.setdefault(key, []).append(student)
+            evaluated += not reused
+        clusters = sorted((m for m in members.values() if len(m) > 1), key=len, reverse=True)
+        return BatchReport(results, clusters, evaluated)
+
+
+# ----------  WORKER ----------
+def _retry(what: str, op: Callable[[], Any]) -> Any:
+    """op(), retried with exponential backoff while it raises sqlite3.Error; re-raises after _RETRY_ATTEMPTS."""
+    delay = _RETRY_DELAY
+    for attempt in range(1, _RETRY_ATTEMPTS + 1):
+        try:
+            return op()
+        except sqlite3.Error as e:
+            if attempt == _RETRY_ATTEMPTS:
+                raise
+            _log.warning("Queue %s failed (%s); retry %d/%d in %.1fs.", what, e, attempt, _RETRY_ATTEMPTS - 1, delay)
+            time.sleep(delay)
+            delay = min(2 * delay, _RETRY_MAX_DELAY)
+
+def _heartbeat_loop(queue: WorkQueue, worker: str, inflight: Dict[int, Job], lock: threading.Lock,
+                    lease: float, stop: threading.Event) -> None:
+    while not stop.wait(lease / 3):
+        with lock:
+            ids = list(inflight)
+        try:
+            queue.heartbeat(ids, worker, lease)
+        except sqlite3.Error as e:  # next beat retries; the lease has slack for two misses
+            _log.warning("Queue heartbeat failed (%s); retrying at the next beat.", e)
+
+
+def run_worker(path: str, *, processes: Optional[int] = None, worker_id: Optional[str] = None,
+               lease: float = _DEFAULT_LEASE, exit_when_empty: bool = False, poll: float = 2.0,
+               sink_dir: Optional[str] = None, **pool_options: Any) -> int:
+    """
+    Pull jobs from the queue at `path` until it is empty (with `exit_when_empty`)
+    or forever, running up to `processes` at once in a SandboxPool.  With
+    `sink_dir`, every stored result is also appended to this worker's segment
+    there (see `sink.py`).  Returns the number of jobs this worker completed.
+    """
+    import compbio_grader
+    from .sandbox import SandboxPool
+    from .sink import ResultSink
+
+    worker = worker_id or default_worker_id()
+    queue = WorkQueue(path)
+    inflight: Dict[int, Job] = {}
+    lock = threading.Lock()
+    stop = threading.Event()
+    done = [0]
+    exercises: Dict[tuple, Optional[str]] = {}
+    sink = ResultSink(sink_dir, worker=worker) if sink_dir else None
+
+    def exercise_of(job: Job) -> Optional[str]:
+        key = (job.check, json.dumps(job.args), json.dumps(job.kwargs, sort_keys=True))
+        with lock:
+            if key in exercises:
+                return exercises[key]
+        check = getattr(compbio_grader, job.check, None)
+        fp = exercise_fingerprint(check, job.args, job.kwargs) if check is not None else None
+        with lock:
+            exercises[key] = fp
+        return fp
+    beat = threading.Thread(target=_heartbeat_loop, args=(queue, worker, inflight, lock, lease, stop), daemon=True)
+    beat.start()
+
+    def serve(pool: "SandboxPool") -> None:
+        try:
+            serve_jobs(pool)
+        except sqlite3.Error:
+            _log.exception("Worker %s: giving up on the queue after %d failed attempts; this slot stops.",
+                           worker, _RETRY_ATTEMPTS)
+
+    def serve_jobs(pool: "SandboxPool") -> None:
+        while not stop.is_set():
+            job = _retry("claim", lambda: queue.claim(worker, lease))
+            if job is None:
+                if exit_when_empty:
+                    return
+                time.sleep(poll)
+                continue
+            exercise = exercise_of(job)
+            cached = _retry("lookup", lambda: queue.cached_result(job.job_key, exercise))
+            if cached is not None:
+                stored = _retry("complete", lambda: queue.complete(job, worker, cached, reused=True, exercise=exercise))
+                if stored and sink is not None:
+                    sink.write_result(job.student, job.check, BatchResult(**cached, fingerprint=job.job_key,
+                                                                          reused=True, exercise=exercise))
+                continue
+            with lock:
+                inflight[job.id] = job
+            t0 = time.perf_counter()
+            try:
+                res = pool.run(job.check, job.source, job.name, *job.args, **job.kwargs)
+            finally:
+                with lock:
+                    inflight.pop(job.id, None)
+            seconds = time.perf_counter() - t0
+            if _retry("complete", lambda: queue.complete(job, worker, res._asdict(), exercise=exercise)):
+                with lock:
+                    done[0] += 1
+                if sink is not None:
+                    sink.write_result(job.student, job.check, BatchResult(**res._asdict(), fingerprint=job.job_key,
+                                                                          exercise=exercise), seconds=seconds)
+
+    try:
+        with SandboxPool(processes, **pool_options) as pool:
+            threads = [threading.Thread(target=serve, args=(pool,), daemon=True) for _ in range(pool.size)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+    finally:
+        stop.set()
+        beat.join()
+        queue.close()
+        if sink is not None:
+            sink.close()
+    return done[0]
@@ -0,0 +1,48 @@
+import random
+import warnings
+
+import pytest
+
+from compbio_grader import artifacts
+from compbio_grader.checks import _ref_pattern_matching
+
+
+@pytest.fixture()
+def bundle(tmp_path, monkeypatch):
+    rng = random.Random(0)
+    genome = "".join(rng.choice("ACGT") for _ in range(3000)) + "CTTGATCAT"
+    path = tmp_path / "Tiny.txt"
+    path.write_text(genome)
+    out = tmp_path / "bundle.json"
+    monkeypatch.setenv("COMPBIO_GRADER_ARTIFACTS", str(out))
+    artifacts.prepare([str(path)], str(out), clump=(3, 50, 3), ori=(60, 3, 1))
+    yield genome
+    artifacts.load_bundle.cache_clear()
+
+
+def test_prepared_products(bundle):
+    assert artifacts.lookup("Tiny", "pattern_positions", "CTTGATCAT") == _ref_pattern_matching(bundle, "CTTGATCAT")
+    assert artifacts.lookup("Tiny", "length") == len(bundle)
+    assert artifacts.lookup("Nope", "pattern_positions", "CTTGATCAT", default="d") == "d"
+
+
+def test_matching_sequence_is_trusted(bundle):
+    assert artifacts.lookup("Tiny", "pattern_positions", "CTTGATCAT", sequence=bundle) is not None
+
+
+@pytest.mark.parametrize("edit", [lambda g: g + "A", lambda g: "T" + g[1:] if g[0] != "T" else "A" + g[1:]])
+def test_changed_sequence_is_ignored(bundle, edit):
+    with warnings.catch_warnings(record=True):
+        warnings.simplefilter("always")
+        assert artifacts.lookup("Tiny", "pattern_positions", "CTTGATCAT", default=None, sequence=edit(bundle)) is None
+
+
+def test_tampered_bundle_is_rejected(bundle, tmp_path):
+    path = artifacts.bundle_path()
+    with open(path) as f:
+        text = f.read()
+    with open(path, "w") as f:
+        f.write(text.replace('"length":3009', '"length":3010'))
+    artifacts.load_bundle.cache_clear()
+    with pytest.warns(UserWarning, match="checksum"):
+        assert artifacts.load_bundle(path) is None
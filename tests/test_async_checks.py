@@ -0,0 +1,84 @@
+import asyncio
+import sys
+import time
+
+import pytest
+
+from compbio_grader import checks2
+from compbio_grader.async_checks import check_approximatepatterncount_async, run_check_async
+from compbio_grader.capture import ThreadStdout, hidden_cases
+from compbio_grader.memo import clear_memo
+
+
+def _approximate_count(text, pattern, d):
+    k = len(pattern)
+    return sum(sum(a != b for a, b in zip(text[i:i+k], pattern)) <= d for i in range(len(text) - k + 1))
+
+
+def _wrong_count(text, pattern, d):
+    return 4     # right for the first two hidden tests only
+
+
+def _talk(name, lines, delay=0.0):
+    for i in range(lines):
+        print(f"{name} {i}")
+        time.sleep(delay)
+    print(f"{name} done", end="")       # no trailing newline: flushed when the check returns
+    return True, name
+
+
+def _boom():
+    print("before", end="")
+    raise ValueError("student bug")
+
+
+def test_lines_forwarded_in_order():
+    got = []
+    result = asyncio.run(run_check_async(_talk, "a", 3, progress=got.append))
+    assert result == (True, "a")
+    assert got == ["a 0", "a 1", "a 2", "a done"]
+    assert not isinstance(sys.stdout, ThreadStdout)
+
+
+def test_concurrent_checks_do_not_interleave():
+    got = {"a": [], "b": []}
+
+    async def main():
+        return await asyncio.gather(run_check_async(_talk, "a", 20, 0.001, progress=got["a"].append),
+                                    run_check_async(_talk, "b", 20, 0.001, progress=got["b"].append))
+
+    assert asyncio.run(main()) == [(True, "a"), (True, "b")]
+    for name, lines in got.items():
+        assert lines == [f"{name} {i}" for i in range(20)] + [f"{name} done"]
+
+
+def test_exceptions_propagate_after_output(capsys):
+    got = []
+    with pytest.raises(ValueError, match="student bug"):
+        asyncio.run(run_check_async(_boom, progress=got.append))
+    assert got == ["before"]
+    assert capsys.readouterr().out == ""
+
+
+def test_hidden_tests_reported_as_they_pass(capsys):
+    clear_memo()
+    total = len(checks2._HIDDEN_TESTS_EX5)
+    got = []
+    passed, _ = asyncio.run(check_approximatepatterncount_async(_approximate_count, progress=got.append))
+    assert passed
+    assert got == [f"  ✓ hidden test {i}/{total} passed" for i in range(1, total + 1)] + ["✅ All hidden tests passed!"]
+
+    got = []
+    assert asyncio.run(check_approximatepatterncount_async(_wrong_count, progress=got.append))[0] is False
+    assert got[:2] == [f"  ✓ hidden test {i}/{total} passed" for i in (1, 2)]
+    assert got[2].startswith("❌") and "hidden test" not in " ".join(got[2:])
+
+    # the sync path, including the memo replaying the async run, prints no progress lines
+    assert checks2.check_approximatepatterncount(_approximate_count)[0]
+    assert capsys.readouterr().out == "✅ All hidden tests passed!\n"
+    clear_memo()
+
+
+def test_hidden_cases_without_a_hook_is_plain_iteration():
+    cases = [1, 2, 3]
+    assert list(hidden_cases(cases)) == cases
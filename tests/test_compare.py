@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from compbio_grader import check_neighbors
+from compbio_grader.compare import diff_sets, diff_sorted, first_mismatch, preview, print_diff
+
+
+def test_first_mismatch():
+    assert first_mismatch([1, 2, 3], [1, 2, 3]) is None
+    assert first_mismatch([1, 2, 3], [1, 5, 3]) == (1, 2, 5)
+    assert first_mismatch([1, 2], [1, 2, 3]) == (2, None, 3)
+    assert first_mismatch(iter([1, 2, 3]), iter([1])) == (1, 2, None)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_diffs_match_set_arithmetic(seed):
+    rng = random.Random(seed)
+    expected = sorted(rng.sample(range(200), rng.randint(0, 60)))
+    got = sorted(rng.sample(range(200), rng.randint(0, 60)))
+    missing, extra = sorted(set(expected) - set(got)), sorted(set(got) - set(expected))
+    for diff in (diff_sorted(expected, got, limit=5), diff_sets(set(expected), got + got[:3], limit=5)):
+        assert (diff.missing_count, diff.extra_count) == (len(missing), len(extra))
+        assert diff.missing == missing[:5] and diff.extra == extra[:5]
+        assert diff.equal == (expected == got)
+        if not diff.equal:
+            pivot = min(missing[:1] + extra[:1])
+            assert diff.first_mismatch[0] == sum(1 for v in expected if v < pivot and v in got)
+
+
+def test_diff_sets_with_mixed_types():
+    diff = diff_sets({"ACG", "AAA"}, [1, "ACG", "ZZ", None, 2.5, (1, "a"), b"x"])
+    assert diff.missing == ["AAA"] and diff.extra_count == 6
+    assert set(map(repr, diff.extra)) == {"1", "'ZZ'", "None", "2.5", "(1, 'a')", "b'x'"}
+    assert not diff.equal
+
+
+def test_preview_and_print_diff(capsys):
+    assert preview(range(3)) == "0 1 2"
+    assert preview(list(range(20)), limit=3) == "0 1 2 ... (+17 more)"
+    assert preview(iter(range(20)), limit=3) == "0 1 2 ..."
+    print_diff(diff_sets({1, 2, 3}, [2, 4]), limit=1)
+    assert capsys.readouterr().out == "  Missing (2): 1 ...\n  Extra (1): 4\n"
+
+
+def test_check_neighbors_reports_bad_entries_without_crashing(capsys):
+    assert check_neighbors(lambda pattern, d: [1, "ACG"]) == (False, "")
+    assert "non-string entries" in capsys.readouterr().out
+    assert check_neighbors(lambda pattern, d: ["ACG", "AAA"]) == (False, "")
+    assert "Missing" in capsys.readouterr().out
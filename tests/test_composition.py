@@ -0,0 +1,90 @@
+import os
+import random
+
+import pytest
+
+from compbio_grader.checks2 import check_cytosine_frequency, check_frequency_difference
+from compbio_grader.composition import BASES, BaseComposition, genome_composition
+
+
+def _dna(rng, n, alphabet="ACGT"):
+    return "".join(rng.choice(alphabet) for _ in range(n))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_counts_match_slices(seed):
+    rng = random.Random(seed)
+    genome = _dna(rng, rng.randint(0, 400), "ACGTNacgt")
+    comp = BaseComposition(genome)
+    upper = genome.upper()
+    for _ in range(20):
+        start = rng.randint(0, len(genome))
+        end = rng.randint(start, len(genome))
+        for b in BASES:
+            assert comp.count(b, start, end) == upper[start:end].count(b)
+    assert comp.count("g") == upper.count("G")
+    assert comp.frequency("A", 3, 3) == 0.0
+
+
+def test_bad_queries_rejected():
+    comp = BaseComposition("ACGT")
+    with pytest.raises(IndexError):
+        comp.count("A", 2, 5)
+    with pytest.raises(ValueError):
+        comp.count("N")
+    with pytest.raises(ValueError):
+        comp.window_counts("A", 0)
+
+
+def test_last_window_is_shorter():
+    comp = BaseComposition("CCCCC" "CCAAA" "CA")
+    assert comp.window_counts("C", 5) == [5, 2, 1]
+    assert comp.window_frequencies("C", 5) == [100.0, 40.0, 50.0]
+    assert comp.window_frequencies("C", 5, percent=False) == [1.0, 0.4, 0.5]
+    assert comp.window_differences("G", "C", 5) == [-100.0, -40.0, -50.0]
+
+
+def test_half_strands_wrap_around():
+    genome = "GGGG" "AAAA" "CCCC" "TTTT"
+    comp = BaseComposition(genome)
+    fwd, rev = comp.half_strands(ori=12)            # ter defaults to 4: TTTTGGGG vs AAAACCCC
+    assert fwd == {"A": 0.0, "C": 0.0, "G": 0.5, "T": 0.5}
+    assert rev == {"A": 0.5, "C": 0.5, "G": 0.0, "T": 0.0}
+    assert comp.circular_count("G", 12, 4) == 4
+    fwd, rev = comp.half_strands(ori=0, ter=0)      # empty ori -> ter, so ter -> ori is the whole genome
+    assert fwd == {b: 0.0 for b in BASES}
+    assert rev == {b: 0.25 for b in BASES}
+
+
+@pytest.fixture()
+def genome(tmp_path):
+    path = tmp_path / "Composition.txt"
+    path.write_text(">test\n" + "GGGGGCCCCC" * 3 + "GGCC\n")   # windows of 10: 50/50, plus a last one of 4
+    return str(path)
+
+
+def test_checks_accept_percentages_and_are_ungraded(genome):
+    assert check_cytosine_frequency([50, 50, 50, 50], genome=genome, window=10) == (True, "")
+    assert check_frequency_difference("0 0 0 0", genome=genome, window=10) == (True, "")
+    passed, letter = check_cytosine_frequency([50, 50, 50, 50], genome=genome, window=10, award_letter=True)
+    assert passed and letter
+
+
+def test_fractions_get_the_percent_hint(genome, capsys):
+    assert check_cytosine_frequency([0.5, 0.5, 0.5, 0.5], genome=genome, window=10) == (False, "")
+    assert "percentages, not fractions" in capsys.readouterr().out
+
+
+def test_wrong_window_count_reported(genome, capsys):
+    assert check_cytosine_frequency([50, 50, 50], genome=genome, window=10) == (False, "")
+    assert "Expected 4 windows" in capsys.readouterr().out
+
+
+def test_edited_genome_is_rebuilt(genome):
+    assert genome_composition(genome).count("C") == 17
+    st = os.stat(genome)
+    with open(genome, "w") as f:
+        f.write("AAAAAAAAAC\n")
+    os.utime(genome, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert genome_composition(genome).count("C") == 1
+    assert check_cytosine_frequency([10], genome=genome, window=10) == (True, "")
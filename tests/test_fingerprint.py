@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+from array import array
+from functools import partial
+
+from compbio_grader import checks, checks2
+from compbio_grader.fingerprint import (answer_fingerprint, exercise_fingerprint, function_fingerprint,
+                                        source_fingerprint)
+
+_CHECKS = ("check_patterncount", "check_frequentwords", "check_skew", "check_neighbors")
+
+
+def test_answers_share_a_fingerprint_across_forms():
+    fp = answer_fingerprint([1, 2, 3])
+    assert fp == answer_fingerprint((1, 2, 3)) == answer_fingerprint(array("q", [1, 2, 3]))
+    assert fp == answer_fingerprint(" 1  2\n3 ") == answer_fingerprint(range(1, 4))
+    assert answer_fingerprint([1.0, 2, 3]) != fp
+    assert answer_fingerprint(iter([1, 2, 3])) is None
+
+
+def test_function_fingerprint_ignores_spelling_but_not_behavior():
+    def count_a(text):
+        return text.count("A")
+
+    def count_a_renamed(dna):
+        # different comment and variable name
+        return dna.count("A")
+
+    def count_c(text):
+        return text.count("C")
+
+    assert function_fingerprint(count_a) == function_fingerprint(count_a_renamed)
+    assert function_fingerprint(count_a) != function_fingerprint(count_c)
+    assert function_fingerprint(partial(count_a)) != function_fingerprint(count_a)
+    assert function_fingerprint(len) is None
+
+
+def test_source_fingerprint_ignores_comments_and_layout():
+    assert source_fingerprint("x = 1\n") == source_fingerprint("# note\n\nx = 1  # one\n")
+    assert source_fingerprint("x = 1\n") != source_fingerprint("x = 2\n")
+
+
+def test_exercise_fingerprint_ignores_the_letter_permutation(monkeypatch):
+    before = [exercise_fingerprint(getattr(checks, c, None) or getattr(checks2, c)) for c in _CHECKS]
+    monkeypatch.setattr(checks, "_SHUFFLED", checks._SHUFFLED[::-1])
+    monkeypatch.setattr(checks2, "_SHUFFLED", checks2._SHUFFLED[::-1])
+    after = [exercise_fingerprint(getattr(checks, c, None) or getattr(checks2, c)) for c in _CHECKS]
+    assert None not in before and before == after
+
+
+def test_exercise_fingerprint_follows_hidden_cases_and_arguments(monkeypatch):
+    fp = exercise_fingerprint(checks.check_patterncount)
+    assert exercise_fingerprint(checks2.check_minimumskew, (), {"genome": "E_coli"}) != \
+        exercise_fingerprint(checks2.check_minimumskew, (), {"genome": "Vibrio_cholerae"})
+    monkeypatch.setattr(checks, "_HIDDEN_TESTS", checks._HIDDEN_TESTS[:-1])
+    assert exercise_fingerprint(checks.check_patterncount) != fp
+
+
+def test_exercise_fingerprint_is_stable_across_processes():
+    script = ("import compbio_grader as c; from compbio_grader.fingerprint import exercise_fingerprint as f; "
+              f"print(*[f(getattr(c, n)) for n in {_CHECKS!r}], c.checks.shuffled_word())")
+    env = {k: v for k, v in os.environ.items() if k != "COMPBIO_GRADER_SEED"}
+    runs = [subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True,
+                           cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout.split()
+            for _ in range(4)]
+    assert len({tuple(r[:-1]) for r in runs}) == 1
+    assert len({r[-1] for r in runs}) > 1      # the letters themselves did get reshuffled
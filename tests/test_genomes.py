@@ -0,0 +1,48 @@
+import os
+import warnings
+
+import pytest
+
+from compbio_grader import artifacts, oracle
+from compbio_grader.genomes import read_genome, resolve_genome
+
+
+@pytest.fixture()
+def genome(tmp_path, monkeypatch):
+    path = tmp_path / "Edited.txt"
+    path.write_text(">header\nACGTACGTCTTGATCAT\nACGT\n")
+    monkeypatch.setenv("COMPBIO_GRADER_CACHE", str(tmp_path / "cache"))
+    monkeypatch.setenv("COMPBIO_GRADER_ARTIFACTS", str(tmp_path / "bundle.json"))
+    artifacts.prepare([str(path)], str(tmp_path / "bundle.json"), clump=(3, 10, 2), ori=(8, 3, 0))
+    yield path
+    artifacts.load_bundle.cache_clear()
+
+
+def _rewrite(path, text):
+    st = os.stat(path)
+    path.write_text(text)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_read_genome_strips_headers_and_follows_edits(genome):
+    assert read_genome(str(genome)) == "ACGTACGTCTTGATCATACGT"
+    _rewrite(genome, "acgt\n")
+    assert read_genome(str(genome)) == "ACGT"
+
+
+def test_bundle_used_while_genome_unchanged(genome):
+    entry = resolve_genome(str(genome))
+    got = entry.reference("pattern_positions", "CTTGATCAT", compute=lambda seq: pytest.fail("computed"))
+    assert got == [8]
+
+
+def test_edited_genome_is_recomputed(genome):
+    entry = resolve_genome(str(genome))
+    assert entry.reference("pattern_positions", "CTTGATCAT", compute=lambda seq: None) == [8]
+    _rewrite(genome, "CTTGATCATACGTACGTACGT\n")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        got = entry.reference("pattern_positions", "CTTGATCAT",
+                              compute=lambda seq: [i for i in range(len(seq)) if seq.startswith("CTTGATCAT", i)])
+    assert got == [0]
+    assert list(entry.skew()) == oracle.skew_values("CTTGATCATACGTACGTACGT")
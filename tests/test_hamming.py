@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from compbio_grader import oracle
+from compbio_grader.hamming import (approximate_count, approximate_positions, distance_matrix, hamming,
+                                    hamming_to_genome, motif_distance)
+from compbio_grader.kmercode import KmerFormatError
+
+
+def _dna(rng, n, alphabet="ACGT"):
+    return "".join(rng.choice(alphabet) for _ in range(n))
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_hamming_matches_naive(seed):
+    rng = random.Random(seed)
+    alphabet = rng.choice(["ACGT", "ACGTN", "ACGT0123", "acgtACGT"])
+    a, b = _dna(rng, rng.randint(0, 80), alphabet), _dna(rng, rng.randint(0, 80), alphabet)
+    assert hamming(a, b) == oracle.hamming(a, b)
+
+
+@pytest.mark.parametrize("a, b, expected", [("C", "1", 1), ("0", "A", 1), ("AC3", "AC3", 0), ("GGG", "GG2", 1),
+                                            ("", "", 0), ("A" * 40, "A" * 39 + "T", 1)])
+def test_hamming_on_other_alphabets(a, b, expected):
+    assert hamming(a, b) == expected
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_approximate_matches_oracle(seed):
+    rng = random.Random(seed)
+    text = _dna(rng, rng.randint(0, 300), rng.choice(["ACGT", "ACGTN"]))
+    pattern = _dna(rng, rng.randint(1, 12))
+    d = rng.randint(0, 4)
+    expected = oracle.approximate_pattern_matching(pattern, text, d)
+    assert approximate_positions(pattern, text, d) == expected
+    assert approximate_count(pattern, text, d) == len(expected)
+
+
+def test_approximate_on_non_ascii_text():
+    assert approximate_positions("AC", "ACéAC", 0) == [0, 3]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_hamming_to_genome_matches_oracle(seed):
+    rng = random.Random(seed)
+    text = _dna(rng, 200, rng.choice(["ACGT", "ACGTN"]))
+    pattern = _dna(rng, rng.choice([1, 8, 32, 40]))
+    assert list(hamming_to_genome(pattern, text)) == \
+        [oracle.hamming(pattern, text[i:i + len(pattern)]) for i in range(len(text) - len(pattern) + 1)]
+
+
+def test_distance_matrix_matches_oracle():
+    rng = random.Random(3)
+    patterns, kmers = [_dna(rng, 7) for _ in range(5)], [_dna(rng, 7) for _ in range(9)]
+    rows = distance_matrix(patterns, kmers)
+    assert [list(r) for r in rows] == [[oracle.hamming(p, q) for q in kmers] for p in patterns]
+    with pytest.raises(KmerFormatError):
+        distance_matrix(patterns, kmers + ["ACGTACN"])
+
+
+def test_motif_distance():
+    dna = ["TTACCTTAAC", "GATATCTGTC", "ACGGCGTTCG", "CCCTAAAGAG", "CGTCAGAGGT"]
+    assert motif_distance("AAA", dna) == 5
+    with pytest.raises(ValueError):
+        motif_distance("AAAAAAAAAAAA", dna)
+
+
+@pytest.mark.parametrize("pattern, text", [("0C", "ACGT"), ("00", "AAAA"), ("A1", "ACAC"), ("3T", "TTTT")])
+def test_digits_are_not_bases(pattern, text):
+    naive = [oracle.hamming(pattern, text[i:i + len(pattern)]) for i in range(len(text) - len(pattern) + 1)]
+    assert list(hamming_to_genome(pattern, text)) == naive
+    assert approximate_positions(pattern, text, 0) == oracle.approximate_pattern_matching(pattern, text, 0)
+    assert motif_distance(pattern, [text]) == min(naive) > 0
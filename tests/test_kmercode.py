@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from compbio_grader import checks, checks2
+from compbio_grader.kmercode import (KmerFormatError, decode_kmer, encode_kmer, encode_kmer_array, encode_text,
+                                     kmer_multisets_equal)
+
+
+def _dna(rng, n, alphabet="ACGT"):
+    return "".join(rng.choice(alphabet) for _ in range(n))
+
+
+def _digits_for_a(kmers):
+    return [p.replace("A", "0") for p in kmers]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_round_trip_and_order(seed):
+    rng = random.Random(seed)
+    k = rng.randint(1, 32)
+    kmers = [_dna(rng, k) for _ in range(20)]
+    codes = [encode_kmer(p) for p in kmers]
+    assert [decode_kmer(c, k) for c in codes] == kmers
+    assert sorted(codes) == [encode_kmer(p) for p in sorted(kmers)]
+    assert list(encode_kmer_array(kmers, k)) == codes
+
+
+@pytest.mark.parametrize("bad", ["0TGC", "A1", "3", "acgt", "ACGN", "AC G", "Aé"])
+def test_encode_rejects_anything_but_acgt(bad):
+    with pytest.raises(ValueError):
+        encode_kmer(bad)
+    with pytest.raises(KmerFormatError) as e:
+        encode_kmer_array(["A" * len(bad), bad], len(bad))
+    assert e.value.index == 1 and e.value.kind == "alphabet"
+
+
+def test_encode_text():
+    text = _dna(random.Random(3), 100)
+    assert list(encode_text(text, 5)) == [encode_kmer(text[i:i + 5]) for i in range(96)]
+    with pytest.raises(ValueError):
+        encode_text("AC0T", 2)
+
+
+def test_multisets_with_digits_are_not_equal():
+    assert kmer_multisets_equal(["ACG", "TTA"], ["TTA", "ACG"], 3)
+    assert not kmer_multisets_equal(["ACG", "TTA"], ["0CG", "TT0"], 3)
+    assert not kmer_multisets_equal(["ACG"], ["ACG", "ACG"], 3)
+
+
+def test_answers_with_digits_for_bases_fail():
+    assert checks.check_frequentwords(lambda dna, k: checks._ref_frequent_words(dna, k))[0]
+    assert not checks.check_frequentwords(lambda dna, k: _digits_for_a(checks._ref_frequent_words(dna, k)))[0]
+    assert checks2.check_frequentwordsapproximate(checks2._ref_frequent_words_approx)[0]
+    assert not checks2.check_frequentwordsapproximate(
+        lambda text, k, d: _digits_for_a(checks2._ref_frequent_words_approx(text, k, d)))[0]
+    assert checks2.check_frequentwords_approx_with_rc(checks2._ref_frequent_words_with_rc)[0]
+    assert not checks2.check_frequentwords_approx_with_rc(
+        lambda text, k, d: _digits_for_a(checks2._ref_frequent_words_with_rc(text, k, d)))[0]
@@ -0,0 +1,121 @@
+import sys
+import threading
+
+import pytest
+
+from compbio_grader import genomes
+from compbio_grader.capture import ThreadStdout, thread_sink
+from compbio_grader.fingerprint import function_fingerprint
+from compbio_grader.memo import clear_memo, session_memo
+
+
+class Calls:
+    n = 0
+
+
+class Opaque:
+    pass
+
+
+_OPAQUE = Opaque()
+
+
+@session_memo
+def check_double(fn):
+    Calls.n += 1
+    ok = fn(2) == 4
+    print("✅ doubled" if ok else "❌ not doubled")
+    return ok, "X" if ok else ""
+
+
+def double(x):
+    return 2 * x
+
+def double_by_adding(x):
+    return x + x
+
+def double_with_opaque_global(x):
+    return 2 * x if _OPAQUE else 0
+
+
+@pytest.fixture(autouse=True)
+def fresh_memo(monkeypatch):
+    monkeypatch.delenv("COMPBIO_GRADER_MEMO", raising=False)
+    clear_memo()
+    Calls.n = 0
+    yield
+    clear_memo()
+
+
+def test_repeat_is_replayed(capsys):
+    assert check_double(double) == (True, "X")
+    assert check_double(double) == (True, "X")
+    assert Calls.n == 1
+    assert capsys.readouterr().out == "✅ doubled\n" * 2
+
+
+def test_changed_function_is_rerun():
+    check_double(double)
+    check_double(double_by_adding)
+    assert Calls.n == 2
+
+
+def test_default_repr_global_is_never_memoized():
+    assert function_fingerprint(double_with_opaque_global) is not None
+    assert function_fingerprint(double_with_opaque_global, strict=True) is None
+    check_double(double_with_opaque_global)
+    check_double(double_with_opaque_global)
+    assert Calls.n == 2
+
+
+def test_reference_data_change_is_rerun(monkeypatch):
+    check_double(double)
+    monkeypatch.setattr(genomes, "reference_version", lambda extra=(): "other")
+    check_double(double)
+    assert Calls.n == 2
+
+
+def test_disabled_by_env(monkeypatch):
+    monkeypatch.setenv("COMPBIO_GRADER_MEMO", "0")
+    check_double(double)
+    check_double(double)
+    assert Calls.n == 2
+
+
+def test_stdout_is_restored_after_a_check():
+    before = sys.stdout
+    check_double(double)
+    assert sys.stdout is before and not isinstance(sys.stdout, ThreadStdout)
+
+
+def test_threads_print_to_their_own_sinks(capsys):
+    outputs = {}
+    barrier = threading.Barrier(2)
+
+    def run(name):
+        got = []
+        with thread_sink(got.append):
+            barrier.wait()
+            for i in range(50):
+                print(name, i)
+            barrier.wait()
+        outputs[name] = "".join(got)
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in ("a", "b")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for name in ("a", "b"):
+        assert outputs[name] == "".join(f"{name} {i}\n" for i in range(50))
+    assert capsys.readouterr().out == ""
+    assert not isinstance(sys.stdout, ThreadStdout)
+
+
+def test_nested_sinks_pass_text_on():
+    outer, inner = [], []
+    with thread_sink(outer.append):
+        with thread_sink(inner.append) as downstream:
+            print("hi")
+            downstream("passed on\n")
+    assert inner == ["hi", "\n"] and outer == ["passed on\n"]
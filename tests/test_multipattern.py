@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from compbio_grader import check_genome_multiscan, oracle
+from compbio_grader.multipattern import (Match, PatternAutomaton, find_all, neighborhood,
+                                         with_reverse_complements)
+
+
+def _dna(rng, n, alphabet="ACGT"):
+    return "".join(rng.choice(alphabet) for _ in range(n))
+
+
+def _naive_find_all(text, patterns):
+    return {p: oracle.pattern_matching(text, p) for p in dict.fromkeys(patterns)}
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_automaton_matches_naive_scans(seed):
+    rng = random.Random(seed)
+    text = _dna(rng, rng.randint(0, 400), rng.choice(["ACGT", "AC", "ACGTN"]))
+    patterns = [_dna(rng, rng.randint(1, 6), rng.choice(["ACGT", "AC"])) for _ in range(rng.randint(1, 12))]
+    if text and rng.random() < 0.5:
+        i = rng.randrange(len(text))
+        patterns.append(text[i:i + rng.randint(1, 8)])           # one that surely occurs
+    auto = PatternAutomaton(patterns)
+    expected = _naive_find_all(text, patterns)
+    assert auto.find_all(text) == expected == find_all(text, patterns)
+    assert auto.count_all(text) == {p: len(v) for p, v in expected.items()}
+    assert auto.positions(text) == oracle.multi_pattern_matching(text, patterns)
+    matches = list(auto.iter_matches(text))
+    assert sorted(matches) == sorted(Match(i, p) for p, v in expected.items() for i in v)
+    ends = [m.start + len(m.pattern) for m in matches]
+    assert ends == sorted(ends)
+
+
+def test_nested_and_overlapping_patterns():
+    auto = PatternAutomaton(["A", "AA", "AAA", "CA", "ACA"])
+    assert auto.find_all("ACAAAC") == {"A": [0, 2, 3, 4], "AA": [2, 3], "AAA": [2], "CA": [1], "ACA": [0]}
+
+
+def test_matching_is_case_sensitive_and_skips_foreign_characters():
+    assert PatternAutomaton(["AC"]).find_all("acACxACéAC") == {"AC": [2, 5, 8]}
+
+
+def test_reverse_complements_and_neighborhood():
+    assert with_reverse_complements(["ATGATCAAG", "ACGT"]) == ["ATGATCAAG", "ACGT", "CTTGATCAT"]
+    assert neighborhood("ACG", 1) == sorted(oracle.neighbors("ACG", 1))
+    assert neighborhood("ACG", 0) == ["ACG"]
+
+
+@pytest.mark.parametrize("bad", [[], [""], ["AC", 3], ["Aé"]])
+def test_rejects_bad_patterns(bad):
+    with pytest.raises(ValueError):
+        PatternAutomaton(bad)
+
+
+@pytest.fixture()
+def genome(tmp_path, monkeypatch):
+    monkeypatch.setenv("COMPBIO_GRADER_CACHE", str(tmp_path / "cache"))
+    monkeypatch.setenv("COMPBIO_GRADER_ARTIFACTS", str(tmp_path / "bundle.json"))
+    path = tmp_path / "Scan.txt"
+    path.write_text(_dna(random.Random(1), 5000) + "ATGATCAAG" + _dna(random.Random(2), 3000))
+    return str(path)
+
+
+def test_check_genome_multiscan(genome, capsys):
+    pattern_set = with_reverse_complements(neighborhood("ATGATCAAG", 1))
+    expected = oracle.multi_pattern_matching(open(genome).read(), pattern_set)
+
+    def scan(text, patterns):
+        assert sorted(patterns) == sorted(pattern_set)
+        return " ".join(map(str, oracle.multi_pattern_matching(text, patterns)))
+
+    passed, letters = check_genome_multiscan(scan, genome=genome, d=1)
+    assert passed and len(letters) == 2 and 5000 in expected
+    assert check_genome_multiscan(lambda text, patterns: expected[1:], genome=genome, d=1) == (False, [])
+    assert check_genome_multiscan(scan, genome=genome, patterns=["AC", None]) == (False, [])
+    assert "Error during submission check" in capsys.readouterr().out
@@ -0,0 +1,68 @@
+import pytest
+
+from compbio_grader import check_frequencytable
+from compbio_grader.memo import clear_memo
+from compbio_grader.profiling import (StudentProfiler, batch_mode, measure_peak, memory_budget,
+                                      memory_tracking_enabled, reference_peak)
+
+
+def frequency_table(dna, k):
+    freq = {}
+    for i in range(len(dna) - k + 1):
+        freq[dna[i:i+k]] = freq.get(dna[i:i+k], 0) + 1
+    return freq
+
+
+@pytest.fixture(autouse=True)
+def no_env(monkeypatch):
+    monkeypatch.delenv("COMPBIO_GRADER_MEMORY", raising=False)
+    monkeypatch.setenv("COMPBIO_GRADER_PROFILE", "0")
+    clear_memo()
+
+
+def test_memory_tracking_is_opt_in(monkeypatch):
+    assert not memory_tracking_enabled()
+    assert memory_tracking_enabled(True)
+    with batch_mode():
+        assert not memory_tracking_enabled(True)
+    monkeypatch.setenv("COMPBIO_GRADER_MEMORY", "1")
+    with batch_mode():
+        assert memory_tracking_enabled()
+    monkeypatch.setenv("COMPBIO_GRADER_MEMORY", "0")
+    assert not memory_tracking_enabled(True)
+
+
+def test_check_reports_peak_only_when_asked():
+    assert check_frequencytable(frequency_table).peak_memory is None
+    res = check_frequencytable(frequency_table, memory=True)
+    assert res.passed and res.peak_memory > 0
+
+
+def test_measure_peak():
+    value, peak = measure_peak(lambda n: len(bytearray(n)), 1 << 20)
+    assert value == 1 << 20 and peak >= 1 << 20
+
+
+def test_reference_peak_is_measured_once():
+    calls = []
+
+    def ref(n):
+        calls.append(n)
+        return bytearray(n)
+
+    assert reference_peak(ref, 1 << 16) == reference_peak(ref, 1 << 16)
+    reference_peak(ref, 1 << 17)
+    assert calls == [1 << 16, 1 << 17]
+
+
+def test_memory_budget():
+    assert memory_budget(None, 4.0) is None
+    assert memory_budget(100 << 20, 4.0) == 400 << 20
+    assert memory_budget(1 << 20, 4.0) > 4 << 20        # never below the fixed slack
+
+
+def test_over_budget_fails_a_passing_check(capsys):
+    prof = StudentProfiler(False, memory=True, memory_budget=1 << 10)
+    prof.call(lambda: bytearray(1 << 20))
+    assert prof.result(True, "X") == (False, "")
+    assert "budget" in capsys.readouterr().out
@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from compbio_grader import oracle
+from compbio_grader.kmercode import encode_kmer
+from compbio_grader.revcomp import (reverse_complement, reverse_complement_code, reverse_complement_codes,
+                                    reverse_complement_inplace, reverse_complement_many)
+
+
+def _dna(rng, n, alphabet="ACGT"):
+    return "".join(rng.choice(alphabet) for _ in range(n))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_reverse_complement_matches_oracle(seed):
+    seq = _dna(random.Random(seed), random.randint(0, 200), "ACGTacgtN")
+    assert reverse_complement(seq) == oracle.reverse_complement(seq)
+    assert reverse_complement(seq.encode()) == oracle.reverse_complement(seq).encode()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_many_matches_one_at_a_time(seed):
+    rng = random.Random(seed)
+    kmers = [_dna(rng, rng.randint(0, 12), "ACGTacgtN") for _ in range(rng.randint(0, 50))]
+    assert reverse_complement_many(kmers) == [oracle.reverse_complement(p) for p in kmers]
+
+
+def test_many_keeps_empty_and_non_ascii_entries():
+    assert reverse_complement_many(["", "AC", ""]) == ["", "GT", ""]
+    assert reverse_complement_many(["AC", "Aé"]) == [reverse_complement("AC"), reverse_complement("Aé")]
+
+
+def test_inplace_matches_oracle():
+    seq = _dna(random.Random(7), 5000)
+    assert reverse_complement_inplace(bytearray(seq.encode())) == oracle.reverse_complement(seq).encode()
+
+
+@pytest.mark.parametrize("k", [1, 2, 9, 31, 32])
+def test_codes_match_strings(k):
+    rng = random.Random(k)
+    kmers = [_dna(rng, k) for _ in range(30)]
+    codes = [encode_kmer(p) for p in kmers]
+    expected = [encode_kmer(oracle.reverse_complement(p)) for p in kmers]
+    assert [reverse_complement_code(c, k) for c in codes] == expected
+    assert list(reverse_complement_codes(codes, k)) == expected
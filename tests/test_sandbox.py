@@ -0,0 +1,75 @@
+import pytest
+
+from compbio_grader.sandbox import SandboxPool
+
+GOOD = '''
+def PatternCount(Text, Pattern):
+    k = len(Pattern)
+    return sum(Text[i:i+k] == Pattern for i in range(len(Text) - k + 1))
+'''
+EXITS = '''
+import sys
+def PatternCount(Text, Pattern):
+    sys.exit(3)
+'''
+LOOPS = '''
+def PatternCount(Text, Pattern):
+    while True:
+        pass
+'''
+PID = '''
+import os
+def PatternCount(Text, Pattern):
+    print("pid", os.getpid())
+    return -1
+'''
+
+
+def _pid(pool):
+    return pool.run("check_patterncount", PID, "PatternCount").output.split("pid ")[1].split()[0]
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with SandboxPool(size=1, max_jobs=100, timeout=2.0) as p:
+        yield p
+
+
+def test_runs_check(pool):
+    res = pool.run("check_patterncount", GOOD, "PatternCount")
+    assert res.passed and res.error == ""
+
+
+def test_missing_name_is_an_error(pool):
+    res = pool.run("check_patterncount", GOOD, "Nope")
+    assert not res.passed and res.error.startswith("NameError")
+
+
+def test_sys_exit_does_not_kill_worker(pool):
+    before = _pid(pool)
+    res = pool.run("check_patterncount", EXITS, "PatternCount")
+    assert not res.passed
+    assert res.error.startswith("SystemExit")
+    assert _pid(pool) == before
+
+
+def test_timeout_replaces_worker(pool):
+    before = _pid(pool)
+    res = pool.run("check_patterncount", LOOPS, "PatternCount")
+    assert not res.passed and "Time limit" in res.error
+    assert _pid(pool) != before
+    assert pool.run("check_patterncount", GOOD, "PatternCount").passed
+
+
+def test_recycled_after_max_jobs():
+    with SandboxPool(size=1, max_jobs=2) as p:
+        first = _pid(p)
+        assert _pid(p) == first
+        assert _pid(p) != first
+
+
+def test_run_many_keeps_order():
+    with SandboxPool(size=2) as p:
+        results = p.run_many([("check_patterncount", GOOD, "PatternCount"),
+                              ("check_patterncount", GOOD, "Nope")] * 3)
+    assert [r.passed for r in results] == [True, False] * 3
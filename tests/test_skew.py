@@ -0,0 +1,109 @@
+import os
+import random
+
+import pytest
+
+from compbio_grader import oracle
+from compbio_grader.skew import (SkewReference, compare_skew, decimate_skew, min_skew_positions, reference_skew,
+                                 skew_array, skew_digest)
+
+
+def _dna(rng, n, alphabet="ACGT"):
+    return "".join(rng.choice(alphabet) for _ in range(n))
+
+
+def _reference(genome):
+    vals = skew_array(genome)
+    return SkewReference(vals, skew_digest(vals), skew_digest(vals[1:]))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_skew_array_matches_oracle(seed):
+    genome = _dna(random.Random(seed), random.randint(0, 500), "ACGTN")
+    assert list(skew_array(genome)) == oracle.skew_values(genome)
+
+
+def test_min_skew_positions():
+    vals = oracle.skew_values("TAAAGACTGCCGAGAGGCCAACACGAGTGCTAGAACGAGGGGCGTAAACGCGGGTCCGAT")
+    m = min(vals)
+    assert min_skew_positions(skew_array("TAAAGACTGCCGAGAGGCCAACACGAGTGCTAGAACGAGGGGCGTAAACGCGGGTCCGAT")) == \
+        [i for i, v in enumerate(vals) if v == m]
+
+
+def test_answer_forms_accepted():
+    genome = _dna(random.Random(1), 300)
+    ref = _reference(genome)
+    vals = oracle.skew_values(genome)
+    assert compare_skew(ref, vals) is None
+    assert compare_skew(ref, vals[1:]) is None
+    assert compare_skew(ref, " ".join(map(str, vals))) is None
+    assert compare_skew(ref, iter(vals)) is None
+    assert compare_skew(ref, skew_digest(vals)) is None
+    assert compare_skew(ref, skew_digest(vals).upper()) is None
+    assert compare_skew(ref, {"sha256": skew_digest(vals[1:])}) is None
+    runs = []
+    for v in vals:
+        if runs and runs[-1][0] == v:
+            runs[-1][1] += 1
+        else:
+            runs.append([v, 1])
+    assert compare_skew(ref, {"rle": runs}) is None
+    assert compare_skew(ref, {"step": 7, "values": vals[3::7], "offset": 3}) is None
+
+
+def test_wrong_answers_rejected():
+    genome = _dna(random.Random(2), 300)
+    ref = _reference(genome)
+    vals = oracle.skew_values(genome)
+    bad = list(vals)
+    bad[150] += 1
+    mismatch = compare_skew(ref, bad)
+    assert mismatch is not None and mismatch.index == 150
+    assert compare_skew(ref, vals[:-1][1:]) is not None
+    assert compare_skew(ref, "0" * 64) is not None
+    assert compare_skew(ref, {"step": 7, "values": vals[0::7][:-1]}) is not None
+
+
+def test_64_character_answer_is_not_a_digest():
+    rng = random.Random(4)
+    while True:
+        genome = _dna(rng, 25, "GC")
+        answer = " ".join(map(str, oracle.skew_values(genome)[1:]))
+        if len(answer) == 64:
+            break
+    assert compare_skew(_reference(genome), answer) is None
+
+
+def test_decimation_keeps_extremes():
+    vals = oracle.skew_values(_dna(random.Random(3), 20000))
+    series = decimate_skew(vals, width=100)
+    assert min(series.values) == min(vals) and max(series.values) == max(vals)
+    assert series.positions[0] == 0 and series.positions[-1] == len(vals) - 1
+    assert all(vals[p] == v for p, v in zip(series.positions, series.values))
+
+
+def test_skew_plot_data_takes_a_sequence_or_a_genome(tmp_path):
+    from compbio_grader import skew_plot_data
+
+    genome = _dna(random.Random(5), 3000)
+    path = tmp_path / "tiny.txt"
+    path.write_text(genome)
+    by_sequence = skew_plot_data(sequence=genome.lower(), width=100)
+    assert by_sequence == skew_plot_data(str(path), width=100)
+    assert by_sequence[0][0] == 0 and by_sequence[1][0] == 0
+    assert skew_plot_data(sequence="GGG", width=100) == ([0, 1, 2, 3], [0, 1, 2, 3])
+    with pytest.raises(FileNotFoundError):
+        skew_plot_data("GGG")          # not a registered genome or a file
+
+
+def test_reference_skew_follows_genome_edits(tmp_path, monkeypatch):
+    monkeypatch.setenv("COMPBIO_GRADER_CACHE", str(tmp_path / "cache"))
+    path = tmp_path / "Edited.txt"
+    path.write_text("GGGC\n")
+    assert list(reference_skew(str(path)).values) == [0, 1, 2, 3, 2]
+    st = os.stat(path)
+    path.write_text("CCAT\n")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    ref = reference_skew(str(path))
+    assert list(ref.values) == [0, -1, -2, -2, -2]
+    assert ref.digest == skew_digest([0, -1, -2, -2, -2])
@@ -0,0 +1,128 @@
+import sqlite3
+import time
+
+import pytest
+
+from compbio_grader import workqueue
+from compbio_grader.workqueue import WorkQueue, run_worker
+
+GOOD = '''
+def PatternCount(Text, Pattern):
+    k = len(Pattern)
+    return sum(Text[i:i+k] == Pattern for i in range(len(Text) - k + 1))
+'''
+WRONG = '''
+def PatternCount(Text, Pattern):
+    return Text.count(Pattern)
+'''
+
+
+@pytest.fixture
+def queue(tmp_path):
+    with WorkQueue(str(tmp_path / "q.db")) as q:
+        yield q
+
+
+def _result(passed=True):
+    return {"passed": passed, "letters": "X" if passed else "", "output": "", "error": ""}
+
+
+def test_lease_is_exclusive_until_it_expires(queue):
+    job_id = queue.enqueue("alice", "check_patterncount", GOOD, "PatternCount")
+    job = queue.claim("w1", lease=0.05)
+    assert job.id == job_id and job.attempts == 1
+    assert queue.claim("w2") is None
+    time.sleep(0.1)
+    again = queue.claim("w2")
+    assert again.id == job_id and again.attempts == 2
+    assert not queue.complete(job, "w1", _result())      # w1 lost its lease
+    assert queue.complete(again, "w2", _result(), exercise="fp")
+    assert queue.counts() == {"done": 1}
+
+
+def test_heartbeat_keeps_the_lease(queue):
+    queue.enqueue("alice", "check_patterncount", GOOD, "PatternCount")
+    job = queue.claim("w1", lease=0.1)
+    time.sleep(0.06)
+    queue.heartbeat([job.id], "w1", lease=0.1)
+    time.sleep(0.06)
+    assert queue.claim("w2") is None
+
+
+def test_expired_leases_fail_after_max_attempts(queue):
+    queue.enqueue("alice", "check_patterncount", GOOD, "PatternCount")
+    for _ in range(2):
+        assert queue.claim("w", lease=0.0, max_attempts=2) is not None
+        time.sleep(0.01)
+    assert queue.claim("w", max_attempts=2) is None
+    assert queue.counts() == {"failed": 1}
+
+
+def test_cached_result_needs_the_same_exercise(queue):
+    queue.enqueue("alice", "check_patterncount", GOOD, "PatternCount")
+    twin = queue.enqueue("bob", "check_patterncount", "# same code\n" + GOOD, "PatternCount")
+    job = queue.claim("w")
+    queue.complete(job, "w", _result(), exercise="fp1")
+    key = queue.claim("w").job_key
+    assert queue.claim("w") is None and twin
+    assert queue.cached_result(key, "fp1") == _result()
+    assert queue.cached_result(key, "fp2") is None
+    assert queue.cached_result(key, None) is None
+
+
+def test_requeue_stale(queue):
+    queue.enqueue("alice", "check_patterncount", GOOD, "PatternCount")
+    queue.enqueue("bob", "check_unknown", GOOD, "PatternCount")
+    for _ in range(2):
+        job = queue.claim("w")
+        queue.complete(job, "w", _result(), exercise="outdated")
+    assert queue.requeue_stale() == 1
+    assert queue.counts() == {"done": 1, "pending": 1}
+
+
+def test_retry_backs_off_and_gives_up(monkeypatch, caplog):
+    monkeypatch.setattr(workqueue, "_RETRY_DELAY", 0.0)
+    failures = iter([sqlite3.OperationalError("database is locked")] * 2)
+
+    def flaky():
+        for e in failures:
+            raise e
+        return "ok"
+
+    assert workqueue._retry("claim", flaky) == "ok"
+    assert sum("database is locked" in r.getMessage() for r in caplog.records) == 2
+
+    def broken():
+        raise sqlite3.OperationalError("disk I/O error")
+
+    with pytest.raises(sqlite3.OperationalError):
+        workqueue._retry("claim", broken)
+
+
+def test_failed_commit_is_rolled_back(queue, monkeypatch):
+    def fail_commit(cur):
+        cur.execute("INSERT INTO jobs (student, check_name, source, name, args, kwargs, job_key, updated) "
+                    "VALUES ('x', 'c', '', 'n', '[]', '{}', 'k', 0)")
+        raise sqlite3.OperationalError("database is locked")
+
+    with pytest.raises(sqlite3.OperationalError):
+        queue._tx(fail_commit)
+    assert not queue._db.in_transaction
+    queue.enqueue("alice", "check_patterncount", GOOD, "PatternCount")
+    assert queue.counts() == {"pending": 1}
+
+
+def test_worker_grades_each_distinct_submission_once(tmp_path):
+    path = str(tmp_path / "q.db")
+    with WorkQueue(path) as q:
+        q.enqueue("alice", "check_patterncount", GOOD, "PatternCount")
+        q.enqueue("bob", "check_patterncount", "\n\n" + GOOD, "PatternCount")
+        q.enqueue("carol", "check_patterncount", WRONG, "PatternCount")
+    assert run_worker(path, processes=1, exit_when_empty=True, poll=0.1) == 2   # bob reuses alice's verdict
+    with WorkQueue(path) as q:
+        assert q.counts() == {"done": 3}
+        report = q.report("check_patterncount")
+    assert report.results["alice"].passed and report.results["bob"].passed
+    assert not report.results["carol"].passed
+    assert report.results["bob"].reused and report.evaluated == 2
+    assert report.clusters == [["alice", "bob"]]